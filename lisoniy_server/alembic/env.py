@@ -20,7 +20,7 @@ from app.db.base import Base
 
 # Import all models to ensure they're registered
 from app.models.user import User, RefreshToken
-from app.models.terminology import Category, Term, Definition, TermAuditLog
+from app.models.terminology import Category, Term, DeletedTerm, Definition, TermAuditLog
 from app.models.post import Post
 from app.models.comment import Comment
 from app.models.user_meta import UserMeta
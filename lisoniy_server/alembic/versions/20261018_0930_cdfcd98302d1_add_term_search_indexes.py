@@ -0,0 +1,50 @@
+"""Add lower(keyword) btree and trigram indexes for term search
+
+Revision ID: cdfcd98302d1
+Revises: 71a81d59d9fb
+Create Date: 2026-10-18 09:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cdfcd98302d1'
+down_revision: Union[str, None] = '71a81d59d9fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Built concurrently so large terms tables stay writable during the upgrade.
+    # Not partial: ANALYZE only keeps expression statistics for full indexes,
+    # and without them the planner misestimates matches and scans the table.
+    with op.get_context().autocommit_block():
+        # Exact and prefix matches: lower(keyword) = q / LIKE 'q%'
+        op.create_index(
+            'ix_terms_keyword_lower',
+            'terms',
+            [sa.text('lower(keyword) text_pattern_ops')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Substring (LIKE '%q%') and similarity (%) matches
+        op.create_index(
+            'ix_terms_keyword_trgm',
+            'terms',
+            [sa.text('lower(keyword) gin_trgm_ops')],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_terms_keyword_trgm', table_name='terms', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_terms_keyword_lower', table_name='terms', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,71 @@
+"""Index normalized keywords so apostrophe variants search alike
+
+Revision ID: 4be2a7c19e30
+Revises: cdfcd98302d1
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4be2a7c19e30'
+down_revision: Union[str, None] = 'cdfcd98302d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Case-fold and map Uzbek apostrophe variants (U+2018, U+2019, U+02BB,
+    # U+02BC, backtick) to "'"; mirrors app.models.terminology
+    op.execute(
+        "CREATE OR REPLACE FUNCTION normalize_search_text(value text) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ "
+        "SELECT translate(lower(value), '\u2018\u2019\u02bb\u02bc`', '''''''''''') $$"
+    )
+
+    # Replace the lower(keyword) indexes with normalize_search_text(keyword) ones
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_terms_keyword_normalized',
+            'terms',
+            [sa.text('normalize_search_text(keyword) text_pattern_ops')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_terms_keyword_normalized_trgm',
+            'terms',
+            [sa.text('normalize_search_text(keyword) gin_trgm_ops')],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_terms_keyword_trgm', table_name='terms', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_terms_keyword_lower', table_name='terms', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_terms_keyword_lower',
+            'terms',
+            [sa.text('lower(keyword) text_pattern_ops')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_terms_keyword_trgm',
+            'terms',
+            [sa.text('lower(keyword) gin_trgm_ops')],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_terms_keyword_normalized_trgm', table_name='terms', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_terms_keyword_normalized', table_name='terms', postgresql_concurrently=True, if_exists=True)
+
+    op.execute("DROP FUNCTION IF EXISTS normalize_search_text(text)")
@@ -0,0 +1,35 @@
+"""Index terms by (updated_at, id) for delta sync
+
+Revision ID: 9a5161100601
+Revises: 4be2a7c19e30
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a5161100601'
+down_revision: Union[str, None] = '4be2a7c19e30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset cursor of GET /terms/changes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_terms_updated_at_id',
+            'terms',
+            ['updated_at', 'id'],
+            postgresql_include=['is_deleted'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_terms_updated_at_id', table_name='terms', postgresql_concurrently=True, if_exists=True)
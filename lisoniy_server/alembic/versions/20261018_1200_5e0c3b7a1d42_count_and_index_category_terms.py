@@ -0,0 +1,99 @@
+"""Count live terms per category and index them for keyset listings
+
+Revision ID: 5e0c3b7a1d42
+Revises: 9a5161100601
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0c3b7a1d42'
+down_revision: Union[str, None] = '9a5161100601'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'categories',
+        sa.Column('term_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    # Statement-level triggers keep term_count in step with every write to terms
+    op.execute("""
+        CREATE OR REPLACE FUNCTION count_category_terms() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE categories c SET term_count = c.term_count + d.n
+                FROM (SELECT category_id, count(*) AS n FROM new_terms WHERE NOT is_deleted GROUP BY category_id) d
+                WHERE c.id = d.category_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE categories c SET term_count = c.term_count - d.n
+                FROM (SELECT category_id, count(*) AS n FROM old_terms WHERE NOT is_deleted GROUP BY category_id) d
+                WHERE c.id = d.category_id;
+            ELSE
+                UPDATE categories c SET term_count = c.term_count + d.n
+                FROM (
+                    SELECT category_id, sum(n) AS n FROM (
+                        SELECT category_id, count(*) AS n FROM new_terms WHERE NOT is_deleted GROUP BY category_id
+                        UNION ALL
+                        SELECT category_id, -count(*) FROM old_terms WHERE NOT is_deleted GROUP BY category_id
+                    ) delta
+                    GROUP BY category_id
+                    HAVING sum(n) <> 0
+                ) d
+                WHERE c.id = d.category_id;
+            END IF;
+            RETURN NULL;
+        END $$
+    """)
+    op.execute("""
+        CREATE TRIGGER terms_count_insert AFTER INSERT ON terms
+        REFERENCING NEW TABLE AS new_terms
+        FOR EACH STATEMENT EXECUTE FUNCTION count_category_terms()
+    """)
+    op.execute("""
+        CREATE TRIGGER terms_count_update AFTER UPDATE ON terms
+        REFERENCING OLD TABLE AS old_terms NEW TABLE AS new_terms
+        FOR EACH STATEMENT EXECUTE FUNCTION count_category_terms()
+    """)
+    op.execute("""
+        CREATE TRIGGER terms_count_delete AFTER DELETE ON terms
+        REFERENCING OLD TABLE AS old_terms
+        FOR EACH STATEMENT EXECUTE FUNCTION count_category_terms()
+    """)
+
+    # Backfill with writes blocked, so no change slips between count and trigger
+    op.execute("LOCK TABLE terms IN SHARE MODE")
+    op.execute("""
+        UPDATE categories c SET term_count = d.n
+        FROM (SELECT category_id, count(*) AS n FROM terms WHERE NOT is_deleted GROUP BY category_id) d
+        WHERE c.id = d.category_id
+    """)
+
+    # Keyset pages of /categories/{slug}/terms
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_terms_category_live',
+            'terms',
+            ['category_id', 'created_at', 'id'],
+            postgresql_where=sa.text('NOT is_deleted'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_terms_category_live', table_name='terms', postgresql_concurrently=True, if_exists=True)
+
+    op.execute("DROP TRIGGER IF EXISTS terms_count_delete ON terms")
+    op.execute("DROP TRIGGER IF EXISTS terms_count_update ON terms")
+    op.execute("DROP TRIGGER IF EXISTS terms_count_insert ON terms")
+    op.execute("DROP FUNCTION IF EXISTS count_category_terms()")
+    op.drop_column('categories', 'term_count')
@@ -0,0 +1,104 @@
+"""Partition term_audit_logs by month
+
+Revision ID: b71f0e2c9a55
+Revises: 5e0c3b7a1d42
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71f0e2c9a55'
+down_revision: Union[str, None] = '5e0c3b7a1d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The existing rows are copied into a new partitioned table; writes to
+    # the audit log wait for this transaction
+    op.execute("ALTER TABLE term_audit_logs RENAME TO term_audit_logs_old")
+    op.execute("ALTER TABLE term_audit_logs_old RENAME CONSTRAINT term_audit_logs_pkey TO term_audit_logs_old_pkey")
+
+    # The partition key has to be part of the primary key
+    op.execute("""
+        CREATE TABLE term_audit_logs (
+            id UUID NOT NULL,
+            term_id UUID NOT NULL
+                CONSTRAINT term_audit_logs_term_id_fkey REFERENCES terms (id) ON DELETE CASCADE,
+            user_id INTEGER
+                CONSTRAINT term_audit_logs_user_id_fkey REFERENCES users (id) ON DELETE SET NULL,
+            action auditaction NOT NULL,
+            changes TEXT,
+            "timestamp" TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, "timestamp")
+        ) PARTITION BY RANGE ("timestamp")
+    """)
+    op.execute("CREATE TABLE term_audit_logs_default PARTITION OF term_audit_logs DEFAULT")
+
+    # One partition per month from the oldest row to two months ahead;
+    # AuditService.maintain_partitions keeps it going and applies retention
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', coalesce(min("timestamp"), now())),
+                    date_trunc('month', now()) + interval '2 months',
+                    interval '1 month'
+                )::date
+                FROM term_audit_logs_old
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF term_audit_logs FOR VALUES FROM (%L) TO (%L)',
+                    'term_audit_logs_p' || to_char(month, 'YYYYMM'),
+                    month,
+                    (month + interval '1 month')::date
+                );
+            END LOOP;
+        END $$
+    """)
+
+    op.execute("""
+        INSERT INTO term_audit_logs (id, term_id, user_id, action, changes, "timestamp")
+        SELECT id, term_id, user_id, action, changes, "timestamp" FROM term_audit_logs_old
+    """)
+    op.execute("DROP TABLE term_audit_logs_old")
+
+    # Keyset reads of a term's history and a user's activity
+    op.create_index('ix_term_audit_logs_term_id_timestamp', 'term_audit_logs', ['term_id', 'timestamp'])
+    op.create_index('ix_term_audit_logs_user_id_timestamp', 'term_audit_logs', ['user_id', 'timestamp'])
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE term_audit_logs_flat (
+            id UUID NOT NULL,
+            term_id UUID NOT NULL
+                CONSTRAINT term_audit_logs_term_id_fkey REFERENCES terms (id) ON DELETE CASCADE,
+            user_id INTEGER
+                CONSTRAINT term_audit_logs_user_id_fkey REFERENCES users (id) ON DELETE SET NULL,
+            action auditaction NOT NULL,
+            changes TEXT,
+            "timestamp" TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            CONSTRAINT term_audit_logs_flat_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("""
+        INSERT INTO term_audit_logs_flat (id, term_id, user_id, action, changes, "timestamp")
+        SELECT id, term_id, user_id, action, changes, "timestamp" FROM term_audit_logs
+    """)
+    # Dropping the partitioned table drops its partitions
+    op.execute("DROP TABLE term_audit_logs")
+    op.execute("ALTER TABLE term_audit_logs_flat RENAME TO term_audit_logs")
+    op.execute("ALTER TABLE term_audit_logs RENAME CONSTRAINT term_audit_logs_flat_pkey TO term_audit_logs_pkey")
+
+    op.create_index('ix_term_audit_logs_id', 'term_audit_logs', ['id'], unique=False)
+    op.create_index('ix_term_audit_logs_term_id', 'term_audit_logs', ['term_id'], unique=False)
+    op.create_index('ix_term_audit_logs_user_id', 'term_audit_logs', ['user_id'], unique=False)
+    op.create_index('ix_term_audit_logs_timestamp', 'term_audit_logs', ['timestamp'], unique=False)
@@ -0,0 +1,47 @@
+"""Keep entry counts and sizes on dataset_meta
+
+Revision ID: c3d8a41f6b27
+Revises: b71f0e2c9a55
+Create Date: 2026-10-18 14:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8a41f6b27'
+down_revision: Union[str, None] = 'b71f0e2c9a55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'dataset_meta',
+        sa.Column('entry_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    # Backfill counts and sizes (size_bytes was never maintained) with entry
+    # writes blocked; from here on the application keeps them in step. Meta
+    # rows used to be created lazily, so every dataset gets one here
+    op.execute("LOCK TABLE data_entries IN SHARE MODE")
+    op.execute("""
+        INSERT INTO dataset_meta (dataset_id, stars_count, downloads_count, views_count,
+            entry_count, size_bytes, created_at, updated_at)
+        SELECT ds.id, 0, 0, 0, coalesce(d.n, 0), coalesce(d.bytes, 0),
+            now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+        FROM datasets ds
+        LEFT JOIN (
+            SELECT dataset_id, count(*) AS n, sum(octet_length(content::text)) AS bytes
+            FROM data_entries GROUP BY dataset_id
+        ) d ON d.dataset_id = ds.id
+        ON CONFLICT (dataset_id) DO UPDATE
+        SET entry_count = excluded.entry_count, size_bytes = excluded.size_bytes
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('dataset_meta', 'entry_count')
@@ -0,0 +1,32 @@
+"""Version dataset content for cached downloads
+
+Revision ID: d5e9b2a7c4f1
+Revises: c3d8a41f6b27
+Create Date: 2026-10-18 15:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e9b2a7c4f1'
+down_revision: Union[str, None] = 'c3d8a41f6b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'dataset_meta',
+        sa.Column(
+            'content_version', sa.BigInteger(), server_default='0', nullable=False,
+            comment='Bumped by every entry write; versions download artifacts'
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('dataset_meta', 'content_version')
@@ -0,0 +1,35 @@
+"""Keep tombstones of terms deleted with their category
+
+Revision ID: e7f4c2a9b813
+Revises: d5e9b2a7c4f1
+Create Date: 2026-10-18 16:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f4c2a9b813'
+down_revision: Union[str, None] = 'd5e9b2a7c4f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deleted_terms',
+        sa.Column('term_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('keyword', sa.String(length=255), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('term_id')
+    )
+    op.create_index('ix_deleted_terms_deleted_at_term_id', 'deleted_terms', ['deleted_at', 'term_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_deleted_terms_deleted_at_term_id', table_name='deleted_terms')
+    op.drop_table('deleted_terms')
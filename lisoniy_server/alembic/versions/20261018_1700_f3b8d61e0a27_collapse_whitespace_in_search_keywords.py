@@ -0,0 +1,50 @@
+"""Collapse whitespace in normalized search keywords
+
+Revision ID: f3b8d61e0a27
+Revises: e7f4c2a9b813
+Create Date: 2026-10-18 17:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d61e0a27'
+down_revision: Union[str, None] = 'e7f4c2a9b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = ('ix_terms_keyword_normalized', 'ix_terms_keyword_normalized_trgm')
+
+
+def _reindex() -> None:
+    # The indexes hold values computed by the old function body (the
+    # trigram one only exists where pg_trgm is available)
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            if op.get_bind().scalar(sa.text("SELECT to_regclass(:index)"), {"index": index}) is not None:
+                op.execute(f"REINDEX INDEX CONCURRENTLY {index}")
+
+
+def upgrade() -> None:
+    # Also trim and collapse runs of whitespace, as the Python
+    # normalize_search_text applied to queries does
+    op.execute(
+        "CREATE OR REPLACE FUNCTION normalize_search_text(value text) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ "
+        "SELECT btrim(regexp_replace("
+        "translate(lower(value), '\u2018\u2019\u02bb\u02bc`', ''''''''''''), '\\s+', ' ', 'g')) $$"
+    )
+    _reindex()
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE OR REPLACE FUNCTION normalize_search_text(value text) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ "
+        "SELECT translate(lower(value), '\u2018\u2019\u02bb\u02bc`', '''''''''''') $$"
+    )
+    _reindex()
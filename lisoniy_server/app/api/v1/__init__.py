@@ -9,6 +9,7 @@ from app.api.v1 import (
     categories,
     terms,
     search,
+    snapshot,
     comments,
     posts,
     datasets,
@@ -17,6 +18,7 @@ from app.api.v1 import (
     seo,
     leaderboard
 )
+from app.schemas.terminology import SearchResponse
 
 api_router = APIRouter()
 
@@ -25,7 +27,17 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(terms.router, prefix="/terms", tags=["terms"])
-api_router.include_router(search.router, tags=["search"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+# Search used to be mounted at the root; keep GET /api/v1/?q= for existing clients
+api_router.add_api_route(
+    "/",
+    search.search_terms,
+    methods=["GET"],
+    response_model=SearchResponse,
+    tags=["search"],
+    include_in_schema=False,
+)
+api_router.include_router(snapshot.router, prefix="/snapshot", tags=["snapshot"])
 api_router.include_router(posts.router, prefix="/posts", tags=["posts"])
 api_router.include_router(comments.router, prefix="/comments", tags=["comments"])
 api_router.include_router(datasets.router, tags=["datasets"])
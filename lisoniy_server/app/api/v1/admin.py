@@ -4,10 +4,11 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, pool_monitor, replica_pool_monitor, replica_router
 from app.models.user import User
 from app.schemas.user import UserResponse, AdminUserUpdate
 from app.services.user_service import UserService
+from app.services.local_cache import local_cache
 from app.core.dependencies import get_current_admin_user
 
 router = APIRouter()
@@ -109,3 +110,37 @@ async def admin_delete_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+
+
+@router.get("/db/pool", response_model=dict)
+async def get_db_pool_stats(
+    current_admin: User = Depends(get_current_admin_user)
+) -> dict:
+    """
+    Get live database connection pool statistics (Admin only)
+    
+    Returns checked-out/overflow counts, checkout wait times and
+    connections held longer than DB_LEAK_THRESHOLD, plus read replica
+    routing state when a replica is configured.
+    
+    Requires admin role
+    """
+    stats = pool_monitor.stats()
+    stats["replica"] = replica_router.stats()
+    if replica_pool_monitor is not None:
+        stats["replica"]["pool"] = replica_pool_monitor.stats()
+    return stats
+
+
+@router.get("/cache", response_model=dict)
+async def get_cache_stats(
+    current_admin: User = Depends(get_current_admin_user)
+) -> dict:
+    """
+    Get in-process cache statistics for this worker (Admin only)
+    
+    Returns entry count, memory usage, hit/miss counters and evictions.
+    
+    Requires admin role
+    """
+    return local_cache.stats()
@@ -4,6 +4,7 @@ from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.schemas.auth import (
     RegisterRequest,
@@ -15,7 +16,7 @@ from app.schemas.auth import (
 from app.schemas.token import TokenResponse, RefreshTokenRequest, AccessTokenResponse
 from app.schemas.user import UserResponse
 from app.services.auth_service import AuthService
-from app.services.redis_manager import redis_manager
+from app.services.rate_limiter import rate_limiter
 from app.tasks.email_tasks import send_welcome_email
 
 router = APIRouter()
@@ -24,7 +25,6 @@ router = APIRouter()
 @router.post("/register", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: RegisterRequest,
-    request: Request,
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -37,16 +37,6 @@ async def register(
     
     Returns user info and sends verification email with OTP
     """
-    # Rate limiting by IP
-    client_ip = request.client.host
-    is_allowed = await redis_manager.check_rate_limit(f"register:{client_ip}")
-    
-    if not is_allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many registration attempts. Please try again later."
-        )
-    
     return await AuthService.register_user(db, user_data)
 
 
@@ -74,7 +64,6 @@ async def verify_email(
 @router.post("/resend-verification", response_model=Dict[str, Any])
 async def resend_verification(
     email_data: RequestPasswordResetRequest,  # Reuse the email-only schema
-    request: Request,
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -84,16 +73,6 @@ async def resend_verification(
     
     Sends new verification code if user exists and is not verified
     """
-    # Rate limiting
-    client_ip = request.client.host
-    is_allowed = await redis_manager.check_rate_limit(f"resend_verification:{client_ip}")
-    
-    if not is_allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many requests. Please try again later."
-        )
-    
     return await AuthService.resend_verification_otp(db, email_data.email)
 
 
@@ -111,13 +90,18 @@ async def login(
     
     Returns access and refresh tokens
     """
-    # Rate limiting by email
-    is_allowed = await redis_manager.check_rate_limit(f"login:{login_data.email}")
-    
-    if not is_allowed:
+    # Rate limiting by email (IP-keyed routes are limited by RateLimitMiddleware)
+    limit = await rate_limiter.hit(
+        f"login:{login_data.email.lower()}",
+        settings.RATE_LIMIT_REQUESTS,
+        settings.RATE_LIMIT_WINDOW,
+    )
+    
+    if not limit.allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many login attempts. Please try again later."
+            detail="Too many login attempts. Please try again later.",
+            headers=limit.headers(),
         )
     
     return await AuthService.login(db, login_data)
@@ -143,7 +127,6 @@ async def refresh_token(
 @router.post("/request-password-reset", response_model=Dict[str, str])
 async def request_password_reset(
     reset_data: RequestPasswordResetRequest,
-    request: Request,
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, str]:
     """
@@ -153,16 +136,6 @@ async def request_password_reset(
     
     Sends password reset email if user exists
     """
-    # Rate limiting
-    client_ip = request.client.host
-    is_allowed = await redis_manager.check_rate_limit(f"password_reset:{client_ip}")
-    
-    if not is_allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many password reset requests. Please try again later."
-        )
-    
     return await AuthService.request_password_reset(db, reset_data.email)
 
 
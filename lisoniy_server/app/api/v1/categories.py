@@ -1,13 +1,12 @@
 """Categories API endpoints"""
 
-import json
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db, replica_router
 from app.models.user import User
 from app.core.dependencies import get_current_active_user, get_current_admin_user
 from app.schemas.terminology import (
@@ -17,7 +16,9 @@ from app.schemas.terminology import (
     TermResponse,
 )
 from app.services.category_service import CategoryService
-from app.services.redis_manager import redis_manager
+from app.services.term_service import TermService
+from app.services.cache import cache
+from app.services.suggest_index import suggest_index
 
 
 router = APIRouter()
@@ -32,22 +33,7 @@ async def get_all_categories(
     
     Returns list of all categories ordered by name
     """
-    cache_key = "categories:all"
-    cached = await redis_manager.get_value(cache_key)
-    
-    if cached:
-        try:
-            return json.loads(cached)
-        except (json.JSONDecodeError, TypeError) as e:
-            # If cached data is corrupted, delete it and fetch fresh data
-            await redis_manager.delete_key(cache_key)
-    
-    categories = await CategoryService.get_all(db)
-    categories_response = [CategoryResponse.model_validate(cat) for cat in categories]
-    
-    await redis_manager.set_value(cache_key, categories_response, expire=7200)
-    
-    return categories_response
+    return await CategoryService.list_categories(db)
 
 
 @router.get("/{slug}", response_model=CategoryResponse)
@@ -74,48 +60,60 @@ async def get_category_terms(
     slug: str,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get terms in a category (public endpoint, cached)
     
-    Returns paginated list of terms in the specified category
+    Returns a page of terms, newest first. Pass **next_cursor** back as
+    **cursor** for the next page; **offset** still works but gets slower
+    the deeper it goes. **next_cursor** is null on the last page.
     """
-    cache_key = f"category:{slug}:terms:{offset}:{limit}"
-    cached = await redis_manager.get_value(cache_key)
-    
-    if cached:
-        try:
-            return json.loads(cached)
-        except (json.JSONDecodeError, TypeError) as e:
-            # If cached data is corrupted, delete it and fetch fresh data
-            await redis_manager.delete_key(cache_key)
-
-    category = await CategoryService.get_by_slug(db, slug)
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Category with slug '{slug}' not found"
-        )
-    
-    terms, total = await CategoryService.get_category_terms(
-        db=db,
-        category_id=category.id,
-        offset=offset,
-        limit=limit
+    async def load() -> dict:
+        # A replica read could cache rows older than the current generation
+        async with replica_router.primary_session(db) as session:
+            category = await CategoryService.get_by_slug(session, slug)
+            if not category:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Category with slug '{slug}' not found"
+                )
+        
+            try:
+                terms, next_cursor = await CategoryService.get_category_terms(
+                    db=session,
+                    category_id=category.id,
+                    offset=offset,
+                    limit=limit,
+                    cursor=cursor
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+        
+            total = await CategoryService.count_category_terms(session, category.id)
+        
+            return {
+                "category": CategoryResponse.model_validate(category),
+                "total": total,
+                "offset": 0 if cursor else offset,
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "terms": [TermResponse.model_validate(term) for term in terms]
+            }
+    
+    # Hot listing: serve stale for a minute while one request recomputes
+    page = f"cursor:{cursor}:{limit}" if cursor else f"{offset}:{limit}"
+    cache_key = await cache.versioned_key(f"category:{slug}:terms", page)
+    return await cache.get_or_set(
+        cache_key,
+        load,
+        ttl=3600,
+        stale_ttl=60
     )
-    
-    response_data = {
-        "category": CategoryResponse.model_validate(category),
-        "total": total,
-        "offset": offset,
-        "limit": limit,
-        "terms": [TermResponse.model_validate(term) for term in terms]
-    }
-
-    await redis_manager.set_value(cache_key, response_data, expire=3600)
-    
-    return response_data
 
 
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
@@ -135,8 +133,9 @@ async def create_category(
         category = await CategoryService.create_category(db, category_data)
         await db.commit()
         
-        # Invalidate cache
-        await redis_manager.delete_key("categories:all")
+        # Invalidate cache (a new generation also refreshes the dictionary snapshot)
+        await CategoryService.invalidate_cache(category.slug)
+        await TermService.invalidate_search_cache()
         
         return category
     except ValueError as e:
@@ -170,8 +169,9 @@ async def update_category(
     )
     await db.commit()
     
-    # Invalidate cache
-    await redis_manager.delete_key("categories:all")
+    # Invalidate cache (term details embed the category)
+    await CategoryService.invalidate_cache(updated_category.slug)
+    await TermService.invalidate_category_terms(db, updated_category.id)
     
     return updated_category
 
@@ -194,10 +194,17 @@ async def delete_category(
             detail=f"Category with ID {category_id} not found"
         )
     
-    await CategoryService.delete_category(db, category)
+    slug = category.slug
+    keywords = await CategoryService.delete_category(db, category)
     await db.commit()
     
-    # Invalidate cache
-    await redis_manager.delete_key("categories:all")
+    # Invalidate cache, including the details of the cascaded terms
+    await CategoryService.invalidate_cache(slug)
+    await cache.bump(f"category:{slug}:terms")
+    await TermService.invalidate_term_details(keywords)
+    await TermService.invalidate_search_cache()
+    
+    # Terms were removed by the cascade, not one by one
+    await suggest_index.request_rebuild()
     
     return None
@@ -131,6 +131,7 @@ async def update_dataset_meta(
         stars_count=meta.stars_count,
         downloads_count=meta.downloads_count,
         views_count=meta.views_count,
+        entry_count=meta.entry_count,
         size_bytes=meta.size_bytes,
         readme=meta.readme,
         description=meta.description,
@@ -183,12 +184,6 @@ async def get_dataset_detail(
     # Get contributors
     contributors_data, _ = await DatasetMetaService.get_contributors(db, dataset_id, limit=10)
     
-    # Get entry count
-    from app.models.dataset import DataEntry
-    from sqlalchemy import func
-    count_query = select(func.count()).where(DataEntry.dataset_id == dataset_id)
-    entry_count = await db.scalar(count_query) or 0
-    
     # Build response
     response_data = {
         "id": dataset.id,
@@ -199,7 +194,7 @@ async def get_dataset_detail(
         "creator_id": dataset.creator_id,
         "created_at": dataset.created_at,
         "updated_at": dataset.updated_at,
-        "entry_count": entry_count,
+        "entry_count": dataset.entry_count,
         "creator": UserResponse.model_validate(dataset.creator) if dataset.creator else None,
         "meta": DatasetMetaResponse.model_validate(dataset.meta) if dataset.meta else None,
         "contributors": [
@@ -1,10 +1,10 @@
 """Dataset management API endpoints"""
 
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
 from app.schemas.dataset import (
@@ -36,9 +36,6 @@ async def create_dataset(
     dataset = await DatasetService.create_dataset(db, dataset_data, current_user.id)
     await db.commit()
     
-    # Add entry count
-    dataset.entry_count = 0
-    
     return DatasetResponse.model_validate(dataset)
 
 
@@ -75,7 +72,7 @@ async def get_public_datasets(
     sort_by: str = Query("new", description="Sort by: new, top, largest"),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get public datasets with sorting and filtering options.
@@ -99,62 +96,67 @@ async def get_public_datasets(
 @router.get("/{dataset_id}/download")
 async def download_dataset(
     dataset_id: UUID,
-    format: str = Query("json", regex="^(json|csv)$"),
+    request: Request,
+    format: str = Query("json", regex="^(json|jsonl|csv|parquet|arrow)$"),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Download dataset entries in JSON or CSV format
+    Download dataset entries as a JSON array, JSON Lines, CSV, Parquet or Arrow
+    
+    Each version of a dataset's entries is exported to disk once, in the
+    background, and then served as a file with an ETag: If-None-Match,
+    Range/If-Range and a gzip variant (Accept-Encoding) are supported.
+    Until the current version is built the file is streamed straight from
+    the database. CSV columns are the union of the entries' top-level keys;
+    Parquet and Arrow (IPC file, zstd) columns are also typed from them.
     """
     dataset = await DatasetService.get_by_id(db, dataset_id)
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
     
-    # Increment download count
+    from app.core.files import accepts_gzip, ranged_file_response
+    from app.services.dataset_export_service import DatasetExportService, EXPORT_FORMATS
     from app.services.dataset_meta_service import DatasetMetaService
-    await DatasetMetaService.increment_downloads(db, dataset_id)
-    await db.commit()
-    
-    from app.services.data_entry_service import DataEntryService
     from fastapi.responses import StreamingResponse
-    import io
-    import json
-    import csv
-
-    # Fetch all entries (limit=None or a large number)
-    entries, _ = await DataEntryService.search_entries(db, dataset_id=dataset_id, limit=50000)
     
-    filename = f"{dataset.name.lower().replace(' ', '_')}_{dataset_id}.{format}"
+    extension, media_type = EXPORT_FORMATS[format]
+    filename = f"{dataset.name.lower().replace(' ', '_')}_{dataset_id}.{extension}"
+    version = dataset.meta.content_version if dataset.meta else 0
     
-    if format == "json":
-        data = [e.content for e in entries]
-        buffer = io.StringIO()
-        json.dump(data, buffer, ensure_ascii=False, indent=2)
-        buffer.seek(0)
-        return StreamingResponse(
-            io.BytesIO(buffer.getvalue().encode('utf-8')),
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    else:
-        # CSV Format
-        buffer = io.StringIO()
-        if entries:
-            # Get headers from first entry's content keys
-            headers = list(entries[0].content.keys()) if isinstance(entries[0].content, dict) else ["content"]
-            writer = csv.DictWriter(buffer, fieldnames=headers)
-            writer.writeheader()
-            for e in entries:
-                if isinstance(e.content, dict):
-                    writer.writerow(e.content)
-                else:
-                    writer.writerow({"content": str(e.content)})
-        
-        buffer.seek(0)
-        return StreamingResponse(
-            io.BytesIO(buffer.getvalue().encode('utf-8')),
-            media_type="text/csv",
+    response = None
+    artifact = DatasetExportService.find_artifact(dataset_id, format, version)
+    if artifact is not None:
+        try:
+            if artifact.gzip_path is not None and accepts_gzip(request):
+                response = ranged_file_response(
+                    request, artifact.gzip_path, etag=artifact.gzip_etag,
+                    media_type=media_type, filename=filename, cache_control="no-cache",
+                    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+                )
+            else:
+                response = ranged_file_response(
+                    request, artifact.path, etag=artifact.etag,
+                    media_type=media_type, filename=filename, cache_control="no-cache",
+                    headers={"Vary": "Accept-Encoding"}
+                )
+        except FileNotFoundError:
+            pass  # Replaced by a newer version since the lookup; stream this one
+    if response is None:
+        DatasetExportService.schedule_build(dataset_id, format)
+        response = StreamingResponse(
+            DatasetExportService.stream_export(dataset_id, format),
+            media_type=media_type,
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
+    
+    # Count whole downloads, and resumed ones once (by their first range)
+    if response.status_code == 200 or (
+        response.status_code == 206 and response.headers["Content-Range"].startswith("bytes 0-")
+    ):
+        await DatasetMetaService.increment_downloads(db, dataset_id)
+        await db.commit()
+    
+    return response
 
 
 @router.get("/{dataset_id}", response_model=DatasetResponse)
@@ -225,13 +227,6 @@ async def update_dataset(
     
     await db.commit()
     
-    # Get entry count
-    from app.models.dataset import DataEntry
-    from sqlalchemy import select, func
-    count_query = select(func.count()).where(DataEntry.dataset_id == dataset_id)
-    count = await db.scalar(count_query)
-    dataset.entry_count = count
-    
     return DatasetResponse.model_validate(dataset)
 
 
@@ -261,9 +256,13 @@ async def delete_dataset(
     
     await db.commit()
     
-    # Invalidate cache
+    # Purge cached entry pages
     from app.services.data_entry_service import DataEntryService
-    await DataEntryService.invalidate_dataset_cache(dataset_id)
+    await DataEntryService.purge_dataset_cache(dataset_id)
+    
+    # And its download files
+    from app.services.dataset_export_service import DatasetExportService
+    DatasetExportService.purge(dataset_id)
 
 
 @router.get("/search/all", response_model=DatasetListResponse)
@@ -1,9 +1,11 @@
 """Data entry management API endpoints"""
 
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
@@ -14,9 +16,13 @@ from app.schemas.dataset import (
     DataEntrySearchResponse,
     BulkDataEntryCreate,
     BulkDeleteRequest,
-    BulkOperationResult
+    BulkOperationResult,
+    EntryImportJob,
+    EntryUploadResult
 )
 from app.services.data_entry_service import DataEntryService
+from app.services.dataset_service import DatasetService
+from app.services.entry_upload_service import EntryUploadService
 
 
 router = APIRouter(prefix="/entries", tags=["entries"])
@@ -91,6 +97,148 @@ async def bulk_create_entries(
         )
 
 
+@router.post("/upload", response_model=EntryUploadResult, status_code=status.HTTP_201_CREATED)
+async def upload_entries(
+    dataset_id: UUID = Query(..., description="ID of the dataset"),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="jsonl, csv, conll, tmx or tsv (default: from the file name)"),
+    source_language: Optional[str] = Query(None, max_length=20, description="Source language of a TMX or TSV file"),
+    target_language: Optional[str] = Query(None, max_length=20, description="Target language of a TMX or TSV file"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Load entries from a JSONL, CSV, CoNLL, TMX or TSV file (requires authentication)
+    
+    JSONL has one content object per line; CSV has a header row naming the
+    content keys, and its cells are imported as strings. CoNLL (into ner
+    datasets) and TMX or TSV (into parallel datasets) are mapped to the
+    content of that type. The file may be gzip-compressed. It is loaded in
+    chunks of DATASET_UPLOAD_CHUNK entries, each committed on its own;
+    duplicates are skipped as in /entries/bulk. Large files should go
+    through POST /entries/import instead.
+    
+    Returns the totals, the rejected lines and per-chunk counts.
+    """
+    try:
+        upload_format = EntryUploadService.jobs.detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)
+    if file_size > settings.DATASET_UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Max size is {settings.DATASET_UPLOAD_MAX_BYTES} bytes"
+        )
+    
+    dataset = await DatasetService.get_by_id(db, dataset_id, include_entry_count=False, include_meta=False)
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found"
+        )
+    try:
+        EntryUploadService.check_format(upload_format, dataset.type, source_language, target_language)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    # The upload runs on a connection of its own
+    await db.commit()
+    
+    try:
+        return await EntryUploadService.ingest_file(
+            dataset_id, current_user.id, file.file, upload_format, source_language, target_language
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload failed: {str(e)}"
+        )
+
+
+@router.post("/import", response_model=EntryImportJob, status_code=status.HTTP_202_ACCEPTED)
+async def import_entries(
+    dataset_id: UUID = Query(..., description="ID of the dataset"),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="jsonl, csv, conll, tmx or tsv (default: from the file name)"),
+    source_language: Optional[str] = Query(None, max_length=20, description="Source language of a TMX or TSV file"),
+    target_language: Optional[str] = Query(None, max_length=20, description="Target language of a TMX or TSV file"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Load entries from a file in the background (requires authentication)
+    
+    Accepts the same files as POST /entries/upload, up to
+    DATASET_IMPORT_MAX_BYTES. Returns the queued job; poll
+    GET /entries/import/{job_id} for progress and the result.
+    """
+    try:
+        import_format = EntryUploadService.jobs.detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)
+    if file_size > settings.DATASET_IMPORT_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Max size is {settings.DATASET_IMPORT_MAX_BYTES} bytes"
+        )
+    
+    dataset = await DatasetService.get_by_id(db, dataset_id, include_entry_count=False, include_meta=False)
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found"
+        )
+    try:
+        EntryUploadService.check_format(import_format, dataset.type, source_language, target_language)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    path = await EntryUploadService.jobs.save_upload(file.file)
+    job = await EntryUploadService.jobs.create_job(
+        dataset_id=dataset_id, format=import_format, filename=file.filename, user_id=current_user.id
+    )
+    EntryUploadService.start_import(job, path, source_language, target_language)
+    return job
+
+
+@router.get("/import/{job_id}", response_model=EntryImportJob)
+async def get_import_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get the progress or result of an entry import (requires authentication)
+    
+    Only the user who started the import can see it
+    """
+    job = await EntryUploadService.jobs.get_job(job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job {job_id} not found"
+        )
+    return job
+
+
 @router.get("/", response_model=DataEntrySearchResponse)
 async def search_entries(
     dataset_id: UUID = Query(None, description="Filter by dataset ID"),
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
 from sqlalchemy.orm import selectinload
 
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.models.user import User
 from app.models.user_meta import UserMeta
 from app.models.post import Post
@@ -26,7 +26,7 @@ class LeaderboardUser(BaseModel):
 @router.get("/", response_model=List[LeaderboardUser])
 async def get_leaderboard(
     limit: int = 50,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ) -> Any:
     """
     Get top contributors based on 'ball' (score).
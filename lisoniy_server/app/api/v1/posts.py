@@ -12,7 +12,7 @@ from fastapi import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models import User, PostType
 from app.schemas.content import (
     PostCreate,
@@ -69,7 +69,7 @@ async def get_posts(
     limit: int = Query(10, ge=1, le=100),
     type: Optional[PostType] = Query(None),
     tag: Optional[str] = Query(None, description="Filter by tag (e.g., 'python' or '#python')"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """
@@ -174,7 +174,7 @@ async def unlike_post(
 @router.get("/tags/popular", response_model=List[dict])
 async def get_popular_tags(
     limit: int = Query(10, ge=1, le=50, description="Number of top tags to return"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get the most used tags with their post counts.
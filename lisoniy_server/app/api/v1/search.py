@@ -1,10 +1,11 @@
 """Search API endpoints"""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.schemas.terminology import SearchQuery, SearchResponse
+from app.db.session import get_read_db
+from app.schemas.terminology import SearchQuery, SearchResponse, SuggestResponse
+from app.services.suggest_index import suggest_index
 from app.services.term_service import TermService
 
 
@@ -18,15 +19,24 @@ async def search_terms(
     category: str | None = Query(None, description="Filter by category slug"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
-    db: AsyncSession = Depends(get_db)
+    fuzzy: bool = Query(False, description="Typo-tolerant keyword lookup (did you mean)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Search terms (public endpoint, cached)
     
-    Multi-strategy search:
+    Ranked search:
     1. Exact match on keyword
-    2. Partial match on keyword
-    3. Full-text search on definitions
+    2. Prefix match on keyword
+    3. Substring / trigram similarity on keyword
+    4. Full-text search on definitions
+    
+    Matching ignores case and Uzbek apostrophe variants (o‘, oʻ, o'),
+    which also share one cached page.
+    
+    With **fuzzy=true** only keywords are matched, allowing up to two
+    typos (Cyrillic input and doubled letters are tolerated too), closest
+    first.
     
     **Query parameters:**
     - **q**: Search query (required)
@@ -34,20 +44,40 @@ async def search_terms(
     - **category**: Filter by category slug
     - **offset**: Pagination offset (default: 0)
     - **limit**: Results per page (max: 100, default: 20)
+    - **fuzzy**: Typo-tolerant keyword lookup (default: false)
     """
     search_query = SearchQuery(
         q=q,
         language=language,
         category=category,
         offset=offset,
-        limit=limit
+        limit=limit,
+        fuzzy=fuzzy
     )
     
-    terms, total = await TermService.search_terms(db, search_query)
+    return await TermService.search(db, search_query)
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest_keywords(
+    q: str = Query(..., min_length=1, max_length=255, description="Typed prefix"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
+):
+    """
+    Autocomplete term keywords (public endpoint, in-memory)
+    
+    Answers from the per-process keyword prefix index without querying
+    the database. Matching ignores case and apostrophe variants, and
+    suggestions are in alphabetical order, so an exact match comes first.
     
-    return SearchResponse(
-        total=total,
-        offset=offset,
-        limit=limit,
-        results=terms
-    )
+    **Query parameters:**
+    - **q**: Typed prefix (required)
+    - **limit**: Maximum suggestions (max: 50, default: 10)
+    """
+    if not suggest_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Suggestions are not available yet"
+        )
+    
+    return SuggestResponse(query=q, suggestions=suggest_index.suggest(q, limit))
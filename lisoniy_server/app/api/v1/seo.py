@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import Response, HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.services.seo_service import SEOService
 from app.schemas.seo import DatasetSEO, PostSEO, UserSEO
 
@@ -36,7 +36,7 @@ def is_crawler(request: Request) -> bool:
 
 
 @router.get("/sitemap.xml")
-async def get_sitemap(db: AsyncSession = Depends(get_db)):
+async def get_sitemap(db: AsyncSession = Depends(get_read_db)):
     """
     Generate XML sitemap with all public content
     
@@ -0,0 +1,70 @@
+"""Full-dictionary snapshot download endpoints"""
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.core.files import ranged_file_response
+from app.schemas.terminology import SnapshotManifest
+from app.services.snapshot_service import SNAPSHOT_FORMATS, SnapshotService
+
+
+router = APIRouter()
+
+# Download name -> format
+_DOWNLOADS = {download_name: fmt for fmt, (download_name, _, _) in SNAPSHOT_FORMATS.items()}
+
+
+@router.get("/", response_model=SnapshotManifest)
+async def get_snapshot_manifest(response: Response):
+    """
+    Describe the current dictionary snapshot (public endpoint)
+
+    Offline clients compare **generation** (or a file's **etag**) with
+    their copy and download only when it changed.
+    """
+    manifest = SnapshotService.read_manifest()
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Dictionary snapshot is not built yet"
+        )
+    response.headers["Cache-Control"] = "no-cache"
+    return manifest
+
+
+@router.get("/{name}")
+async def download_snapshot(name: str, request: Request):
+    """
+    Download the dictionary snapshot (public endpoint)
+
+    - **terminology.jsonl.gz**: one JSON object per line (meta, categories, terms)
+    - **terminology.sqlite**: categories, terms and definitions tables
+
+    Supports If-None-Match and Range/If-Range for resumable downloads.
+    """
+    fmt = _DOWNLOADS.get(name)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Snapshot file '{name}' not found"
+        )
+    manifest = SnapshotService.read_manifest()
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Dictionary snapshot is not built yet"
+        )
+    snapshot_file = manifest.files[fmt]
+    try:
+        return ranged_file_response(
+            request,
+            SnapshotService.file_path(manifest, fmt),
+            etag=snapshot_file.etag,
+            media_type=snapshot_file.media_type,
+            filename=name,
+        )
+    except FileNotFoundError:
+        # Replaced by a newer snapshot between reading the manifest and the file
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Dictionary snapshot is being replaced, retry"
+        )
@@ -3,9 +3,10 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.user import User
 from app.core.dependencies import get_current_active_user
@@ -17,8 +18,11 @@ from app.schemas.terminology import (
     BulkTermCreate,
     BulkTermDelete,
     BulkOperationResponse,
+    TermImportJob,
+    TermChangesResponse,
 )
 from app.services.term_service import TermService
+from app.services.term_import_service import TermImportService
 
 
 router = APIRouter()
@@ -56,6 +60,88 @@ async def create_term(
         )
 
 
+@router.post("/import", response_model=TermImportJob, status_code=status.HTTP_202_ACCEPTED)
+async def import_terms(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="csv, jsonl or tbx (default: from the file name)"),
+    category: Optional[str] = Query(None, description="Category slug for rows without one"),
+    source_language: str = Query("uz", pattern=r'^[a-z]{2}$', description="Keyword language"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Import terms from a CSV, JSONL or TBX file in the background (requires authentication)
+    
+    The file may be gzip-compressed. Returns the queued job; poll
+    GET /terms/import/{job_id} for progress and the result.
+    """
+    try:
+        import_format = TermImportService.jobs.detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)
+    if file_size > settings.TERM_IMPORT_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Max size is {settings.TERM_IMPORT_MAX_BYTES} bytes"
+        )
+    
+    path = await TermImportService.jobs.save_upload(file.file)
+    job = await TermImportService.jobs.create_job(
+        format=import_format, filename=file.filename, user_id=current_user.id
+    )
+    TermImportService.start_import(job, path, default_category=category, source_language=source_language)
+    return job
+
+
+@router.get("/import/{job_id}", response_model=TermImportJob)
+async def get_import_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get the progress or result of a term import (requires authentication)
+    
+    Only the user who started the import can see it
+    """
+    job = await TermImportService.jobs.get_job(job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job {job_id} not found"
+        )
+    return job
+
+
+# Declared before /{keyword}, which would otherwise match "changes"
+@router.get("/changes", response_model=TermChangesResponse)
+async def get_term_changes(
+    since: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get terms changed since a cursor (public endpoint)
+    
+    For clients keeping a local copy of the dictionary in sync: start
+    without **since** (or from a snapshot's changes_cursor), apply
+    **upserts** and **deletes**, and keep calling with **next_cursor**
+    while **has_more** is true. Later, poll with the last cursor.
+    """
+    try:
+        return await TermService.get_changes(db, since=since, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get("/{keyword}", response_model=TermDetailResponse)
 async def get_term_by_keyword(
     keyword: str,
@@ -66,7 +152,7 @@ async def get_term_by_keyword(
     
     Returns the term with all definitions and category information
     """
-    term = await TermService.get_by_keyword(db, keyword)
+    term = await TermService.get_detail_by_keyword(db, keyword)
     
     if not term:
         raise HTTPException(
@@ -134,6 +220,36 @@ async def update_term(
         )
 
 
+@router.delete("/bulk", response_model=BulkOperationResponse)
+async def bulk_delete_terms(
+    bulk_data: BulkTermDelete,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Delete multiple terms at once (requires authentication)
+    
+    Maximum 100 terms per request
+    Returns success/failure details for each term
+    """
+    # Declared before DELETE /{term_id}, which would otherwise capture "bulk"
+    results = await TermService.bulk_delete_terms(
+        db=db,
+        term_ids=bulk_data.term_ids,
+        user_id=current_user.id
+    )
+    
+    successful = sum(1 for r in results if r.success)
+    failed = len(results) - successful
+    
+    return BulkOperationResponse(
+        total=len(results),
+        successful=successful,
+        failed=failed,
+        results=results
+    )
+
+
 @router.delete("/{term_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_term(
     term_id: UUID,
@@ -177,36 +293,7 @@ async def bulk_create_terms(
     """
     results = await TermService.bulk_create_terms(
         db=db,
-        bulk_data=bulk_data,
-        user_id=current_user.id
-    )
-    
-    successful = sum(1 for r in results if r.success)
-    failed = len(results) - successful
-    
-    return BulkOperationResponse(
-        total=len(results),
-        successful=successful,
-        failed=failed,
-        results=results
-    )
-
-
-@router.delete("/bulk", response_model=BulkOperationResponse)
-async def bulk_delete_terms(
-    bulk_data: BulkTermDelete,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-):
-    """
-    Delete multiple terms at once (requires authentication)
-    
-    Maximum 100 terms per request
-    Returns success/failure details for each term
-    """
-    results = await TermService.bulk_delete_terms(
-        db=db,
-        term_ids=bulk_data.term_ids,
+        terms=bulk_data.terms,
         user_id=current_user.id
     )
     
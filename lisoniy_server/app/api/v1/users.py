@@ -7,7 +7,7 @@ import time
 import aiofiles
 from app.core.config import settings
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
 from app.services.user_service import UserService
@@ -258,7 +258,7 @@ async def upload_avatar(
 @router.get("/ranking", response_model=list[UserRankingResponse])
 async def get_ranking(
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get global user ranking (Top 50 by ball).
@@ -308,7 +308,7 @@ async def delete_current_user(
 @router.get("/top-authors")
 async def get_top_authors(
     limit: int = 5,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get top authors by contribution (public)
@@ -0,0 +1,141 @@
+"""File responses with ETag revalidation and byte-range support"""
+
+import os
+import re
+from email.utils import formatdate
+from typing import AsyncIterator, Optional
+
+import aiofiles
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+
+CHUNK_SIZE = 64 * 1024
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison)"""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Whether the client's Accept-Encoding allows gzip"""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single byte range
+
+    Returns:
+        Inclusive (start, end), or None if the range cannot be satisfied.
+        Raises ValueError for ranges this helper ignores (malformed or
+        multiple ranges), which are answered with the whole file.
+    """
+    match = _RANGE.match(header.strip())
+    if match is None or match.group(1) == match.group(2) == "":
+        raise ValueError(f"Unsupported range '{header}'")
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+async def _read_range(path: str, start: int, length: int) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def ranged_file_response(
+    request: Request,
+    path: str,
+    etag: str,
+    media_type: str,
+    filename: Optional[str] = None,
+    cache_control: str = "public, max-age=60",
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    Serve a file from disk with conditional and partial GETs
+
+    Answers If-None-Match with 304 and a single "Range: bytes=..." with
+    206 (or 416 if unsatisfiable). If-Range must match the ETag, so a
+    resumed download never mixes two versions of a file.
+
+    Args:
+        request: Incoming request
+        path: File to serve (must not change while its ETag is current)
+        etag: Quoted strong ETag of the file's content
+        media_type: Content-Type
+        filename: Download name for Content-Disposition
+        cache_control: Cache-Control header
+        headers: Further headers (e.g. Content-Encoding of a precompressed file)
+
+    Returns:
+        Response to return from the route
+    """
+    stat = os.stat(path)
+    headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": cache_control,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = _parse_range(range_header, stat.st_size)
+        except ValueError:
+            pass
+        else:
+            if byte_range is None:
+                headers["Content-Range"] = f"bytes */{stat.st_size}"
+                return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _read_range(path, start, end - start + 1),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat)
@@ -0,0 +1,35 @@
+"""Opaque keyset cursors over (timestamp, id) positions"""
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """
+    Encode a keyset position as an opaque, URL-safe cursor
+
+    Args:
+        timestamp: Sort timestamp of the last row returned
+        row_id: ID of the last row returned (tie-breaker)
+
+    Returns:
+        Cursor string
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor made by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, row_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,147 @@
+"""Route rate limit policies and the middleware that enforces them"""
+
+import json
+from typing import Callable, Optional
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.services.rate_limiter import RateLimiter, rate_limiter
+
+
+class RateLimitPolicy:
+    """
+    Limit applied to one route
+
+    Args:
+        name: Bucket name prefix (routes sharing a name share a bucket)
+        limit: Requests allowed per window
+        window: Window length in seconds
+        scope: "ip" to key by client address, "user" to key by the
+            authenticated user (falling back to the address)
+    """
+
+    def __init__(self, name: str, limit: int, window: int, scope: str = "user"):
+        if scope not in ("ip", "user"):
+            raise ValueError(f"Unknown rate limit scope '{scope}'")
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.scope = scope
+
+
+def _bulk_policy() -> RateLimitPolicy:
+    return RateLimitPolicy(
+        "bulk", settings.RATE_LIMIT_BULK_REQUESTS, settings.RATE_LIMIT_BULK_WINDOW
+    )
+
+
+def _auth_policy(name: str) -> RateLimitPolicy:
+    return RateLimitPolicy(
+        name, settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_WINDOW, scope="ip"
+    )
+
+
+# (method, path) -> policy. Paths are matched without a trailing slash.
+# Login is limited per email inside its handler since the key is in the body.
+RATE_LIMIT_POLICIES: dict[tuple[str, str], RateLimitPolicy] = {
+    ("POST", "/api/v1/auth/register"): _auth_policy("register"),
+    ("POST", "/api/v1/auth/resend-verification"): _auth_policy("resend_verification"),
+    ("POST", "/api/v1/auth/request-password-reset"): _auth_policy("password_reset"),
+    ("POST", "/api/v1/entries/bulk"): _bulk_policy(),
+    ("POST", "/api/v1/entries/upload"): _bulk_policy(),
+    ("POST", "/api/v1/entries/import"): _bulk_policy(),
+    ("DELETE", "/api/v1/entries/bulk"): _bulk_policy(),
+    ("POST", "/api/v1/terms/bulk"): _bulk_policy(),
+    ("DELETE", "/api/v1/terms/bulk"): _bulk_policy(),
+    ("POST", "/api/v1/terms/import"): _bulk_policy(),
+    ("POST", "/api/v1/posts"): RateLimitPolicy(
+        "create_post", settings.RATE_LIMIT_POST_REQUESTS, settings.RATE_LIMIT_POST_WINDOW
+    ),
+}
+
+
+def _user_id_from_headers(headers: list[tuple[bytes, bytes]]) -> Optional[str]:
+    """Subject of a valid bearer access token, without touching the database"""
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            except JWTError:
+                return None
+            if payload.get("type") != "access":
+                return None
+            return payload.get("sub")
+    return None
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing RATE_LIMIT_POLICIES
+
+    Requests over the limit get a 429 with Retry-After before any handler,
+    dependency or body parsing runs. Limited routes that pass get
+    X-RateLimit-Limit / X-RateLimit-Remaining headers; other routes are
+    untouched and cost no Redis round-trip.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: RateLimiter = rate_limiter,
+        policies: Optional[dict[tuple[str, str], RateLimitPolicy]] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.policies = RATE_LIMIT_POLICIES if policies is None else policies
+        self.enabled = settings.RATE_LIMIT_ENABLED if enabled is None else enabled
+
+    def _identifier(self, scope, policy: RateLimitPolicy) -> str:
+        if policy.scope == "user":
+            user_id = _user_id_from_headers(scope.get("headers", []))
+            if user_id:
+                return f"{policy.name}:user:{user_id}"
+        client = scope.get("client")
+        host = client[0] if client else "unknown"
+        return f"{policy.name}:ip:{host}"
+
+    async def __call__(self, scope, receive, send: Callable) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"].rstrip("/") or "/"
+        policy = self.policies.get((scope["method"], path))
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        result = await self.limiter.hit(
+            self._identifier(scope, policy), policy.limit, policy.window
+        )
+        headers = [(k.lower().encode(), v.encode()) for k, v in result.headers().items()]
+
+        if not result.allowed:
+            body = json.dumps({"detail": "Too many requests. Please try again later."}).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *headers,
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), *headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,6 +1,21 @@
 """Database module initialization"""
 
 from app.db.base import Base
-from app.db.session import engine, get_db, AsyncSessionLocal
+from app.db.session import (
+    engine,
+    get_db,
+    get_read_db,
+    AsyncSessionLocal,
+    pool_monitor,
+    replica_router,
+)
 
-__all__ = ["Base", "engine", "get_db", "AsyncSessionLocal"]
+__all__ = [
+    "Base",
+    "engine",
+    "get_db",
+    "get_read_db",
+    "AsyncSessionLocal",
+    "pool_monitor",
+    "replica_router",
+]
@@ -0,0 +1,152 @@
+"""Connection pool instrumentation: checkout telemetry and leak detection"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMonitor:
+    """Collects checkout statistics and reports connections held too long"""
+
+    def __init__(self, leak_threshold: float):
+        """
+        Args:
+            leak_threshold: Seconds a connection may stay checked out before
+                it is reported as a potential leak
+        """
+        self.leak_threshold = leak_threshold
+        self.pool: Any = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.leaks_reported = 0
+        # id(connection_record) -> (checkout time, task name, reported flag)
+        self._held: dict[int, list] = {}
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Register pool event listeners on an engine"""
+        self.pool = engine.sync_engine.pool
+        if isinstance(self.pool, InstrumentedQueuePool):
+            self.pool.monitor = self
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record how long a caller waited for a pooled connection"""
+        self.waits += 1
+        self.total_wait += seconds
+        self.max_wait = max(self.max_wait, seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts += 1
+        self._report_overdue()
+
+        task = asyncio.current_task() if _loop_running() else None
+        self._held[id(connection_record)] = [
+            time.monotonic(),
+            task.get_name() if task else None,
+            False,
+        ]
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        held = self._held.pop(id(connection_record), None)
+        if held is None:
+            return
+
+        duration = time.monotonic() - held[0]
+        if duration > self.leak_threshold and not held[2]:
+            self.leaks_reported += 1
+            logger.warning(
+                "DB connection held for %.1fs (threshold %.1fs) by task %s",
+                duration, self.leak_threshold, held[1]
+            )
+
+    def _report_overdue(self) -> None:
+        """Log connections that are still checked out past the threshold"""
+        now = time.monotonic()
+        for held in self._held.values():
+            if not held[2] and now - held[0] > self.leak_threshold:
+                held[2] = True
+                self.leaks_reported += 1
+                logger.warning(
+                    "Possible DB session leak: connection checked out for %.1fs by task %s",
+                    now - held[0], held[1]
+                )
+
+    def stats(self) -> dict:
+        """
+        Snapshot of live pool state and accumulated counters
+
+        Returns:
+            Dictionary suitable for a JSON response
+        """
+        now = time.monotonic()
+        pool = self.pool
+        queued = isinstance(pool, QueuePool)
+
+        return {
+            "pool_class": type(pool).__name__ if pool is not None else None,
+            "size": pool.size() if queued else None,
+            "checked_in": pool.checkedin() if queued else None,
+            "checked_out": pool.checkedout() if queued else len(self._held),
+            "overflow": pool.overflow() if queued else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / self.waits * 1000, 3) if self.waits else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "leak_threshold_s": self.leak_threshold,
+            "leaks_reported": self.leaks_reported,
+            "held_over_threshold": [
+                {"held_s": round(now - held[0], 1), "task": held[1]}
+                for held in self._held.values()
+                if now - held[0] > self.leak_threshold
+            ],
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that times how long each checkout waits"""
+
+    monitor: Optional[PoolMonitor] = None
+
+    def _do_get(self):
+        if self.monitor is None:
+            return super()._do_get()
+
+        started = time.monotonic()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.monitor.record_wait(time.monotonic() - started, timed_out=True)
+            raise
+        self.monitor.record_wait(time.monotonic() - started)
+        return record
+
+    def recreate(self):
+        # Keep telemetry when the engine replaces the pool (dispose/invalidate)
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        if self.monitor is not None:
+            self.monitor.pool = pool
+        return pool
+
+
+def _loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
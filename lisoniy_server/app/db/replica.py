@@ -0,0 +1,147 @@
+"""Read-replica routing for read-only database sessions"""
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds the replica is behind the primary (0 when the server is not a standby
+# or has replayed everything it received)
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """
+    Chooses between the replica and the primary for read-only sessions
+
+    The replica is used only while its last health check succeeded and its
+    replication lag is within max_lag. Health is re-checked at most every
+    check_interval seconds, so a failing replica costs one probe per interval
+    rather than one per request.
+    """
+
+    def __init__(
+        self,
+        primary_factory: async_sessionmaker,
+        replica_engine: Optional[AsyncEngine] = None,
+        replica_factory: Optional[async_sessionmaker] = None,
+        max_lag: float = 5.0,
+        check_interval: float = 2.0,
+    ):
+        self.primary_factory = primary_factory
+        self.replica_engine = replica_engine
+        self.replica_factory = replica_factory
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.healthy = replica_factory is not None
+        self.last_lag: Optional[float] = None
+        self._checked_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a replica is configured at all"""
+        return self.replica_factory is not None
+
+    async def _measure_lag(self) -> float:
+        """Query the replica for its replication lag in seconds"""
+        async with self.replica_engine.connect() as conn:
+            lag = await conn.scalar(REPLICA_LAG_QUERY)
+        return float(lag or 0)
+
+    async def check_health(self) -> bool:
+        """
+        Probe the replica and update its health state
+
+        Returns:
+            True if reads may be served by the replica
+        """
+        self._checked_at = time.monotonic()
+        try:
+            self.last_lag = await self._measure_lag()
+        except Exception as e:
+            if self.healthy:
+                logger.warning("Read replica unavailable, falling back to primary: %s", e)
+            self.healthy = False
+            self.last_lag = None
+            return False
+
+        healthy = self.last_lag <= self.max_lag
+        if self.healthy and not healthy:
+            logger.warning(
+                "Read replica lag %.1fs exceeds %.1fs, falling back to primary",
+                self.last_lag, self.max_lag
+            )
+        self.healthy = healthy
+        return healthy
+
+    async def choose(self, pin_primary: bool = False) -> async_sessionmaker:
+        """
+        Pick the session factory for a read-only request
+
+        Args:
+            pin_primary: Force the primary (read-your-writes after a mutation)
+
+        Returns:
+            Session factory for the replica or the primary
+        """
+        if pin_primary or not self.enabled:
+            return self.primary_factory
+
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            await self.check_health()
+
+        return self.replica_factory if self.healthy else self.primary_factory
+
+    @asynccontextmanager
+    async def session(self, pin_primary: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """Open a read-only session on the chosen server"""
+        factory = await self.choose(pin_primary)
+        async with factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def primary_session(self, session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Session on the primary for computing a shared cache entry
+
+        A lagging replica read right after a write would be cached under the
+        generation that write just bumped, and served until the entry
+        expires. Cache loaders therefore read from the primary; misses are
+        rare enough that this costs the primary little.
+
+        Args:
+            session: The request's read-only session
+
+        Yields:
+            session itself unless it is a replica session, else a new
+            primary session
+        """
+        if self.replica_engine is None or session.bind is not self.replica_engine:
+            yield session
+            return
+        async with self.primary_factory() as primary:
+            yield primary
+
+    def stats(self) -> dict:
+        """Current routing state"""
+        return {
+            "enabled": self.enabled,
+            "healthy": self.healthy,
+            "last_lag_s": self.last_lag,
+            "max_lag_s": self.max_lag,
+        }
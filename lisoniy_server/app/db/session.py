@@ -1,25 +1,54 @@
 """Database session management with async SQLAlchemy"""
 
 from typing import AsyncGenerator
+from fastapi import Request
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker
 )
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, PoolMonitor
+from app.db.replica import ReplicaRouter
+
+
+def build_engine(url: str) -> tuple[AsyncEngine, PoolMonitor]:
+    """
+    Create an async engine according to DB_POOL_MODE
+
+    "queue" keeps a sized pool of warm connections (pre-ping, recycle and a
+    checkout timeout); "null" opens a fresh connection per checkout.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Tuple of (engine, pool monitor attached to it)
+    """
+    if settings.DB_POOL_MODE == "null":
+        pool_kwargs = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+
+    new_engine = create_async_engine(url, echo=settings.DB_ECHO, **pool_kwargs)
+    monitor = PoolMonitor(leak_threshold=settings.DB_LEAK_THRESHOLD)
+    monitor.attach(new_engine)
+
+    return new_engine, monitor
+
 
 # Create async engine with connection pooling
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DB_ECHO,
-    poolclass=NullPool,  # Use NullPool to prevent connection pool exhaustion/deadlocks
-    # pool_size=settings.DB_POOL_SIZE, # Disabled for NullPool
-    # max_overflow=settings.DB_MAX_OVERFLOW, # Disabled for NullPool
-    # pool_pre_ping=True,  # Disabled for NullPool (connections are always fresh)
-    # pool_recycle=3600,   # Disabled for NullPool
-)
+engine, pool_monitor = build_engine(settings.DATABASE_URL)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -30,11 +59,33 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Optional read replica for read-only endpoints
+replica_engine = None
+replica_pool_monitor = None
+ReplicaSessionLocal = None
+if settings.DATABASE_REPLICA_URL:
+    replica_engine, replica_pool_monitor = build_engine(settings.DATABASE_REPLICA_URL)
+    ReplicaSessionLocal = async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+replica_router = ReplicaRouter(
+    primary_factory=AsyncSessionLocal,
+    replica_engine=replica_engine,
+    replica_factory=ReplicaSessionLocal,
+    max_lag=settings.DB_REPLICA_MAX_LAG,
+    check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session
-    
+
     Yields:
         Database session
     """
@@ -43,3 +94,25 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a read-only database session
+
+    Served by the read replica when one is configured and healthy, otherwise
+    by the primary. Clients that just performed a write carry the
+    read-your-writes cookie and are pinned to the primary until it expires.
+
+    Yields:
+        Database session (must not be used for writes)
+    """
+    pin_primary = (
+        settings.DB_READ_PIN_COOKIE in request.cookies
+        or request.headers.get("X-Read-Primary") == "1"
+    )
+    async with replica_router.session(pin_primary=pin_primary) as session:
+        try:
+            yield session
+        finally:
+            await session.close()
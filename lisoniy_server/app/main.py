@@ -11,16 +11,88 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from fastapi.staticfiles import StaticFiles
 import os
+import asyncio
+import logging
 
 from app.core.config import settings
+from app.core.rate_limit import RateLimitMiddleware
 from app.api.v1 import api_router
 from app.services.redis_manager import redis_manager
+from app.services.local_cache import local_cache
+from app.services.suggest_index import suggest_index
+from app.services.term_import_service import TermImportService
+from app.services.snapshot_service import SnapshotService
+from app.services.audit_service import AuditService, audit_sink
+from app.services.dataset_meta_service import DatasetMetaService
+from app.services.dataset_export_service import DatasetExportService
+from app.services.entry_upload_service import EntryUploadService
 from fastapi.responses import Response
 from sqlalchemy import select
-from app.db.session import AsyncSessionLocal
+from app.db.session import engine, replica_engine, replica_router, AsyncSessionLocal
+from app.services.auth_service import AuthService
 from app.models.post import Post
 from app.models.dataset import Dataset
 
+
+logger = logging.getLogger(__name__)
+
+
+async def purge_refresh_tokens_periodically() -> None:
+    """Delete expired refresh token rows in the background"""
+    while True:
+        await asyncio.sleep(settings.REFRESH_TOKEN_PURGE_INTERVAL)
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await AuthService.purge_expired_refresh_tokens(
+                    db, batch_size=settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+                )
+            if deleted:
+                logger.info("Purged %d expired refresh tokens", deleted)
+        except Exception as e:
+            logger.warning("Refresh token purge failed: %s", e)
+
+
+async def refresh_term_snapshot_periodically() -> None:
+    """Rebuild the dictionary snapshot whenever the terminology changes"""
+    while True:
+        try:
+            manifest = await SnapshotService.refresh()
+            if manifest is not None:
+                logger.info(
+                    "Built dictionary snapshot at generation %d (%d terms)",
+                    manifest.generation, manifest.terms
+                )
+        except Exception as e:
+            logger.warning("Dictionary snapshot refresh failed: %s", e)
+        await asyncio.sleep(settings.TERM_SNAPSHOT_INTERVAL)
+
+
+async def maintain_audit_partitions_periodically() -> None:
+    """Create upcoming term audit log partitions and drop expired ones"""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                created, dropped = await AuditService.maintain_partitions(db)
+            if created or dropped:
+                logger.info("Audit log partitions created %s, dropped %s", created, dropped)
+        except Exception as e:
+            logger.warning("Audit log partition upkeep failed: %s", e)
+        await asyncio.sleep(settings.AUDIT_LOG_PARTITION_INTERVAL)
+
+
+async def reconcile_dataset_counts_periodically() -> None:
+    """Recount dataset entries and sizes to repair any drift"""
+    while True:
+        await asyncio.sleep(settings.DATASET_COUNT_RECONCILE_INTERVAL)
+        try:
+            async with AsyncSessionLocal() as db:
+                fixed = await DatasetMetaService.reconcile_entry_counts(db)
+            if fixed:
+                logger.warning("Corrected entry counts of %d datasets", fixed)
+        except Exception as e:
+            logger.warning("Dataset count reconciliation failed: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -36,14 +108,68 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await redis_manager.connect()
     print("✅ Redis connected")
     
+    # Listen for cache invalidations from other workers
+    await local_cache.start()
+    
+    # Load term keywords for /search/suggest
+    if settings.SUGGEST_INDEX_ENABLED:
+        await suggest_index.start()
+    
+    purge_task = None
+    if settings.REFRESH_TOKEN_PURGE_INTERVAL > 0:
+        purge_task = asyncio.create_task(purge_refresh_tokens_periodically())
+    
+    snapshot_task = None
+    if settings.TERM_SNAPSHOT_INTERVAL > 0:
+        snapshot_task = asyncio.create_task(refresh_term_snapshot_periodically())
+    
+    partition_task = None
+    if settings.AUDIT_LOG_PARTITION_INTERVAL > 0:
+        partition_task = asyncio.create_task(maintain_audit_partitions_periodically())
+    
+    reconcile_task = None
+    if settings.DATASET_COUNT_RECONCILE_INTERVAL > 0:
+        reconcile_task = asyncio.create_task(reconcile_dataset_counts_periodically())
+    
+    # Write-behind audit log
+    if settings.AUDIT_LOG_MODE == "buffered":
+        await audit_sink.start()
+    
     yield
     
     # Shutdown
     print("🛑 Shutting down FastAPI application...")
     
+    if purge_task is not None:
+        purge_task.cancel()
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+    if partition_task is not None:
+        partition_task.cancel()
+    if reconcile_task is not None:
+        reconcile_task.cancel()
+    
+    # Running term and entry imports are marked failed
+    await TermImportService.jobs.cancel_running()
+    await EntryUploadService.jobs.cancel_running()
+    
+    # Half-built download files are removed
+    await DatasetExportService.cancel_running()
+    
+    # Write buffered audit rows before the pool goes away
+    await audit_sink.stop()
+    
     # Close Redis connection
+    await local_cache.stop()
+    await suggest_index.stop()
     await redis_manager.disconnect()
     print("✅ Redis disconnected")
+    
+    # Close pooled database connections
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+    print("✅ Database pool disposed")
 
 
 # Create FastAPI application
@@ -57,6 +183,9 @@ app = FastAPI(
 )
 
 
+# Rate limiting (registered before CORS so 429 responses still carry CORS headers)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -66,12 +195,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# File upload endpoints, exempt from the request timeout
+UNTIMED_UPLOAD_PATHS = {
+    "/api/v1/terms/import",
+    "/api/v1/entries/import",
+    "/api/v1/entries/upload",
+}
+
+
 @app.middleware("http")
 async def timeout_middleware(request: Request, call_next):
     """
     Middleware to fail requests that take too long
     """
     import asyncio
+    if request.method == "POST" and request.url.path in UNTIMED_UPLOAD_PATHS:
+        # Receiving a large file alone takes longer; imports then run in the
+        # background and uploads commit chunk by chunk
+        return await call_next(request)
     try:
         # 20 second hard timeout for any request
         return await asyncio.wait_for(call_next(request), timeout=20.0)
@@ -88,6 +229,30 @@ async def timeout_middleware(request: Request, call_next):
         raise
 
 
+@app.middleware("http")
+async def read_your_writes_middleware(request: Request, call_next):
+    """
+    Pin the client's reads to the primary for a few seconds after a write
+    
+    Read-only endpoints may be served by a lagging replica; the cookie makes
+    get_read_db use the primary so the client sees its own change.
+    """
+    response = await call_next(request)
+    if (
+        replica_router.enabled
+        and request.method in ("POST", "PUT", "PATCH", "DELETE")
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            settings.DB_READ_PIN_COOKIE,
+            "1",
+            max_age=settings.DB_READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
 # Include API routers
 app.include_router(api_router, prefix="/api/v1")
 
@@ -192,7 +357,7 @@ async def sitemap_xml():
         f"{base_url}/register",
     ]
     
-    async with AsyncSessionLocal() as session:
+    async with replica_router.session() as session:
         # Fetch posts
         result = await session.execute(select(Post.id, Post.updated_at))
         posts = result.all()
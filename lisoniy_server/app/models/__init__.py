@@ -1,7 +1,7 @@
 """Models package initialization"""
 
 from app.models.user import User, RefreshToken, UserRole
-from app.models.terminology import Category, Term, Definition, TermAuditLog, AuditAction
+from app.models.terminology import Category, Term, DeletedTerm, Definition, TermAuditLog, AuditAction
 from app.models.post import Post, PostType
 from app.models.comment import Comment
 from app.models.dataset import Dataset, DataEntry
@@ -15,6 +15,7 @@ __all__ = [
     "UserMeta",
     "Category",
     "Term",
+    "DeletedTerm",
     "Definition",
     "TermAuditLog",
     "AuditAction",
@@ -79,6 +79,11 @@ class Dataset(Base):
         lazy="noload"
     )
     
+    @property
+    def entry_count(self) -> int:
+        """Number of entries, from the loaded meta row"""
+        return self.meta.entry_count if self.meta else 0
+    
     # Indexes
     __table_args__ = (
         Index("ix_datasets_type_public", "type", "is_public"),
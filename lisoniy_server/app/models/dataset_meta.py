@@ -29,7 +29,14 @@ class DatasetMeta(Base):
     stars_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     downloads_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     views_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    
+    # Maintained by DataEntryService in the writing transaction
+    entry_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     size_bytes: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    content_version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False,
+        comment="Bumped by every entry write; versions download artifacts"
+    )
     
     # Documentation
     readme: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="Markdown README content")
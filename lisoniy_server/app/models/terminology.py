@@ -5,13 +5,81 @@ from enum import Enum as PyEnum
 from typing import Optional
 import uuid
 
-from sqlalchemy import String, Boolean, Text, DateTime, ForeignKey, Enum, Integer, Index
+from sqlalchemy import String, Boolean, Text, DateTime, ForeignKey, Enum, Integer, Index, DDL, event, text as sa_text
 from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
 
 
+# Apostrophe variants used in Uzbek Latin (o‘, oʻ, o’, g`...), all searched as "'"
+APOSTROPHE_VARIANTS = "\u2018\u2019\u02bb\u02bc`"
+
+_APOSTROPHES = str.maketrans(APOSTROPHE_VARIANTS, "'" * len(APOSTROPHE_VARIANTS))
+
+
+def normalize_search_text(value: str) -> str:
+    """Lowercase, unify apostrophes and collapse whitespace for search matching"""
+    value = value.lower()
+    # translate() is slow; most keywords are plain ASCII without variants
+    if not value.isascii() or "`" in value:
+        value = value.translate(_APOSTROPHES)
+    return " ".join(value.split())
+
+
+# SQL counterpart of normalize_search_text, used by the keyword search
+# indexes. Defined with the terms table so create_all (tests) creates it too.
+NORMALIZE_SEARCH_TEXT_SQL = (
+    "CREATE OR REPLACE FUNCTION normalize_search_text(value text) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ "
+    "SELECT btrim(regexp_replace(translate(lower(value), '%s', '%s'), '\\s+', ' ', 'g')) $$"
+    % (APOSTROPHE_VARIANTS, "''" * len(APOSTROPHE_VARIANTS))
+)
+
+
+# Keeps categories.term_count equal to the number of live terms in each
+# category. Statement-level, so a bulk insert or update adjusts each affected
+# category once; covers every write path (ORM, bulk SQL, imports, cascades).
+TERM_COUNT_TRIGGER_SQL = (
+    """
+CREATE OR REPLACE FUNCTION count_category_terms() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE categories c SET term_count = c.term_count + d.n
+        FROM (SELECT category_id, count(*) AS n FROM new_terms WHERE NOT is_deleted GROUP BY category_id) d
+        WHERE c.id = d.category_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE categories c SET term_count = c.term_count - d.n
+        FROM (SELECT category_id, count(*) AS n FROM old_terms WHERE NOT is_deleted GROUP BY category_id) d
+        WHERE c.id = d.category_id;
+    ELSE
+        UPDATE categories c SET term_count = c.term_count + d.n
+        FROM (
+            SELECT category_id, sum(n) AS n FROM (
+                SELECT category_id, count(*) AS n FROM new_terms WHERE NOT is_deleted GROUP BY category_id
+                UNION ALL
+                SELECT category_id, -count(*) FROM old_terms WHERE NOT is_deleted GROUP BY category_id
+            ) delta
+            GROUP BY category_id
+            HAVING sum(n) <> 0
+        ) d
+        WHERE c.id = d.category_id;
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    "CREATE TRIGGER terms_count_insert AFTER INSERT ON terms "
+    "REFERENCING NEW TABLE AS new_terms "
+    "FOR EACH STATEMENT EXECUTE FUNCTION count_category_terms()",
+    "CREATE TRIGGER terms_count_update AFTER UPDATE ON terms "
+    "REFERENCING OLD TABLE AS old_terms NEW TABLE AS new_terms "
+    "FOR EACH STATEMENT EXECUTE FUNCTION count_category_terms()",
+    "CREATE TRIGGER terms_count_delete AFTER DELETE ON terms "
+    "REFERENCING OLD TABLE AS old_terms "
+    "FOR EACH STATEMENT EXECUTE FUNCTION count_category_terms()",
+)
+
+
 class AuditAction(str, PyEnum):
     """Audit action enumeration"""
     create = "create"
@@ -41,6 +109,8 @@ class Category(Base, TimestampMixin):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Live (not soft-deleted) terms, maintained by TERM_COUNT_TRIGGER_SQL
+    term_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     
     # Relationships
     terms: Mapped[list["Term"]] = relationship(
@@ -112,10 +182,45 @@ class Term(Base, TimestampMixin):
         cascade="all, delete-orphan"
     )
     
+    __table_args__ = (
+        # Keyset cursor of GET /terms/changes; is_deleted included so a page
+        # of ids and tombstone flags is read from the index alone
+        Index("ix_terms_updated_at_id", "updated_at", "id", postgresql_include=["is_deleted"]),
+        # Live terms of a category, newest first: keyset pages of /categories/{slug}/terms
+        Index(
+            "ix_terms_category_live",
+            "category_id", "created_at", "id",
+            postgresql_where=sa_text("NOT is_deleted"),
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Term(id={self.id}, keyword={self.keyword}, deleted={self.is_deleted})>"
 
 
+class DeletedTerm(Base):
+    """Tombstone of a term removed outright (with its category) for GET /terms/changes"""
+    
+    __tablename__ = "deleted_terms"
+    
+    term_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    keyword: Mapped[str] = mapped_column(String(255), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        # Merged into the (updated_at, id) keyset of the changes feed
+        Index("ix_deleted_terms_deleted_at_term_id", "deleted_at", "term_id"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<DeletedTerm(term_id={self.term_id}, keyword={self.keyword})>"
+
+
+event.listen(Term.__table__, "before_create", DDL(NORMALIZE_SEARCH_TEXT_SQL))
+for statement in TERM_COUNT_TRIGGER_SQL:
+    event.listen(Term.__table__, "after_create", DDL(statement))
+
+
 class Definition(Base, TimestampMixin):
     """Definition model - translations and explanations for terms"""
     
@@ -166,27 +271,30 @@ class TermAuditLog(Base):
     
     __tablename__ = "term_audit_logs"
     
-    # Primary Key
+    # Primary Key (the partition key must be part of it)
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid.uuid4
+    )
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime,
+        primary_key=True,
+        default=datetime.utcnow,
+        nullable=False
     )
     
     # Foreign Keys
     term_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("terms.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     # Fields
@@ -195,15 +303,25 @@ class TermAuditLog(Base):
         nullable=False
     )
     changes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
-    timestamp: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
-        nullable=False,
-        index=True
-    )
     
     # Relationships
     term: Mapped["Term"] = relationship("Term", back_populates="audit_logs")
     
+    __table_args__ = (
+        # Newest-first history of a term / activity of a user
+        Index("ix_term_audit_logs_term_id_timestamp", "term_id", "timestamp"),
+        Index("ix_term_audit_logs_user_id_timestamp", "user_id", "timestamp"),
+        # One partition per month (see AuditService.maintain_partitions)
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
+    )
+    
     def __repr__(self) -> str:
         return f"<TermAuditLog(id={self.id}, term_id={self.term_id}, action={self.action})>"
+
+
+# Catches rows outside the monthly partitions (always present, normally empty)
+event.listen(
+    TermAuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE term_audit_logs_default PARTITION OF term_audit_logs DEFAULT"),
+)
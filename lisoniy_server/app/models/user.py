@@ -82,11 +82,12 @@ class RefreshToken(Base, TimestampMixin):
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     
     # Expiration
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     
     # Revocation
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
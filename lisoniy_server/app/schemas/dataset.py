@@ -140,6 +140,44 @@ class BulkOperationResult(BaseModel):
     errors: list[str] = Field(default_factory=list, description="List of error messages")
 
 
+class EntryUploadChunk(BaseModel):
+    """Schema for one committed chunk of an entry upload"""
+    first_line: int = Field(..., description="First line (row) of the file in the chunk")
+    last_line: int = Field(..., description="Last line (row) of the file in the chunk")
+    created: int = Field(0, description="Entries created")
+    skipped: int = Field(0, description="Duplicates skipped")
+    failed: int = Field(0, description="Lines rejected")
+
+
+class EntryUploadResult(BulkOperationResult):
+    """Schema for the result of an entry file upload"""
+    chunks: list[EntryUploadChunk] = Field(default_factory=list, description="Per-chunk counts, in file order")
+    elapsed_seconds: float = Field(0, description="Time spent parsing and loading")
+    entries_per_second: Optional[float] = Field(None, description="Lines processed per second")
+
+
+class EntryImportJob(BaseModel):
+    """Status and result of a background entry import"""
+    id: str
+    status: str = "queued"  # queued, running, completed, failed
+    dataset_id: UUID
+    format: str
+    filename: Optional[str] = None
+    user_id: Optional[int] = None
+    total: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    chunks: int = 0  # Committed so far
+    errors: list[str] = []  # First DATASET_UPLOAD_MAX_ERRORS only
+    error: Optional[str] = None  # Why a failed job stopped
+    entries_per_second: Optional[float] = None
+    elapsed_seconds: Optional[float] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
 # ==================== Search/Filter Schemas ====================
 
 class DataEntryFilter(BaseModel):
@@ -17,6 +17,7 @@ class DatasetMetaResponse(BaseModel):
     stars_count: int = 0
     downloads_count: int = 0
     views_count: int = 0
+    entry_count: int = 0
     size_bytes: int = 0
     readme: Optional[str] = None
     description: Optional[str] = None
@@ -169,6 +169,61 @@ class BulkOperationResponse(BaseModel):
     results: List[BulkOperationResult]
 
 
+class TermImportError(BaseModel):
+    """A rejected row of an import file"""
+    line: int  # Line number (CSV, JSONL) or entry number (TBX)
+    message: str
+
+
+class TermImportJob(BaseModel):
+    """Status and result of a background term import"""
+    id: str
+    status: str = "queued"  # queued, running, completed, failed
+    phase: Optional[str] = None  # staging, merging
+    format: str
+    filename: Optional[str] = None
+    user_id: Optional[int] = None
+    rows_parsed: int = 0
+    rows_staged: int = 0
+    rows_rejected: int = 0
+    keywords_merged: int = 0
+    terms_created: int = 0
+    terms_skipped: int = 0  # Keyword already exists or unknown category
+    definitions_created: int = 0
+    errors: List[TermImportError] = []  # First TERM_IMPORT_MAX_ERRORS only
+    error: Optional[str] = None  # Why a failed job stopped
+    rows_per_second: Optional[float] = None
+    elapsed_seconds: Optional[float] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class TermChange(BaseModel):
+    """A term created or updated since the cursor"""
+    id: UUID
+    keyword: str
+    category_id: UUID
+    category: str  # Category slug
+    definitions: List[DefinitionBase]
+    updated_at: datetime
+
+
+class TermTombstone(BaseModel):
+    """A term deleted since the cursor"""
+    id: UUID
+    keyword: str
+    deleted_at: Optional[datetime] = None
+
+
+class TermChangesResponse(BaseModel):
+    """One page of terminology changes"""
+    upserts: List[TermChange]
+    deletes: List[TermTombstone]
+    next_cursor: Optional[str]  # Pass as since= for the next page; None if nothing was ever returned
+    has_more: bool
+
+
 # ============================================================================
 # Search Schemas
 # ============================================================================
@@ -180,6 +235,7 @@ class SearchQuery(BaseModel):
     category: Optional[str] = None  # Category slug
     offset: int = Field(default=0, ge=0)
     limit: int = Field(default=20, ge=1, le=100)
+    fuzzy: bool = False  # Typo-tolerant keyword lookup instead of ranked search
 
 
 class SearchResponse(BaseModel):
@@ -190,6 +246,37 @@ class SearchResponse(BaseModel):
     results: List[TermResponse]
 
 
+class SuggestResponse(BaseModel):
+    """Schema for keyword autocomplete response"""
+    query: str
+    suggestions: List[str]
+
+
+# ============================================================================
+# Dictionary Snapshot Schemas
+# ============================================================================
+
+class SnapshotFile(BaseModel):
+    """One downloadable snapshot file"""
+    name: str  # File name on disk (changes with every build)
+    url: str
+    media_type: str
+    size: int
+    sha256: str
+    etag: str
+
+
+class SnapshotManifest(BaseModel):
+    """Description of the current full-dictionary snapshot"""
+    generation: int  # Terminology cache generation the snapshot was built at
+    created_at: datetime
+    categories: int
+    terms: int
+    definitions: int
+    files: dict[str, SnapshotFile]  # By format: jsonl, sqlite
+    changes_cursor: Optional[str] = None  # since= for GET /terms/changes after loading this snapshot
+
+
 # ============================================================================
 # Audit Log Schemas
 # ============================================================================
@@ -1,19 +1,171 @@
 """Audit logging service for terminology operations"""
 
+import asyncio
 import json
-from datetime import datetime
+import logging
+from datetime import date, datetime, time
 from typing import Optional, List
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, insert, text, tuple_, event
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.pagination import encode_cursor, decode_cursor
+from app.db.session import AsyncSessionLocal
 from app.models.terminology import TermAuditLog, AuditAction
 
 
+logger = logging.getLogger(__name__)
+
+# Session.info key of buffered rows waiting for their transaction to commit
+PENDING_KEY = "pending_audit_logs"
+
+# Monthly partitions created ahead of the current month
+PARTITIONS_AHEAD = 2
+PARTITION_PREFIX = "term_audit_logs_p"
+DEFAULT_PARTITION = "term_audit_logs_default"
+
+
+def _month(value: date, offset: int = 0) -> date:
+    """First day of the month offset months from value's"""
+    index = value.year * 12 + value.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class AuditSink:
+    """
+    Write-behind buffer for audit rows (AUDIT_LOG_MODE=buffered)
+
+    Rows are handed over when the transaction that produced them commits
+    (rows of rolled back transactions are dropped) and written by a
+    background task in multi-row inserts of AUDIT_LOG_BATCH_SIZE, at least
+    every AUDIT_LOG_FLUSH_INTERVAL seconds. Rows not yet written are lost
+    if the process dies; use AUDIT_LOG_MODE=sync when that is unacceptable.
+    """
+
+    def __init__(self):
+        self._rows: list = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def enqueue(self, rows: List[dict]) -> None:
+        """Buffer committed rows"""
+        self._rows.extend(rows)
+        if len(self._rows) >= settings.AUDIT_LOG_BATCH_SIZE:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """
+        Write every buffered row
+
+        Returns:
+            Number of rows written. On a database error the unwritten rows
+            stay buffered for the next flush.
+        """
+        written = 0
+        async with self._lock:
+            while self._rows:
+                batch = self._rows[:settings.AUDIT_LOG_BATCH_SIZE]
+                try:
+                    written += await self._insert(batch)
+                except Exception as e:
+                    logger.warning("Audit log flush failed, %d rows kept: %s", len(self._rows), e)
+                    break
+                del self._rows[:len(batch)]
+        return written
+
+    @staticmethod
+    async def _insert(batch: List[dict]) -> int:
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(insert(TermAuditLog), batch)
+                await db.commit()
+                return len(batch)
+            except IntegrityError:
+                await db.rollback()
+            # A term removed meanwhile (category delete) fails the whole
+            # batch; write the rows one by one and drop those
+            written = 0
+            for row in batch:
+                try:
+                    await db.execute(insert(TermAuditLog), row)
+                    await db.commit()
+                    written += 1
+                except IntegrityError:
+                    await db.rollback()
+                    logger.warning("Dropped audit row for missing term %s", row["term_id"])
+            return written
+
+    async def start(self) -> None:
+        """Start the background flusher"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write what is left"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.AUDIT_LOG_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+
+# Global audit sink
+audit_sink = AuditSink()
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_over_committed_rows(session: Session) -> None:
+    rows = session.info.pop(PENDING_KEY, None)
+    if rows:
+        audit_sink.enqueue(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_rows(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
 class AuditService:
     """Service for managing audit logs"""
-    
+
+    @staticmethod
+    def build_row(
+        term_id: UUID,
+        user_id: Optional[int],
+        action: AuditAction,
+        changes: Optional[dict] = None,
+        timestamp: Optional[datetime] = None
+    ) -> dict:
+        """Column values of one audit row, for log_actions"""
+        return {
+            "id": uuid4(),
+            "term_id": term_id,
+            "user_id": user_id,
+            "action": action,
+            "changes": json.dumps(changes) if changes else None,
+            "timestamp": timestamp or datetime.utcnow(),
+        }
+
     @staticmethod
     async def log_action(
         db: AsyncSession,
@@ -21,52 +173,153 @@ class AuditService:
         user_id: Optional[int],
         action: AuditAction,
         changes: Optional[dict] = None
-    ) -> TermAuditLog:
+    ) -> None:
         """
         Log an action on a term
-        
+
         Args:
             db: Database session
             term_id: Term UUID
             user_id: User ID performing the action
             action: Action type (CREATE, UPDATE, DELETE)
             changes: Optional dictionary of changes
-            
-        Returns:
-            Created audit log entry
         """
-        audit_log = TermAuditLog(
-            term_id=term_id,
-            user_id=user_id,
-            action=action,
-            changes=json.dumps(changes) if changes else None,
-            timestamp=datetime.utcnow()
-        )
-        
-        db.add(audit_log)
-        await db.flush()
-        
-        return audit_log
-    
+        await AuditService.log_actions(db, [AuditService.build_row(term_id, user_id, action, changes)])
+
+    @staticmethod
+    async def log_actions(db: AsyncSession, rows: List[dict]) -> None:
+        """
+        Log many actions (rows from build_row) with one multi-row insert
+
+        In sync mode the rows are inserted in the caller's transaction.
+        In buffered mode they are held on the session and handed to the
+        write-behind sink when it commits.
+
+        Args:
+            db: Database session with the transaction that made the changes
+            rows: Audit rows
+        """
+        if not rows:
+            return
+        if settings.AUDIT_LOG_MODE == "buffered":
+            db.info.setdefault(PENDING_KEY, []).extend(rows)
+        else:
+            await db.execute(insert(TermAuditLog), rows)
+
     @staticmethod
     async def get_term_history(
         db: AsyncSession,
-        term_id: UUID
-    ) -> List[TermAuditLog]:
+        term_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> tuple[List[TermAuditLog], Optional[str]]:
         """
-        Get audit history for a term
-        
+        Get audit history for a term, newest first
+
+        Pages are read from the (term_id, timestamp) index, continuing
+        after the cursor's entry.
+
         Args:
             db: Database session
             term_id: Term UUID
-            
+            limit: Page size
+            cursor: Cursor returned with the previous page
+
         Returns:
-            List of audit log entries
+            Tuple of (audit log entries, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        result = await db.execute(
+        query = (
             select(TermAuditLog)
             .where(TermAuditLog.term_id == term_id)
-            .order_by(TermAuditLog.timestamp.desc())
+            .order_by(TermAuditLog.timestamp.desc(), TermAuditLog.id.desc())
+            .limit(limit + 1)
         )
-        
-        return list(result.scalars().all())
+        if cursor:
+            timestamp, log_id = decode_cursor(cursor)
+            query = query.where(
+                tuple_(TermAuditLog.timestamp, TermAuditLog.id) < tuple_(timestamp, log_id)
+            )
+
+        result = await db.execute(query)
+        logs = list(result.scalars().all())
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1].timestamp, logs[-1].id)
+        return logs, next_cursor
+
+    @staticmethod
+    async def maintain_partitions(
+        db: AsyncSession,
+        today: Optional[date] = None
+    ) -> tuple[List[str], List[str]]:
+        """
+        Create upcoming monthly partitions and drop expired ones
+
+        Partitions exist from the current month to PARTITIONS_AHEAD months
+        ahead. Rows that landed in the default partition for a month are
+        moved into it when it is created. Partitions older than
+        AUDIT_LOG_RETENTION_MONTHS are dropped whole, and expired rows
+        deleted from the default partition. Serialized across workers
+        with an advisory lock.
+
+        Args:
+            db: Database session
+            today: Reference date (defaults to today, UTC)
+
+        Returns:
+            Tuple of (created partition names, dropped partition names)
+        """
+        current = _month(today or datetime.utcnow().date())
+        await db.execute(text("SELECT pg_advisory_xact_lock(hashtext('term_audit_logs_partitions'))"))
+        result = await db.execute(text(
+            "SELECT c.relname FROM pg_inherits i"
+            " JOIN pg_class c ON c.oid = i.inhrelid"
+            " WHERE i.inhparent = 'term_audit_logs'::regclass"
+        ))
+        existing = set(result.scalars())
+
+        created = []
+        for offset in range(PARTITIONS_AHEAD + 1):
+            start, end = _month(current, offset), _month(current, offset + 1)
+            name = f"{PARTITION_PREFIX}{start:%Y%m}"
+            if name in existing:
+                continue
+            # A new partition may not overlap rows in the default one: move them over
+            await db.execute(text(
+                "CREATE TEMP TABLE audit_move (LIKE term_audit_logs) ON COMMIT DROP"
+            ))
+            await db.execute(text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION}"
+                f' WHERE "timestamp" >= :start AND "timestamp" < :end RETURNING *)'
+                f" INSERT INTO audit_move SELECT * FROM moved"
+            ), {"start": datetime.combine(start, time()), "end": datetime.combine(end, time())})
+            await db.execute(text(
+                f"CREATE TABLE {name} PARTITION OF term_audit_logs"
+                f" FOR VALUES FROM ('{start}') TO ('{end}')"
+            ))
+            await db.execute(text(f"INSERT INTO {name} SELECT * FROM audit_move"))
+            await db.execute(text("DROP TABLE audit_move"))
+            created.append(name)
+
+        dropped = []
+        if settings.AUDIT_LOG_RETENTION_MONTHS > 0:
+            cutoff = _month(current, -settings.AUDIT_LOG_RETENTION_MONTHS)
+            for name in sorted(existing):
+                if not name.startswith(PARTITION_PREFIX):
+                    continue
+                month = datetime.strptime(name[len(PARTITION_PREFIX):], "%Y%m").date()
+                if month < cutoff:
+                    await db.execute(text(f"DROP TABLE {name}"))
+                    dropped.append(name)
+            await db.execute(
+                text(f'DELETE FROM {DEFAULT_PARTITION} WHERE "timestamp" < :cutoff'),
+                {"cutoff": datetime.combine(cutoff, time())}
+            )
+
+        await db.commit()
+        return created, dropped
@@ -3,8 +3,9 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, or_, and_
 from fastapi import HTTPException, status
+import logging
 import secrets
 
 from app.models.user import User, RefreshToken
@@ -23,6 +24,9 @@ from app.services.user_service import UserService
 from app.services.redis_manager import redis_manager
 
 
+logger = logging.getLogger(__name__)
+
+
 class AuthService:
     """Service for authentication operations"""
     
@@ -182,15 +186,10 @@ class AuthService:
         access_token = create_access_token(data={"sub": str(user.id)})
         refresh_token = create_refresh_token(data={"sub": str(user.id)})
         
-        # Store refresh token in Redis
-        await redis_manager.store_refresh_token(
-            user.id,
-            refresh_token,
-            settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-        
-        # Also store in database for persistence
+        # Store refresh token in the Redis index and, for persistence, the database
         expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        await redis_manager.store_refresh_token(user.id, refresh_token, expires_at)
+        
         db_refresh_token = RefreshToken(
             token=refresh_token,
             user_id=user.id,
@@ -227,31 +226,41 @@ class AuthService:
         
         user_id = int(payload.get("sub"))
         
-        # Verify token exists in Redis (for quick check)
-        is_valid_in_redis = await redis_manager.verify_refresh_token(user_id, refresh_token)
-        
-        # Also check database
-        result = await db.execute(
-            select(RefreshToken).where(
-                RefreshToken.token == refresh_token,
-                RefreshToken.user_id == user_id,
-                RefreshToken.is_revoked == False,
-            )
-        )
-        db_token = result.scalar_one_or_none()
-        
-        if not is_valid_in_redis or not db_token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or revoked refresh token"
-            )
-        
-        # Check expiration
-        if db_token.expires_at < datetime.utcnow():
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Refresh token expired"
+        # Redis index is authoritative for live tokens; the database is only
+        # consulted when Redis doesn't know the token (restart, eviction)
+        try:
+            is_valid_in_redis = await redis_manager.verify_refresh_token(user_id, refresh_token)
+        except Exception as e:
+            logger.warning("Refresh token index unavailable, using database: %s", e)
+            is_valid_in_redis = False
+        
+        if not is_valid_in_redis:
+            result = await db.execute(
+                select(RefreshToken.expires_at).where(
+                    RefreshToken.token == refresh_token,
+                    RefreshToken.user_id == user_id,
+                    RefreshToken.is_revoked == False,
+                )
             )
+            expires_at = result.scalar_one_or_none()
+            
+            if expires_at is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid or revoked refresh token"
+                )
+            
+            if expires_at < datetime.utcnow():
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Refresh token expired"
+                )
+            
+            # Re-seed the index so the next refresh stays in Redis
+            try:
+                await redis_manager.store_refresh_token(user_id, refresh_token, expires_at)
+            except Exception as e:
+                logger.warning("Could not re-index refresh token: %s", e)
         
         # Create new access token
         access_token = create_access_token(data={"sub": str(user_id)})
@@ -337,6 +346,77 @@ class AuthService:
         await db.commit()
         
         # Revoke all refresh tokens for security
-        await redis_manager.revoke_all_user_tokens(user.id)
+        await AuthService.revoke_all_user_tokens(db, user.id)
         
         return {"message": "Password reset successfully"}
+    
+    @staticmethod
+    async def revoke_all_user_tokens(db: AsyncSession, user_id: int) -> None:
+        """
+        Revoke every refresh token of a user
+        
+        The database rows are marked revoked first so the Redis fallback in
+        refresh_access_token can't bring them back; the Redis index is then
+        dropped with a single command.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+        """
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.is_revoked == False)
+            .values(is_revoked=True)
+        )
+        await db.commit()
+        await redis_manager.revoke_all_user_tokens(user_id)
+    
+    @staticmethod
+    async def purge_expired_refresh_tokens(
+        db: AsyncSession,
+        batch_size: int = 1000,
+        revoked_grace_days: int = 1
+    ) -> int:
+        """
+        Delete expired and long-revoked refresh token rows in batches
+        
+        Each batch is its own short transaction and skips rows locked by
+        other workers, so concurrent purges don't block each other or logins.
+        
+        Args:
+            db: Database session
+            batch_size: Rows deleted per transaction
+            revoked_grace_days: Keep revoked rows this long for auditing
+            
+        Returns:
+            Number of rows deleted
+        """
+        now = datetime.utcnow()
+        revoked_before = now - timedelta(days=revoked_grace_days)
+        total = 0
+        
+        while True:
+            batch = (
+                select(RefreshToken.id)
+                .where(
+                    or_(
+                        RefreshToken.expires_at < now,
+                        and_(
+                            RefreshToken.is_revoked == True,
+                            RefreshToken.updated_at < revoked_before,
+                        ),
+                    )
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
@@ -0,0 +1,205 @@
+"""Status tracking and worker-local execution of file import jobs"""
+
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import IO, Awaitable, Generic, Optional, Type, TypeVar
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.services.redis_manager import redis_manager
+
+
+logger = logging.getLogger(__name__)
+
+J = TypeVar("J", bound=BaseModel)
+
+
+class BackgroundJobs(Generic[J]):
+    """
+    Uploaded files imported in the background of the receiving worker
+
+    Requests time out after 20 seconds, so imports run as tasks rather
+    than as response BackgroundTasks. The upload is copied to a private
+    temporary file owned by the job, and the job's status is kept in Redis
+    under ``{key_prefix}:{job_id}`` for JOB_TTL seconds so any worker can
+    report it. Job models need id, status, error, created_at and
+    finished_at fields.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        key_prefix: str,
+        job_model: Type[J],
+        ttl_setting: str,
+        formats: tuple[str, ...],
+        extensions: dict[str, str],
+        noun: str = "import",
+    ):
+        """
+        Args:
+            name: Kind of job, used in log messages (e.g. "Term import")
+            key_prefix: Redis key prefix, also names the temporary files
+            job_model: Pydantic model of the job's status
+            ttl_setting: Name of the setting holding the status TTL
+            formats: Accepted formats, in the order error messages list them
+            extensions: File extension -> format
+            noun: What a file is called in error messages
+        """
+        self.name = name
+        self.key_prefix = key_prefix
+        self.job_model = job_model
+        self.ttl_setting = ttl_setting
+        self.formats = formats
+        self.extensions = extensions
+        self.noun = noun
+        # Used when Redis is not connected (single-process development)
+        self._local_jobs: dict[str, str] = {}
+        # Strong references to running imports (the event loop keeps only weak ones)
+        self.tasks: set[asyncio.Task] = set()
+
+    def detect_format(self, filename: Optional[str], format: Optional[str] = None) -> str:
+        """
+        Resolve the format from an explicit value or the file name
+
+        Args:
+            filename: Uploaded file name (a trailing .gz is ignored)
+            format: Explicit format, overrides the extension
+
+        Returns:
+            One of formats
+        """
+        if format:
+            format = format.lower()
+            if format not in self.formats:
+                raise ValueError(f"Unsupported {self.noun} format '{format}'")
+            return format
+        name = (filename or "").lower()
+        if name.endswith(".gz"):
+            name = name[:-3]
+        detected = self.extensions.get(os.path.splitext(name)[1])
+        if detected is None:
+            choices = ", ".join(self.formats[:-1]) + f" or {self.formats[-1]}"
+            raise ValueError(f"Cannot detect {self.noun} format; pass format={choices}")
+        return detected
+
+    async def save_upload(self, source: IO[bytes]) -> str:
+        """
+        Copy an uploaded file to a private temporary file
+
+        Args:
+            source: Upload's file object
+
+        Returns:
+            Path of the copy; the import job deletes it when done
+        """
+        fd, path = tempfile.mkstemp(prefix=f"{self.key_prefix.replace('_', '-')}-")
+        try:
+            with os.fdopen(fd, "wb") as target:
+                await asyncio.to_thread(shutil.copyfileobj, source, target, 1024 * 1024)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return path
+
+    # Job status
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}"
+
+    async def save_job(self, job: J) -> None:
+        """Store a job's status for its GET endpoint"""
+        payload = job.model_dump_json()
+        if redis_manager.redis is None:
+            self._local_jobs[job.id] = payload
+            return
+        try:
+            await redis_manager.set_value(
+                self._job_key(job.id), payload, expire=getattr(settings, self.ttl_setting)
+            )
+        except Exception as e:
+            # Progress reporting must not fail the import
+            logger.warning("Saving %s job %s failed: %s", self.name.lower(), job.id, e)
+
+    async def get_job(self, job_id: str) -> Optional[J]:
+        """
+        Get an import job's status
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job or None if unknown or expired
+        """
+        if redis_manager.redis is None:
+            payload = self._local_jobs.get(job_id)
+        else:
+            payload = await redis_manager.get_value(self._job_key(job_id))
+        return self.job_model.model_validate_json(payload) if payload else None
+
+    async def create_job(self, **fields) -> J:
+        """
+        Register a queued import job
+
+        Args:
+            **fields: Job fields besides id and created_at
+
+        Returns:
+            The saved job
+        """
+        job = self.job_model(id=uuid4().hex, created_at=datetime.utcnow(), **fields)
+        await self.save_job(job)
+        return job
+
+    # Background execution
+
+    def start(self, job: J, path: str, work: Awaitable) -> None:
+        """
+        Run an import in the background of this worker
+
+        Args:
+            job: Queued job
+            path: Import file, owned by the job from now on and deleted
+                when the import finishes
+            work: The import itself; it fails the job if it raises
+        """
+        task = asyncio.create_task(self._run(job, path, work))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, job: J, path: str, work: Awaitable) -> None:
+        try:
+            await work
+        except asyncio.CancelledError:
+            self._fail(job, "Import interrupted by server shutdown")
+            await self.save_job(job)
+            raise
+        except Exception as e:
+            logger.exception("%s %s failed", self.name, job.id)
+            self._fail(job, str(e))
+            await self.save_job(job)
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _fail(job: J, message: str) -> None:
+        job.status = "failed"
+        job.error = message
+        job.finished_at = datetime.utcnow()
+
+    async def cancel_running(self) -> None:
+        """Stop running imports (at shutdown); they are marked failed"""
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
@@ -0,0 +1,401 @@
+"""Typed Redis cache with pluggable codecs and stampede protection"""
+
+import asyncio
+import json
+import logging
+import random
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional, Type, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+from app.services.redis_manager import RedisManager, redis_manager
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for values the codec can't handle natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return jsonable_encoder(obj)
+
+
+class JsonCodec:
+    """Standard library JSON codec (always available)"""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=_default, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """orjson codec: native datetime/UUID support, several times faster than json"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def encode(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=_default, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec:
+    """msgpack codec: compact binary payloads"""
+
+    name = "msgpack"
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, default=_default, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+CODECS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def get_codec(name: str):
+    """
+    Instantiate a codec by name, falling back to JSON if its library is missing
+
+    Args:
+        name: Codec name (json, orjson, msgpack)
+    """
+    codec_class = CODECS.get(name)
+    if codec_class is None:
+        raise ValueError(f"Unknown cache codec '{name}'")
+    try:
+        return codec_class()
+    except ImportError:
+        logger.warning("Cache codec '%s' is not installed, falling back to json", name)
+        return JsonCodec()
+
+
+# Compare-and-delete so a slow holder never releases someone else's lock
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCache:
+    """
+    Typed read-through cache on top of RedisManager
+
+    Values are stored as ``[fresh_until, value]`` with a Redis TTL of
+    ``ttl + stale_ttl``. A read before ``fresh_until`` is a plain hit; a read
+    in the stale window returns the old value immediately unless the caller
+    wins the per-key lock, in which case it recomputes. Misses are
+    recomputed by a single lock holder while other callers wait for the
+    result (single-flight), so an expiring hot key causes one database query
+    instead of one per concurrent request.
+
+    Invalidation is generation based: a namespace such as
+    ``entries:{dataset_id}`` has a counter that is part of every key built
+    with versioned_key(), so bump() invalidates the whole namespace with a
+    single INCR and the orphaned keys simply age out. Keys can also carry
+    tags for the rare cases that need an explicit purge.
+
+    Redis errors are logged and treated as misses: the cache never fails a
+    request that the database could answer.
+    """
+
+    def __init__(self, manager: RedisManager, codec=None):
+        self.manager = manager
+        self.codec = codec or get_codec(settings.CACHE_CODEC)
+        self.jitter = settings.CACHE_TTL_JITTER
+        self.lock_timeout = settings.CACHE_LOCK_TIMEOUT
+        self.lock_wait = settings.CACHE_LOCK_WAIT
+        self._adapters: dict[Any, TypeAdapter] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @property
+    def redis(self):
+        return self.manager.binary_redis
+
+    def _ttl(self, ttl: int) -> int:
+        """Apply random jitter so keys written together don't expire together"""
+        if not self.jitter:
+            return ttl
+        return max(1, int(ttl * (1 + random.uniform(-self.jitter, self.jitter))))
+
+    def _validate(self, value: Any, type_: Optional[Type[T]]) -> Any:
+        if type_ is None or value is None:
+            return value
+        adapter = self._adapters.get(type_)
+        if adapter is None:
+            adapter = self._adapters[type_] = TypeAdapter(type_)
+        return adapter.validate_python(value)
+
+    async def _read(self, key: str) -> Optional[tuple[float, Any]]:
+        """Fetch and decode an envelope; None on miss or error"""
+        if self.redis is None:
+            return None
+        try:
+            data = await self.redis.get(key)
+            if data is None:
+                return None
+            fresh_until, value = self.codec.decode(data)
+            return fresh_until, value
+        except Exception as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+            return None
+
+    async def get(self, key: str, type_: Optional[Type[T]] = None) -> Optional[T]:
+        """
+        Get a cached value (fresh or stale)
+
+        Args:
+            key: Cache key
+            type_: Optional type to validate the decoded value into
+
+        Returns:
+            Cached value or None
+        """
+        envelope = await self._read(key)
+        if envelope is None:
+            return None
+        return self._validate(envelope[1], type_)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        stale_ttl: int = 0,
+        tags: Iterable[str] = ()
+    ) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Any value the codec can serialize (models, dicts, lists)
+            ttl: Seconds the value is considered fresh (jittered)
+            stale_ttl: Extra seconds the value may be served while being refreshed
+            tags: Tags the key can later be purged by
+        """
+        if self.redis is None:
+            return
+        ttl = self._ttl(ttl)
+        try:
+            payload = self.codec.encode([time.time() + ttl, value])
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(key, payload, ex=ttl + stale_ttl)
+            for tag in tags:
+                pipe.sadd(f"tag:{tag}", key)
+                pipe.expire(f"tag:{tag}", ttl + stale_ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+
+    async def delete(self, *keys: str) -> None:
+        """Delete cached keys"""
+        if self.redis is None or not keys:
+            return
+        try:
+            await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning("Cache delete failed for %s: %s", keys, e)
+
+    async def generation(self, namespace: str) -> int:
+        """
+        Current generation of a namespace (0 if never bumped)
+
+        Args:
+            namespace: Namespace name, e.g. "entries:{dataset_id}"
+        """
+        if self.redis is None:
+            return 0
+        try:
+            value = await self.redis.get(f"gen:{namespace}")
+        except Exception as e:
+            logger.warning("Cache generation read failed for %s: %s", namespace, e)
+            return 0
+        return int(value) if value else 0
+
+    async def versioned_key(self, namespace: str, suffix: str) -> str:
+        """
+        Build a key that is invalidated by bump(namespace)
+
+        Args:
+            namespace: Namespace name
+            suffix: Key-specific part (query parameters, page, ...)
+
+        Returns:
+            Key of the form "{namespace}:v{generation}:{suffix}"
+        """
+        return f"{namespace}:v{await self.generation(namespace)}:{suffix}"
+
+    async def bump(self, *namespaces: str) -> None:
+        """
+        Invalidate every key of the given namespaces (one INCR each, one round-trip)
+
+        Args:
+            namespaces: Namespace names
+        """
+        if self.redis is None or not namespaces:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for namespace in namespaces:
+                pipe.incr(f"gen:{namespace}")
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Cache generation bump failed for %s: %s", namespaces, e)
+
+    async def purge_tag(self, tag: str) -> None:
+        """
+        Delete every key stored with a tag
+
+        Args:
+            tag: Tag name
+        """
+        if self.redis is None:
+            return
+        try:
+            tag_key = f"tag:{tag}"
+            keys = await self.redis.smembers(tag_key)
+            await self.redis.delete(tag_key, *keys)
+        except Exception as e:
+            logger.warning("Cache tag purge failed for %s: %s", tag, e)
+
+    async def _acquire(self, key: str) -> Optional[str]:
+        """Try to take the recompute lock for key; returns its token"""
+        token = secrets.token_hex(8)
+        try:
+            acquired = await self.redis.set(
+                f"lock:{key}", token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+        except Exception as e:
+            logger.warning("Cache lock failed for %s: %s", key, e)
+            return token  # Redis trouble: behave as the only worker
+        return token if acquired else None
+
+    async def _release(self, key: str, token: str) -> None:
+        try:
+            await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except Exception as e:
+            logger.warning("Cache unlock failed for %s: %s", key, e)
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: int,
+        type_: Optional[Type[T]] = None,
+        stale_ttl: int = 0,
+        tags: Iterable[str] = (),
+        negative_ttl: Optional[int] = None,
+    ) -> T:
+        """
+        Return the cached value for key, computing it with loader on a miss
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            ttl: Freshness lifetime in seconds
+            type_: Optional type to validate cached values into
+            stale_ttl: Seconds a stale value may be served during recompute
+            tags: Tags the key can later be purged by
+            negative_ttl: Lifetime of a cached None (defaults to ttl), so
+                lookups of missing rows are cached briefly
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        if self.redis is None:
+            return await loader()
+
+        envelope = await self._read(key)
+        if envelope is not None:
+            fresh_until, value = envelope
+            if fresh_until > time.time():
+                return self._validate(value, type_)
+
+        # Collapse concurrent recomputes inside this worker
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            if envelope is not None:
+                return self._validate(envelope[1], type_)
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                return await loader()  # The computing request went away
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(
+                key, envelope, loader, ttl, type_, stale_ttl, tags, negative_ttl
+            )
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _load(self, key, envelope, loader, ttl, type_, stale_ttl, tags, negative_ttl):
+        token = await self._acquire(key)
+
+        if token is None:
+            if envelope is not None:
+                # Someone else is refreshing: serve stale
+                return self._validate(envelope[1], type_)
+
+            # Cold miss: wait for the holder to publish the value
+            deadline = time.monotonic() + self.lock_wait
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                fresh = await self._read(key)
+                if fresh is not None:
+                    return self._validate(fresh[1], type_)
+            return await loader()
+
+        try:
+            value = await loader()
+            if value is None and negative_ttl is not None:
+                await self.set(key, None, negative_ttl)
+            else:
+                await self.set(key, value, ttl, stale_ttl, tags)
+            return value
+        finally:
+            await self._release(key, token)
+
+
+# Global cache instance
+cache = RedisCache(redis_manager)
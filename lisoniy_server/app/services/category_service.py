@@ -1,14 +1,18 @@
 """Category management service"""
 
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, literal, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.terminology import Category, Term
-from app.schemas.terminology import CategoryCreate, CategoryUpdate
+from app.core.pagination import encode_cursor, decode_cursor
+from app.models.terminology import Category, Term, DeletedTerm
+from app.schemas.terminology import CategoryCreate, CategoryUpdate, CategoryResponse
+from app.services.local_cache import local_cache
 
 
 class CategoryService:
@@ -68,6 +72,35 @@ class CategoryService:
         )
         return list(result.scalars().all())
     
+    @staticmethod
+    @local_cache.cached(
+        lambda db: "categories:all",
+        ttl=7200,
+        type_=List[CategoryResponse]
+    )
+    async def list_categories(db: AsyncSession) -> List[CategoryResponse]:
+        """Get all categories as response models (cached in-process and in Redis)"""
+        categories = await CategoryService.get_all(db)
+        return [CategoryResponse.model_validate(cat) for cat in categories]
+    
+    @staticmethod
+    @local_cache.cached(
+        lambda db, slug: f"category:slug:{slug}",
+        ttl=3600,
+        type_=Optional[UUID]
+    )
+    async def get_id_by_slug(db: AsyncSession, slug: str) -> Optional[UUID]:
+        """Resolve a category slug to its ID (cached in-process and in Redis)"""
+        result = await db.execute(
+            select(Category.id).where(Category.slug == slug)
+        )
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def invalidate_cache(slug: str) -> None:
+        """Invalidate cached category data in every worker"""
+        await local_cache.invalidate("categories:all", f"category:slug:{slug}")
+    
     @staticmethod
     async def update_category(
         db: AsyncSession,
@@ -86,36 +119,74 @@ class CategoryService:
         return category
     
     @staticmethod
-    async def delete_category(db: AsyncSession, category: Category) -> None:
-        """Delete a category (will cascade to terms)"""
+    async def delete_category(db: AsyncSession, category: Category) -> List[str]:
+        """
+        Delete a category (will cascade to terms)
+        
+        The cascade removes the terms' rows, so each gets a tombstone in
+        deleted_terms first for GET /terms/changes to report.
+        
+        Returns:
+            Keywords of the terms deleted with it; their cached details are
+            for the caller to evict once the transaction commits
+        """
+        result = await db.execute(
+            pg_insert(DeletedTerm)
+            .from_select(
+                ["term_id", "keyword", "deleted_at"],
+                select(Term.id, Term.keyword, literal(datetime.utcnow(), DateTime))
+                .where(Term.category_id == category.id)
+            )
+            .on_conflict_do_nothing()
+            .returning(DeletedTerm.keyword)
+        )
+        keywords = list(result.scalars())
         await db.delete(category)
         await db.flush()
+        return keywords
+    
+    @staticmethod
+    async def count_category_terms(db: AsyncSession, category_id: UUID) -> int:
+        """
+        Number of live terms in a category
+        
+        Reads the trigger-maintained categories.term_count column, so no
+        terms are scanned.
+        """
+        result = await db.execute(
+            select(Category.term_count).where(Category.id == category_id)
+        )
+        return result.scalar_one_or_none() or 0
     
     @staticmethod
     async def get_category_terms(
         db: AsyncSession,
         category_id: UUID,
         offset: int = 0,
-        limit: int = 20
-    ) -> tuple[List[Term], int]:
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> tuple[List[Term], Optional[str]]:
         """
-        Get terms in a category with pagination
+        Get a page of terms in a category, newest first
         
+        With a cursor the page starts right after the term it points at
+        (keyset on (created_at, id)), so deep pages cost the same as the
+        first. Without one, offset is used.
+        
+        Args:
+            db: Database session
+            category_id: Category ID
+            offset: Terms to skip (ignored when cursor is given)
+            limit: Page size
+            cursor: next_cursor of the previous page
+            
         Returns:
-            Tuple of (terms list, total count)
+            Tuple of (terms list, cursor of the next page or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        # Get total count
-        count_result = await db.execute(
-            select(Term)
-            .where(
-                Term.category_id == category_id,
-                Term.is_deleted == False
-            )
-        )
-        total = len(list(count_result.scalars().all()))
-        
-        # Get paginated terms
-        result = await db.execute(
+        query = (
             select(Term)
             .where(
                 Term.category_id == category_id,
@@ -126,11 +197,20 @@ class CategoryService:
                 selectinload(Term.category),
                 selectinload(Term.creator)
             )
-            .order_by(Term.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+            .order_by(Term.created_at.desc(), Term.id.desc())
+            .limit(limit + 1)
         )
+        if cursor:
+            created_at, term_id = decode_cursor(cursor)
+            query = query.where(tuple_(Term.created_at, Term.id) < tuple_(created_at, term_id))
+        else:
+            query = query.offset(offset)
         
+        result = await db.execute(query)
         terms = list(result.scalars().all())
         
-        return terms, total
+        next_cursor = None
+        if len(terms) > limit:
+            terms = terms[:limit]
+            next_cursor = encode_cursor(terms[-1].created_at, terms[-1].id)
+        return terms, next_cursor
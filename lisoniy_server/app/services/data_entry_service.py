@@ -3,8 +3,8 @@
 import json
 import hashlib
 from uuid import UUID, uuid4
-from typing import Optional
-from sqlalchemy import select, func, insert
+from typing import Iterable, Optional
+from sqlalchemy import select, func, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
@@ -14,7 +14,9 @@ from app.schemas.dataset import (
     DataEntryUpdate,
     BulkOperationResult
 )
+from app.services.dataset_meta_service import DatasetMetaService, ENTRY_SIZE
 from app.services.redis_manager import redis_manager
+from app.services.cache import cache
 
 
 class DataEntryService:
@@ -32,9 +34,37 @@ class DataEntryService:
         Returns:
             SHA256 hash string (64 characters)
         """
-        # Sort keys for consistent hashing
-        content_str = json.dumps(content, sort_keys=True, ensure_ascii=False)
-        hash_input = f"{dataset_id}{content_str}"
+        return DataEntryService.hash_content_text(
+            dataset_id,
+            DataEntryService.canonical_content(content)
+        )
+    
+    @staticmethod
+    def canonical_content(content: dict) -> str:
+        """
+        Content as JSON with sorted keys, the form that is hashed
+        
+        Args:
+            content: Entry content
+            
+        Returns:
+            JSON text
+        """
+        return json.dumps(content, sort_keys=True, ensure_ascii=False)
+    
+    @staticmethod
+    def hash_content_text(dataset_id: UUID, content_text: str) -> str:
+        """
+        generate_hash_key for content already in canonical_content form
+        
+        Args:
+            dataset_id: Dataset ID
+            content_text: canonical_content of the entry
+            
+        Returns:
+            SHA256 hash string (64 characters)
+        """
+        hash_input = f"{dataset_id}{content_text}"
         return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
     
     @staticmethod
@@ -62,6 +92,20 @@ class DataEntryService:
         """
         await redis_manager.set_value(f"hash:{hash_key}", "1", expire=ttl)
     
+    @staticmethod
+    async def cache_hashes(hash_keys: Iterable[str], ttl: int = 3600):
+        """
+        Cache many hashes in Redis in one round trip
+        
+        Args:
+            hash_keys: Hashes to cache
+            ttl: Time to live in seconds (default 1 hour)
+        """
+        pipe = redis_manager.redis.pipeline(transaction=False)
+        for hash_key in hash_keys:
+            pipe.set(f"hash:{hash_key}", "1", ex=ttl)
+        await pipe.execute()
+    
     @staticmethod
     async def create_entry(
         db: AsyncSession,
@@ -106,6 +150,9 @@ class DataEntryService:
         await db.flush()
         await db.refresh(entry)
         
+        size = await db.scalar(select(ENTRY_SIZE).where(DataEntry.id == entry.id))
+        await DatasetMetaService.adjust_entry_counts(db, [(entry.dataset_id, 1, size)])
+        
         # Cache hash
         await DataEntryService.cache_hash(hash_key)
         
@@ -151,7 +198,7 @@ class DataEntryService:
                     "id": uuid4(),
                     "dataset_id": dataset_id,
                     "content": content,
-                    "metadata": None,
+                    "entry_metadata": None,
                     "hash_key": hash_key,
                     "creator_id": user_id
                 })
@@ -162,14 +209,17 @@ class DataEntryService:
         if insert_data:
             stmt = pg_insert(DataEntry).values(insert_data)
             stmt = stmt.on_conflict_do_nothing(index_elements=['hash_key'])
+            stmt = stmt.returning(ENTRY_SIZE)
             
             result = await db.execute(stmt)
-            created = result.rowcount
+            sizes = result.scalars().all()
+            created = len(sizes)
             skipped = len(insert_data) - created
+            if created:
+                await DatasetMetaService.adjust_entry_counts(db, [(dataset_id, created, sum(sizes))])
             
             # Cache all hashes in Redis
-            for hash_key in hash_keys:
-                await DataEntryService.cache_hash(hash_key)
+            await DataEntryService.cache_hashes(hash_keys)
             
             # Invalidate dataset cache
             await DataEntryService.invalidate_dataset_cache(dataset_id)
@@ -222,8 +272,9 @@ class DataEntryService:
         Returns:
             Tuple of (entries list, total count)
         """
-        # Build cache key
-        cache_key = f"entries:{dataset_id}:{dataset_type}:{offset}:{limit}"
+        # Build cache key (versioned by the dataset's write generation)
+        namespace = f"entries:{dataset_id}" if dataset_id else "entries:all"
+        cache_key = await cache.versioned_key(namespace, f"{dataset_type}:{offset}:{limit}")
         
         # TODO: Re-enable cache after fixing dict/object conversion
         # Try cache
@@ -280,7 +331,12 @@ class DataEntryService:
                 for entry in entries
             ]
         }
-        await redis_manager.set_value(cache_key, cache_data, expire=300)  # 5 min TTL
+        await cache.set(
+            cache_key,
+            cache_data,
+            ttl=300,  # 5 min TTL
+            tags=[f"dataset:{dataset_id}"] if dataset_id else ()
+        )
         
         return entries, total
     
@@ -316,6 +372,8 @@ class DataEntryService:
         
         # Update fields
         if update_data.content is not None:
+            old_size = await db.scalar(select(ENTRY_SIZE).where(DataEntry.id == entry.id))
+            
             # Regenerate hash if content changed
             new_hash = DataEntryService.generate_hash_key(
                 entry.dataset_id,
@@ -331,6 +389,10 @@ class DataEntryService:
         await db.flush()
         await db.refresh(entry)
         
+        if update_data.content is not None:
+            new_size = await db.scalar(select(ENTRY_SIZE).where(DataEntry.id == entry.id))
+            await DatasetMetaService.adjust_entry_counts(db, [(entry.dataset_id, 0, new_size - old_size)])
+        
         # Invalidate cache
         await DataEntryService.invalidate_dataset_cache(entry.dataset_id)
         
@@ -353,19 +415,18 @@ class DataEntryService:
         Returns:
             True if deleted, False if not found/unauthorized
         """
-        # Get entry
-        query = select(DataEntry).where(
-            DataEntry.id == entry_id,
-            DataEntry.creator_id == user_id
+        result = await db.execute(
+            delete(DataEntry)
+            .where(DataEntry.id == entry_id, DataEntry.creator_id == user_id)
+            .returning(DataEntry.dataset_id, ENTRY_SIZE)
         )
-        result = await db.execute(query)
-        entry = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not entry:
+        if not row:
             return False
         
-        dataset_id = entry.dataset_id
-        await db.delete(entry)
+        dataset_id, size = row
+        await DatasetMetaService.adjust_entry_counts(db, [(dataset_id, -1, -size)])
         
         # Invalidate cache
         await DataEntryService.invalidate_dataset_cache(dataset_id)
@@ -393,27 +454,26 @@ class DataEntryService:
         deleted = 0
         errors = []
         
-        # Get entries that belong to the user
-        query = select(DataEntry).where(
-            DataEntry.id.in_(entry_ids),
-            DataEntry.creator_id == user_id
+        # Delete entries that belong to the user
+        result = await db.execute(
+            delete(DataEntry)
+            .where(DataEntry.id.in_(entry_ids), DataEntry.creator_id == user_id)
+            .returning(DataEntry.dataset_id, ENTRY_SIZE)
         )
-        result = await db.execute(query)
-        entries = result.scalars().all()
+        rows = result.all()
         
-        deleted = len(entries)
+        deleted = len(rows)
         not_found = total - deleted
         
         if not_found > 0:
             errors.append(f"{not_found} entries not found or unauthorized")
         
-        # Delete entries and collect dataset IDs for cache invalidation
-        dataset_ids = set()
-        for entry in entries:
-            dataset_ids.add(entry.dataset_id)
-            await db.delete(entry)
+        await DatasetMetaService.adjust_entry_counts(
+            db, [(dataset_id, -1, -size) for dataset_id, size in rows]
+        )
         
         # Invalidate caches
+        dataset_ids = {dataset_id for dataset_id, _ in rows}
         for dataset_id in dataset_ids:
             await DataEntryService.invalidate_dataset_cache(dataset_id)
         
@@ -429,9 +489,24 @@ class DataEntryService:
         """
         Invalidate all cache keys for a dataset
         
+        Bumps the dataset's entry generation (and the cross-dataset one), so
+        cost is constant regardless of how many keys are cached.
+        
         Args:
             dataset_id: Dataset ID
         """
-        pattern = f"entries:{dataset_id}:*"
-        async for key in redis_manager.redis.scan_iter(match=pattern):
-            await redis_manager.delete_key(key)
+        await cache.bump(f"entries:{dataset_id}", "entries:all")
+    
+    @staticmethod
+    async def purge_dataset_cache(dataset_id: UUID):
+        """
+        Explicitly delete every cached page of a dataset
+        
+        Used when a dataset is deleted so its (possibly private) entries
+        don't linger in Redis until their TTL runs out.
+        
+        Args:
+            dataset_id: Dataset ID
+        """
+        await DataEntryService.invalidate_dataset_cache(dataset_id)
+        await cache.purge_tag(f"dataset:{dataset_id}")
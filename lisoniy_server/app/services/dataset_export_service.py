@@ -0,0 +1,592 @@
+"""Dataset exports (JSON array, JSONL, CSV, Parquet, Arrow): streamed, and cached on disk per content version"""
+
+import asyncio
+import csv
+import fcntl
+import gzip
+import hashlib
+import io
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, text, cast, case, func, BigInteger, Boolean, Float, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import replica_router
+from app.models.dataset import Dataset, DataEntry
+from app.models.dataset_meta import DatasetMeta
+
+
+logger = logging.getLogger(__name__)
+
+
+# format -> (file extension, media type)
+EXPORT_FORMATS = {
+    "json": ("json", "application/json"),
+    "jsonl": ("jsonl", "application/x-ndjson"),
+    "csv": ("csv", "text/csv; charset=utf-8"),
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+    "arrow": ("arrow", "application/vnd.apache.arrow.file"),
+}
+
+# Compressed internally (zstd), so they get no gzip variant
+COLUMNAR_FORMATS = {"parquet", "arrow"}
+
+# Columns that lead a columnar export of each dataset type, when present
+TYPE_COLUMNS = {
+    "instruction": ("instruction", "input", "output"),
+    "parallel": ("source_lang", "target_lang", "source_text", "target_text"),
+    "ner": ("tokens", "tags", "entities"),
+    "legal_qa": ("question", "context", "answer"),
+}
+
+# Column that holds entries whose content is not a JSON object
+SCALAR_COLUMN = "content"
+
+EXPORTS_DIR = "exports"
+TMP_PREFIX = ".tmp-"
+
+# Every top-level key used in a dataset (the CSV header)
+_CSV_COLUMNS = text("""
+    SELECT DISTINCT k.key
+    FROM data_entries e,
+    LATERAL (
+        SELECT jsonb_object_keys(e.content) WHERE jsonb_typeof(e.content) = 'object'
+        UNION ALL
+        SELECT :scalar WHERE jsonb_typeof(e.content) <> 'object'
+    ) AS k (key)
+    WHERE e.dataset_id = :dataset_id
+    ORDER BY k.key
+""")
+
+# Per top-level key and JSON type of its values: whether every number is an
+# integer that fits int64 and whether every array holds only strings.
+# Entries that are not objects add SCALAR_COLUMN with the type 'scalar'.
+_COLUMN_TYPES = text("""
+    SELECT k.key, jsonb_typeof(e.content -> k.key) AS type,
+           bool_and((e.content -> k.key)::text ~ '^-?[0-9]{1,18}$')
+               FILTER (WHERE jsonb_typeof(e.content -> k.key) = 'number'),
+           bool_and(NOT jsonb_path_exists(e.content -> k.key, '$[*] ? (@.type() != "string")'))
+               FILTER (WHERE jsonb_typeof(e.content -> k.key) = 'array')
+    FROM data_entries e, LATERAL jsonb_object_keys(e.content) AS k (key)
+    WHERE e.dataset_id = :dataset_id AND jsonb_typeof(e.content) = 'object'
+    GROUP BY 1, 2
+    UNION ALL
+    SELECT :scalar, 'scalar', NULL, NULL
+    WHERE EXISTS (
+        SELECT 1 FROM data_entries WHERE dataset_id = :dataset_id AND jsonb_typeof(content) <> 'object'
+    )
+""")
+
+
+@dataclass
+class ExportArtifact:
+    """A built export on disk: {format}-{version}-{sha256[:32]}.{ext} and its .gz"""
+    path: str
+    gzip_path: Optional[str]  # None for COLUMNAR_FORMATS
+    etag: str
+    gzip_etag: Optional[str]
+
+
+def _dataset_dir(dataset_id: UUID) -> str:
+    return os.path.join(settings.UPLOADS_DIR, EXPORTS_DIR, str(dataset_id))
+
+
+class _ArtifactWriter:
+    """Writes an export and its gzip variant in one pass (blocking; runs in a thread)"""
+
+    def __init__(self, path: str, compress: bool = True):
+        self.path = path
+        self.gzip_path = path + ".gz" if compress else None
+        self.digest = hashlib.sha256()
+        self.file = open(path, "wb")
+        # mtime=0: the same content always compresses to the same bytes
+        self.gzip = gzip.GzipFile(self.gzip_path, "wb", compresslevel=6, mtime=0) if compress else None
+
+    def write(self, data: bytes) -> None:
+        self.digest.update(data)
+        self.file.write(data)
+        if self.gzip is not None:
+            self.gzip.write(data)
+
+    def close(self) -> str:
+        """Finish the files; returns the export's sha256"""
+        self.file.close()
+        if self.gzip is not None:
+            self.gzip.close()
+        return self.digest.hexdigest()
+
+    def abort(self) -> None:
+        self.file.close()
+        if self.gzip is not None:
+            self.gzip.close()
+        for path in (self.path, self.gzip_path):
+            if path is not None and os.path.exists(path):
+                os.unlink(path)
+
+
+class _ChunkSink:
+    """File-like object collecting what pyarrow writes, drained after every row group"""
+
+    closed = False
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+class _ColumnarEncoder:
+    """Encodes rows as Parquet or Arrow IPC, zstd compressed (blocking; runs in a thread)"""
+
+    def __init__(self, fmt: str, columns: Sequence[Tuple[str, str]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        types = {
+            "string": pa.string(),
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "bool": pa.bool_(),
+            "list": pa.list_(pa.string()),
+        }
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        self.sink = _ChunkSink()
+        if fmt == "parquet":
+            self.writer = pq.ParquetWriter(self.sink, self.schema, compression="zstd")
+        else:
+            self.writer = pa.ipc.new_file(
+                self.sink, self.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")
+            )
+
+    def write(self, rows: Sequence[Sequence]) -> bytes:
+        """Write rows as one row group (record batch); returns the bytes produced"""
+        arrays = [
+            self.pa.array(values, type=field.type)
+            for values, field in zip(zip(*rows), self.schema)
+        ]
+        self.writer.write_batch(self.pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        """Finish the file (the footer); returns the remaining bytes"""
+        self.writer.close()
+        return self.sink.drain()
+
+
+def _csv_cell(column: str):
+    """
+    A column's cell, extracted by the database
+
+    ->> yields strings as they are, other values as JSON and NULL (an
+    empty cell) for missing keys. Entries that are not objects go whole
+    into SCALAR_COLUMN.
+    """
+    if column != SCALAR_COLUMN:
+        return DataEntry.content[column].astext
+    return case(
+        (func.jsonb_typeof(DataEntry.content) == "object", DataEntry.content[column].astext),
+        else_=DataEntry.content.op("#>>", return_type=Text)(text("'{}'"))
+    )
+
+
+def _columnar_column(column: str, types: set, integral: bool, string_items: bool):
+    """
+    A column's Arrow type and its value, extracted by the database
+
+    Numbers become int64 (or float64 unless all are integers), booleans
+    bool and arrays of strings list<string>. Anything else, including
+    keys whose values mix types, is a string column holding what CSV
+    would (strings as they are, other values as JSON).
+    """
+    value = DataEntry.content[column]
+    if types == {"number"}:
+        if integral:
+            return "int64", cast(value.astext, BigInteger)
+        return "float64", cast(value.astext, Float)
+    if types == {"boolean"}:
+        return "bool", cast(value.astext, Boolean)
+    if types == {"array"} and string_items:
+        is_array = func.jsonb_typeof(value) == "array"
+        # The subquery is not skipped by the CASE; it must not see nulls either
+        items = (
+            select(func.jsonb_array_elements_text(case((is_array, value))))
+            .correlate(DataEntry)
+            .scalar_subquery()
+        )
+        return "list", case((is_array, func.array(items, type_=ARRAY(Text))))
+    return "string", _csv_cell(column)
+
+
+class DatasetExportService:
+    """Service for exporting dataset entries"""
+
+    @staticmethod
+    async def csv_columns(db: AsyncSession, dataset_id: UUID) -> List[str]:
+        """
+        Union of the top-level keys of a dataset's entries, sorted
+
+        Args:
+            db: Database session
+            dataset_id: Dataset ID
+
+        Returns:
+            Column names for a CSV export
+        """
+        result = await db.execute(_CSV_COLUMNS, {"dataset_id": dataset_id, "scalar": SCALAR_COLUMN})
+        return list(result.scalars())
+
+    @staticmethod
+    async def columnar_columns(
+        db: AsyncSession,
+        dataset_id: UUID,
+        dataset_type: Optional[str] = None
+    ) -> List[Tuple[str, str, object]]:
+        """
+        Infer a dataset's schema for Parquet and Arrow exports
+
+        Every top-level key of the entries is a column, typed from the JSON
+        values stored under it. The usual fields of the dataset type
+        (TYPE_COLUMNS) come first, the other keys follow alphabetically.
+
+        Args:
+            db: Database session
+            dataset_id: Dataset ID
+            dataset_type: Dataset type (instruction, parallel, ner, legal_qa)
+
+        Returns:
+            (name, Arrow type, SQL expression) for each column
+        """
+        result = await db.execute(_COLUMN_TYPES, {"dataset_id": dataset_id, "scalar": SCALAR_COLUMN})
+        found = {}
+        for key, json_type, integral, string_items in result:
+            types, all_integral, all_string_items = found.get(key, (set(), True, True))
+            if json_type != "null":
+                types.add(json_type)
+            found[key] = (
+                types,
+                all_integral and integral is not False,
+                all_string_items and string_items is not False,
+            )
+
+        leading = [key for key in TYPE_COLUMNS.get(dataset_type, ()) if key in found]
+        columns = []
+        for key in leading + sorted(set(found) - set(leading)):
+            kind, value = _columnar_column(key, *found[key])
+            columns.append((key, kind, value))
+        return columns
+
+    @staticmethod
+    async def iter_export(db: AsyncSession, dataset_id: UUID, fmt: str) -> AsyncIterator[bytes]:
+        """
+        Encode a dataset's entries chunk by chunk
+
+        Entries are read in creation order through a server-side cursor,
+        DATASET_EXPORT_BATCH_SIZE rows per round trip, and one chunk is
+        yielded per batch, so memory use does not grow with the dataset.
+        JSON and JSONL pass the stored jsonb text through, and CSV cells are
+        extracted by the database, so entries are never decoded here. The
+        whole export (and the CSV header scan) reads one snapshot.
+
+        Args:
+            db: Database session with no transaction in progress; it is
+                rolled back when the export ends
+            dataset_id: Dataset ID
+            fmt: One of EXPORT_FORMATS
+
+        Yields:
+            UTF-8 encoded chunks of the file
+        """
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        try:
+            async for chunk in DatasetExportService._encode(db, dataset_id, fmt):
+                yield chunk
+        finally:
+            await db.rollback()
+
+    @staticmethod
+    async def _encode(db: AsyncSession, dataset_id: UUID, fmt: str) -> AsyncIterator[bytes]:
+        """iter_export within the caller's (REPEATABLE READ) transaction"""
+        if fmt in COLUMNAR_FORMATS:
+            async for chunk in DatasetExportService._encode_columnar(db, dataset_id, fmt):
+                yield chunk
+            return
+
+        values = [cast(DataEntry.content, Text)]
+        if fmt == "csv":
+            columns = await DatasetExportService.csv_columns(db, dataset_id)
+            if not columns:
+                return
+            values = [_csv_cell(column) for column in columns]
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue().encode()
+        elif fmt == "json":
+            yield b"["
+
+        result = await db.stream(
+            select(*values)
+            .where(DataEntry.dataset_id == dataset_id)
+            .order_by(DataEntry.created_at, DataEntry.id)
+            .execution_options(yield_per=settings.DATASET_EXPORT_BATCH_SIZE)
+        )
+        first = True
+        async for rows in result.partitions():
+            if fmt == "jsonl":
+                yield "".join(f"{row[0]}\n" for row in rows).encode()
+            elif fmt == "json":
+                chunk = ",\n".join(row[0] for row in rows)
+                yield (("\n" if first else ",\n") + chunk).encode()
+            else:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(rows)
+                yield buffer.getvalue().encode()
+            first = False
+
+        if fmt == "json":
+            yield b"\n]\n"
+
+    @staticmethod
+    async def _encode_columnar(db: AsyncSession, dataset_id: UUID, fmt: str) -> AsyncIterator[bytes]:
+        """
+        _encode for COLUMNAR_FORMATS
+
+        Batches are gathered into row groups of DATASET_EXPORT_ROW_GROUP_SIZE
+        entries, and each group is encoded in a thread while the next one
+        is fetched.
+        """
+        dataset_type = await db.scalar(select(Dataset.type).where(Dataset.id == dataset_id))
+        columns = await DatasetExportService.columnar_columns(db, dataset_id, dataset_type)
+        encoder = await asyncio.to_thread(
+            _ColumnarEncoder, fmt, [(name, kind) for name, kind, _ in columns]
+        )
+        encoding = None
+        try:
+            if columns:
+                result = await db.stream(
+                    select(*[value for _, _, value in columns])
+                    .where(DataEntry.dataset_id == dataset_id)
+                    .order_by(DataEntry.created_at, DataEntry.id)
+                    .execution_options(yield_per=settings.DATASET_EXPORT_BATCH_SIZE)
+                )
+                group = []
+                async for rows in result.partitions():
+                    group.extend(rows)
+                    if len(group) < settings.DATASET_EXPORT_ROW_GROUP_SIZE:
+                        continue
+                    if encoding is not None:
+                        yield await encoding
+                    encoding = asyncio.ensure_future(asyncio.to_thread(encoder.write, group))
+                    group = []
+                if encoding is not None:
+                    yield await encoding
+                    encoding = None
+                if group:
+                    yield await asyncio.to_thread(encoder.write, group)
+            yield await asyncio.to_thread(encoder.close)
+        finally:
+            if encoding is not None and not encoding.done():
+                await asyncio.wait([encoding])
+
+    @staticmethod
+    async def stream_export(dataset_id: UUID, fmt: str) -> AsyncIterator[bytes]:
+        """
+        iter_export on a read-only session of its own
+
+        A response body outlives the request's session, so the stream
+        opens (and closes) its own, on the replica when one is healthy.
+        """
+        async with replica_router.session() as db:
+            async for chunk in DatasetExportService.iter_export(db, dataset_id, fmt):
+                yield chunk
+
+    # Cached artifacts
+
+    # Strong references to running builds (the event loop keeps only weak ones)
+    _tasks: set[asyncio.Task] = set()
+    # (dataset_id, format) pairs being built by this worker
+    _building: set = set()
+
+    @staticmethod
+    def find_artifact(dataset_id: UUID, fmt: str, version: int) -> Optional[ExportArtifact]:
+        """
+        Look up the built export of a dataset version
+
+        Args:
+            dataset_id: Dataset ID
+            fmt: One of EXPORT_FORMATS
+            version: The dataset's content_version
+
+        Returns:
+            The artifact, or None if that version has not been built
+        """
+        directory = _dataset_dir(dataset_id)
+        prefix = f"{fmt}-{version}-"
+        suffix = "." + EXPORT_FORMATS[fmt][0]
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return None
+        for name in names:
+            if name.startswith(prefix) and name.endswith(suffix):
+                sha = name[len(prefix):-len(suffix)]
+                path = os.path.join(directory, name)
+                if fmt in COLUMNAR_FORMATS:
+                    return ExportArtifact(path=path, gzip_path=None, etag=f'"{sha}"', gzip_etag=None)
+                return ExportArtifact(
+                    path=path,
+                    gzip_path=path + ".gz",
+                    etag=f'"{sha}"',
+                    gzip_etag=f'"{sha}-gzip"',
+                )
+        return None
+
+    @staticmethod
+    async def build_artifact(db: AsyncSession, dataset_id: UUID, fmt: str) -> Optional[ExportArtifact]:
+        """
+        Write the export of a dataset's current content version to disk
+
+        The version and the entries are read in one REPEATABLE READ
+        transaction, so the file always matches its version. Chunks are
+        written (and gzipped, except COLUMNAR_FORMATS) in a thread while the
+        next batch is fetched. Files are published by renaming, the gzip
+        variant first, and other versions of the format are then deleted
+        (open downloads keep reading them).
+
+        Args:
+            db: Database session with no transaction in progress
+            dataset_id: Dataset ID
+            fmt: One of EXPORT_FORMATS
+
+        Returns:
+            The artifact, or None if the dataset does not exist
+        """
+        directory = _dataset_dir(dataset_id)
+        os.makedirs(directory, exist_ok=True)
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        try:
+            version = await db.scalar(
+                select(DatasetMeta.content_version).where(DatasetMeta.dataset_id == dataset_id)
+            )
+            if version is None:
+                return None
+            artifact = DatasetExportService.find_artifact(dataset_id, fmt, version)
+            if artifact is not None:
+                return artifact
+
+            writer = await asyncio.to_thread(
+                _ArtifactWriter,
+                os.path.join(directory, f"{TMP_PREFIX}{uuid4().hex}"),
+                fmt not in COLUMNAR_FORMATS
+            )
+            pending = None
+            try:
+                async for chunk in DatasetExportService._encode(db, dataset_id, fmt):
+                    if pending is not None:
+                        await pending
+                    pending = asyncio.ensure_future(asyncio.to_thread(writer.write, chunk))
+                if pending is not None:
+                    await pending
+                sha = await asyncio.to_thread(writer.close)
+            except BaseException:
+                if pending is not None and not pending.done():
+                    await asyncio.wait([pending])
+                writer.abort()
+                raise
+        finally:
+            await db.rollback()
+
+        name = f"{fmt}-{version}-{sha[:32]}.{EXPORT_FORMATS[fmt][0]}"
+        path = os.path.join(directory, name)
+        if writer.gzip_path is not None:
+            os.replace(writer.gzip_path, path + ".gz")
+        os.replace(writer.path, path)
+        for other in os.listdir(directory):
+            if other.startswith(f"{fmt}-") and not other.startswith(name):
+                os.unlink(os.path.join(directory, other))
+        return DatasetExportService.find_artifact(dataset_id, fmt, version)
+
+    @staticmethod
+    async def refresh_artifact(dataset_id: UUID, fmt: str) -> Optional[ExportArtifact]:
+        """
+        build_artifact on a read-only session of its own
+
+        One process per dataset and format builds at a time; the others
+        skip (and return None).
+        """
+        directory = _dataset_dir(dataset_id)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f".{fmt}.lock"), "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None  # Another worker is building it
+            async with replica_router.session() as db:
+                return await DatasetExportService.build_artifact(db, dataset_id, fmt)
+
+    @staticmethod
+    def schedule_build(dataset_id: UUID, fmt: str) -> None:
+        """
+        Build an artifact in the background of this worker
+
+        Does nothing if this worker is already building it.
+        """
+        key = (dataset_id, fmt)
+        if key in DatasetExportService._building:
+            return
+        DatasetExportService._building.add(key)
+        task = asyncio.create_task(DatasetExportService._run_build(dataset_id, fmt))
+        DatasetExportService._tasks.add(task)
+        task.add_done_callback(DatasetExportService._tasks.discard)
+
+    @staticmethod
+    async def _run_build(dataset_id: UUID, fmt: str) -> None:
+        try:
+            await DatasetExportService.refresh_artifact(dataset_id, fmt)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Export of dataset %s as %s failed", dataset_id, fmt)
+        finally:
+            DatasetExportService._building.discard((dataset_id, fmt))
+
+    @staticmethod
+    async def cancel_running() -> None:
+        """Stop running builds (at shutdown); their temporary files are removed"""
+        tasks = list(DatasetExportService._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    @staticmethod
+    def purge(dataset_id: UUID) -> None:
+        """Delete every artifact of a dataset (when it is deleted)"""
+        shutil.rmtree(_dataset_dir(dataset_id), ignore_errors=True)
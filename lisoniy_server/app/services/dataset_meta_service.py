@@ -1,12 +1,13 @@
 """Service layer for dataset metadata and user interactions"""
 
-import json
-from typing import Optional, Tuple, List
+from collections import defaultdict
+from typing import Iterable, Optional, Tuple, List
 from uuid import UUID
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update, delete
+from sqlalchemy import select, func, update, delete, cast, text, Text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from app.models.dataset import Dataset, DataEntry
@@ -15,6 +16,33 @@ from app.models.user import User
 from app.schemas.dataset_meta import DatasetMetaUpdate
 
 
+# Bytes an entry adds to size_bytes: its content in stored (jsonb text) form
+ENTRY_SIZE = func.octet_length(cast(DataEntry.content, Text))
+
+# Datasets whose counts are checked per reconciliation transaction
+RECONCILE_BATCH = 100
+
+# Meta rows for datasets that have none (datasets created before meta rows
+# were made with the dataset), holding their entries as counted now minus
+# the writing transaction's own deltas. A concurrent writer's row wins the
+# conflict and the caller's delta is then applied on top of it.
+_SEED_MISSING_META = text("""
+    INSERT INTO dataset_meta (dataset_id, stars_count, downloads_count, views_count,
+        entry_count, size_bytes, content_version, created_at, updated_at)
+    SELECT c.dataset_id, 0, 0, 0,
+        (SELECT count(*) FROM data_entries e WHERE e.dataset_id = c.dataset_id) - c.entries,
+        (SELECT coalesce(sum(octet_length(e.content::text)), 0)
+         FROM data_entries e WHERE e.dataset_id = c.dataset_id) - c.size,
+        0, now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+    FROM unnest(CAST(:dataset_ids AS uuid[]), CAST(:entries AS bigint[]), CAST(:sizes AS bigint[]))
+        AS c(dataset_id, entries, size)
+    WHERE EXISTS (SELECT 1 FROM datasets d WHERE d.id = c.dataset_id)
+        AND NOT EXISTS (SELECT 1 FROM dataset_meta m WHERE m.dataset_id = c.dataset_id)
+    ORDER BY c.dataset_id
+    ON CONFLICT (dataset_id) DO NOTHING
+""")
+
+
 class DatasetMetaService:
     """Service for managing dataset metadata and interactions"""
     
@@ -35,6 +63,33 @@ class DatasetMetaService:
         await db.flush()
         return meta
     
+    @staticmethod
+    async def seed_missing(
+        db: AsyncSession,
+        changes: Iterable[Tuple[UUID, int, int]]
+    ) -> int:
+        """
+        Create the meta rows that are missing, with the datasets' real counts
+        
+        Args:
+            db: Database session
+            changes: (dataset_id, entries delta, bytes delta) tuples of the
+                entry writes made in this transaction, not yet counted on
+                dataset_meta; (dataset_id, 0, 0) outside entry writes
+            
+        Returns:
+            Number of meta rows created
+        """
+        changes = sorted(changes)
+        if not changes:
+            return 0
+        result = await db.execute(_SEED_MISSING_META, {
+            "dataset_ids": [dataset_id for dataset_id, _, _ in changes],
+            "entries": [entries for _, entries, _ in changes],
+            "sizes": [size for _, _, size in changes],
+        })
+        return result.rowcount
+    
     @staticmethod
     async def get_meta(db: AsyncSession, dataset_id: UUID) -> Optional[DatasetMeta]:
         """
@@ -75,7 +130,10 @@ class DatasetMetaService:
         
         # Auto-create meta if it doesn't exist
         if not meta:
-            meta = await DatasetMetaService.create_meta(db, dataset_id)
+            await DatasetMetaService.seed_missing(db, [(dataset_id, 0, 0)])
+            meta = await DatasetMetaService.get_meta(db, dataset_id)
+            if not meta:
+                return None
         
         update_dict = update_data.model_dump(exclude_unset=True)
         for field, value in update_dict.items():
@@ -101,10 +159,14 @@ class DatasetMetaService:
             .values(views_count=func.coalesce(DatasetMeta.views_count, 0) + 1)
         )
         
-        # If no meta record found, create one
+        # If no meta record found, create one with the real entry counts
         if result.rowcount == 0:
-            meta = DatasetMeta(dataset_id=dataset_id, views_count=1)
-            db.add(meta)
+            await DatasetMetaService.seed_missing(db, [(dataset_id, 0, 0)])
+            await db.execute(
+                update(DatasetMeta)
+                .where(DatasetMeta.dataset_id == dataset_id)
+                .values(views_count=DatasetMeta.views_count + 1)
+            )
         
         await db.flush()
 
@@ -251,10 +313,14 @@ class DatasetMetaService:
             .values(downloads_count=func.coalesce(DatasetMeta.downloads_count, 0) + 1)
         )
         
-        # If no meta record found, create one
+        # If no meta record found, create one with the real entry counts
         if result.rowcount == 0:
-            meta = DatasetMeta(dataset_id=dataset_id, downloads_count=1)
-            db.add(meta)
+            await DatasetMetaService.seed_missing(db, [(dataset_id, 0, 0)])
+            await db.execute(
+                update(DatasetMeta)
+                .where(DatasetMeta.dataset_id == dataset_id)
+                .values(downloads_count=DatasetMeta.downloads_count + 1)
+            )
             
         await db.flush()
     
@@ -270,18 +336,10 @@ class DatasetMetaService:
         Returns:
             Total size in bytes
         """
-        result = await db.execute(
-            select(DataEntry.content).where(DataEntry.dataset_id == dataset_id)
+        total_size = await db.scalar(
+            select(func.coalesce(func.sum(ENTRY_SIZE), 0)).where(DataEntry.dataset_id == dataset_id)
         )
-        entries = result.scalars().all()
-        
-        total_size = 0
-        for content in entries:
-            # Calculate size of JSON content
-            if content:
-                total_size += len(json.dumps(content))
-        
-        return total_size
+        return int(total_size)
     
     @staticmethod
     async def update_size(db: AsyncSession, dataset_id: UUID) -> int:
@@ -306,6 +364,108 @@ class DatasetMetaService:
         
         return size
     
+    @staticmethod
+    async def adjust_entry_counts(
+        db: AsyncSession,
+        changes: Iterable[Tuple[UUID, int, int]]
+    ) -> None:
+        """
+        Apply entry count and size deltas in the caller's transaction
+        
+        Every dataset listed also gets its content_version bumped, so only
+        pass datasets whose entries actually changed. A missing meta row is
+        created from the dataset's real counts first. The meta rows stay
+        locked until the transaction ends, so concurrent writers to a
+        dataset serialize on them. Rows are locked in dataset_id order to
+        avoid deadlocks between multi-dataset writes.
+        
+        Args:
+            db: Database session with the transaction that wrote the entries
+            changes: (dataset_id, entries delta, bytes delta) tuples
+        """
+        totals = defaultdict(lambda: [0, 0])
+        for dataset_id, entries, size in changes:
+            totals[dataset_id][0] += entries
+            totals[dataset_id][1] += size
+        rows = [
+            {"dataset_id": dataset_id, "entry_count": entries, "size_bytes": size, "content_version": 1}
+            for dataset_id, (entries, size) in sorted(totals.items())
+        ]
+        if not rows:
+            return
+        
+        await DatasetMetaService.seed_missing(
+            db, [(row["dataset_id"], row["entry_count"], row["size_bytes"]) for row in rows]
+        )
+        stmt = pg_insert(DatasetMeta).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DatasetMeta.dataset_id],
+            set_={
+                "entry_count": DatasetMeta.entry_count + stmt.excluded.entry_count,
+                "size_bytes": DatasetMeta.size_bytes + stmt.excluded.size_bytes,
+                "content_version": DatasetMeta.content_version + 1,
+            }
+        )
+        await db.execute(stmt)
+    
+    @staticmethod
+    async def reconcile_entry_counts(db: AsyncSession) -> int:
+        """
+        Recount entry_count and size_bytes of every dataset and fix drift
+        
+        Works through RECONCILE_BATCH datasets per transaction, creating
+        the meta rows that are missing. The rows are locked before their
+        entries are counted, so writes that commit later apply their deltas
+        on top of the recount and none are lost.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Number of datasets whose counts were corrected or created
+        """
+        fixed = 0
+        last_id = None
+        while True:
+            query = select(Dataset.id).order_by(Dataset.id).limit(RECONCILE_BATCH)
+            if last_id is not None:
+                query = query.where(Dataset.id > last_id)
+            dataset_ids = list((await db.execute(query)).scalars())
+            if not dataset_ids:
+                break
+            
+            fixed += await DatasetMetaService.seed_missing(db, [(dataset_id, 0, 0) for dataset_id in dataset_ids])
+            result = await db.execute(
+                select(DatasetMeta.dataset_id, DatasetMeta.entry_count, DatasetMeta.size_bytes)
+                .where(DatasetMeta.dataset_id.in_(dataset_ids))
+                .order_by(DatasetMeta.dataset_id)
+                .with_for_update()
+            )
+            stored = {row[0]: (row[1], row[2]) for row in result}
+            
+            # A new statement sees everything committed before the locks were taken
+            result = await db.execute(
+                select(DataEntry.dataset_id, func.count(), func.coalesce(func.sum(ENTRY_SIZE), 0))
+                .where(DataEntry.dataset_id.in_(stored))
+                .group_by(DataEntry.dataset_id)
+            )
+            actual = {row[0]: (row[1], int(row[2])) for row in result}
+            
+            for dataset_id, counts in stored.items():
+                expected = actual.get(dataset_id, (0, 0))
+                if counts != expected:
+                    await db.execute(
+                        update(DatasetMeta)
+                        .where(DatasetMeta.dataset_id == dataset_id)
+                        .values(entry_count=expected[0], size_bytes=expected[1])
+                    )
+                    fixed += 1
+            
+            await db.commit()
+            last_id = dataset_ids[-1]
+        
+        return fixed
+    
     @staticmethod
     async def add_contributor(db: AsyncSession, dataset_id: UUID, user_id: int) -> DatasetContributor:
         """
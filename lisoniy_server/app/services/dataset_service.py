@@ -60,7 +60,7 @@ class DatasetService:
         Args:
             db: Database session
             dataset_id: Dataset ID
-            include_entry_count: Whether to include entry count
+            include_entry_count: Whether to include entry count (needs the meta row)
             include_meta: Whether to include metadata
             
         Returns:
@@ -69,20 +69,11 @@ class DatasetService:
         from sqlalchemy.orm import selectinload
         query = select(Dataset).where(Dataset.id == dataset_id)
         
-        if include_meta:
+        if include_meta or include_entry_count:
             query = query.options(selectinload(Dataset.meta))
             
         result = await db.execute(query)
-        dataset = result.scalar_one_or_none()
-        
-        if dataset and include_entry_count:
-            # Get entry count
-            from app.models.dataset import DataEntry
-            count_query = select(func.count()).where(DataEntry.dataset_id == dataset_id)
-            count = await db.scalar(count_query)
-            dataset.entry_count = count
-        
-        return dataset
+        return result.scalar_one_or_none()
     
     @staticmethod
     async def get_user_datasets(
@@ -119,13 +110,6 @@ class DatasetService:
         result = await db.execute(query)
         datasets = result.scalars().all()
         
-        # Get entry counts for each dataset
-        from app.models.dataset import DataEntry
-        for dataset in datasets:
-            count_query = select(func.count()).where(DataEntry.dataset_id == dataset.id)
-            count = await db.scalar(count_query)
-            dataset.entry_count = count
-        
         return datasets, total
     
     @staticmethod
@@ -175,17 +159,11 @@ class DatasetService:
                 Dataset.created_at.desc()
             )
         elif sort_by == "largest":
-            # Sort by entry count (we already calculate this, but for order_by we might need a join or subquery)
-            # For simplicity, we'll use a subquery or join with entry counts if possible, 
-            # but usually entry_count is a business logic field. 
-            # In our case, we calculate it later. Let's do a join with func.count of DataEntry.
-            from app.models.dataset import DataEntry
-            query = (
-                select(Dataset)
-                .outerjoin(DataEntry, Dataset.id == DataEntry.dataset_id)
-                .where(*filters)
-                .group_by(Dataset.id)
-                .order_by(func.count(DataEntry.id).desc(), Dataset.created_at.desc())
+            # Sort by the maintained entry count
+            query = query.outerjoin(DatasetMeta, Dataset.id == DatasetMeta.dataset_id)
+            query = query.order_by(
+                func.coalesce(DatasetMeta.entry_count, 0).desc(),
+                Dataset.created_at.desc()
             )
         else: # Default: new
             query = query.order_by(Dataset.created_at.desc())
@@ -196,13 +174,6 @@ class DatasetService:
         result = await db.execute(query)
         datasets = result.scalars().all()
         
-        # Get entry counts for each dataset (to populate the field)
-        from app.models.dataset import DataEntry
-        for dataset in datasets:
-            count_query = select(func.count()).where(DataEntry.dataset_id == dataset.id)
-            count = await db.scalar(count_query)
-            dataset.entry_count = count
-        
         return datasets, total
     
     @staticmethod
@@ -224,11 +195,13 @@ class DatasetService:
         Returns:
             Updated dataset or None if not found/unauthorized
         """
-        # Get dataset
+        from sqlalchemy.orm import selectinload
+        
+        # Get dataset (with meta, for the entry count)
         query = select(Dataset).where(
             Dataset.id == dataset_id,
             Dataset.creator_id == user_id
-        )
+        ).options(selectinload(Dataset.meta))
         result = await db.execute(query)
         dataset = result.scalar_one_or_none()
         
@@ -346,11 +319,4 @@ class DatasetService:
         result = await db.execute(query)
         datasets = result.scalars().all()
         
-        # Get entry counts
-        from app.models.dataset import DataEntry
-        for dataset in datasets:
-            count_query = select(func.count()).where(DataEntry.dataset_id == dataset.id)
-            count = await db.scalar(count_query)
-            dataset.entry_count = count
-        
         return datasets, total
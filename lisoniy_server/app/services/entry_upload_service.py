@@ -0,0 +1,613 @@
+"""Streaming dataset entry ingestion from JSONL, CSV, CoNLL, TMX and TSV files"""
+
+import asyncio
+import csv
+import gzip
+import io
+import logging
+import time
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime
+from itertools import islice
+from typing import IO, Awaitable, Callable, Iterator, Optional, Union
+from uuid import UUID
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.db.session import engine
+from app.schemas.dataset import EntryImportJob, EntryUploadChunk, EntryUploadResult
+from app.services.background_jobs import BackgroundJobs
+from app.services.data_entry_service import DataEntryService
+from app.services.dataset_meta_service import DatasetMetaService
+
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_FORMATS = ("jsonl", "csv", "conll", "tmx", "tsv")
+_EXTENSIONS = {
+    ".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv",
+    ".conll": "conll", ".tmx": "tmx", ".tsv": "tsv",
+}
+
+# Formats that produce the content shape of one dataset type; JSONL and
+# CSV carry the content as is and fit any type
+FORMAT_TYPES = {"conll": "ner", "tmx": "parallel", "tsv": "parallel"}
+
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# Staged rows: one chunk of prepared entries at a time
+STAGE_TABLE = "entry_upload_stage"
+STAGE_COLUMNS = ("ordinal", "hash_key", "content")
+
+_CREATE_STAGE = text(f"""
+    CREATE TEMPORARY TABLE {STAGE_TABLE} (
+        ordinal integer NOT NULL,
+        hash_key varchar(64) NOT NULL,
+        content jsonb NOT NULL
+    )
+""")
+
+# Entries are stamped a microsecond apart, so exports (ordered by
+# created_at) keep the file's order
+_MERGE_CHUNK = text(f"""
+    WITH inserted AS (
+        INSERT INTO data_entries (id, dataset_id, content, hash_key, creator_id, created_at, updated_at)
+        SELECT gen_random_uuid(), CAST(:dataset_id AS uuid), s.content, s.hash_key,
+            CAST(:user_id AS integer), now() + s.ordinal * interval '1 microsecond', now()
+        FROM {STAGE_TABLE} s
+        ORDER BY s.ordinal
+        ON CONFLICT (hash_key) DO NOTHING
+        RETURNING octet_length(content::text) AS size
+    )
+    SELECT count(*), coalesce(sum(size), 0) FROM inserted
+""")
+
+# (line, hash_key, canonical content)
+PreparedEntry = tuple[int, str, str]
+
+
+class EntryRowError(ValueError):
+    """A line that cannot be imported; the rest of the file still is"""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(message)
+        self.line = line
+
+
+# Parsers take the languages of a parallel corpus, which only TMX and TSV use
+ParsedRows = Iterator[Union[tuple[int, dict], EntryRowError]]
+
+
+def _parse_jsonl(stream: IO[bytes], source_language: Optional[str], target_language: Optional[str]) -> ParsedRows:
+    """One entry's content (a JSON object) per line"""
+    for line, raw in enumerate(stream, start=1):
+        if line == 1:
+            raw = raw.removeprefix(b"\xef\xbb\xbf")
+        if not raw.strip():
+            continue
+        try:
+            content = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            yield EntryRowError(line, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(content, dict) or not content:
+            yield EntryRowError(line, "Expected a non-empty JSON object")
+            continue
+        yield line, content
+
+
+def _parse_csv(stream: IO[bytes], source_language: Optional[str], target_language: Optional[str]) -> ParsedRows:
+    """
+    One entry per row, header required
+
+    The header names the content keys. Cells are imported as strings and
+    empty cells are left out of the entry.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    if not reader.fieldnames or not any(name.strip() for name in reader.fieldnames):
+        raise ValueError("CSV file must start with a header row")
+    for record in reader:
+        if None in record:
+            yield EntryRowError(reader.line_num, "More cells than header columns")
+            continue
+        content = {key.strip(): value for key, value in record.items() if value}
+        if not content:
+            yield EntryRowError(reader.line_num, "Empty row")
+            continue
+        yield reader.line_num, content
+
+
+def _lines(stream: IO[bytes]) -> Iterator[tuple[int, Optional[str]]]:
+    """Numbered, decoded lines without their line break (None if not UTF-8)"""
+    for line, raw in enumerate(stream, start=1):
+        if line == 1:
+            raw = raw.removeprefix(b"\xef\xbb\xbf")
+        try:
+            yield line, raw.decode("utf-8").rstrip("\r\n")
+        except UnicodeDecodeError:
+            yield line, None
+
+
+def _parse_conll(stream: IO[bytes], source_language: Optional[str], target_language: Optional[str]) -> ParsedRows:
+    """
+    One NER entry, {"tokens": [...], "tags": [...]}, per sentence
+
+    CoNLL-2003 style: one token per line with the token in the first column
+    and its tag in the last (columns separated by tabs or spaces), and a
+    blank line after each sentence. -DOCSTART- lines are skipped. A
+    sentence with an unreadable line is rejected as a whole.
+    """
+    start, tokens, tags, error = 0, [], [], None
+
+    def sentence() -> Union[tuple[int, dict], EntryRowError]:
+        if error is not None:
+            return error
+        return start, {"tokens": tokens, "tags": tags}
+
+    for line, value in _lines(stream):
+        if value is not None:
+            value = value.strip()
+        if value == "" or (value is not None and value.startswith("-DOCSTART-")):
+            if start:
+                yield sentence()
+                start, tokens, tags, error = 0, [], [], None
+            continue
+        if not start:
+            start = line
+        if error is not None:
+            continue
+        if value is None:
+            error = EntryRowError(line, "Invalid UTF-8")
+            continue
+        columns = value.split()
+        if len(columns) < 2:
+            error = EntryRowError(line, "Expected a token and a tag")
+            continue
+        tokens.append(columns[0])
+        tags.append(columns[-1])
+    if start:
+        yield sentence()
+
+
+def _parallel(
+    line: int,
+    source_language: str,
+    target_language: str,
+    source_text: Optional[str],
+    target_text: Optional[str]
+) -> Union[tuple[int, dict], EntryRowError]:
+    source_text = (source_text or "").strip()
+    target_text = (target_text or "").strip()
+    if not source_text or not target_text:
+        return EntryRowError(line, "Source and target text are required")
+    return line, {
+        "source_lang": source_language,
+        "target_lang": target_language,
+        "source_text": source_text,
+        "target_text": target_text,
+    }
+
+
+def _parse_tsv(stream: IO[bytes], source_language: Optional[str], target_language: Optional[str]) -> ParsedRows:
+    """
+    One parallel entry per line: the source text, a tab, the target text
+
+    There is no header or quoting; the languages come from the request.
+    """
+    for line, value in _lines(stream):
+        if value is None:
+            yield EntryRowError(line, "Invalid UTF-8")
+            continue
+        if not value.strip():
+            continue
+        cells = value.split("\t")
+        if len(cells) != 2:
+            yield EntryRowError(line, "Expected 2 tab-separated columns")
+            continue
+        yield _parallel(line, source_language, target_language, cells[0], cells[1])
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _language(value: Optional[str]) -> Optional[str]:
+    """Primary language subtag, lowercased ('en-US' -> 'en')"""
+    value = (value or "").replace("_", "-").split("-")[0].strip().lower()
+    return value if value and value != "*all*" else None
+
+
+def _segment_text(seg: ElementTree.Element) -> str:
+    """A seg's text without the native codes of its inline bpt/ept/ph/it/ut elements"""
+    parts = [seg.text or ""]
+    for child in seg:
+        if _local(child.tag) == "hi":
+            parts.append(_segment_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _parse_tmx(stream: IO[bytes], source_language: Optional[str], target_language: Optional[str]) -> ParsedRows:
+    """
+    One parallel entry per translation unit and target language
+
+    The source language is source_language, else the header's srclang,
+    else that of each unit's first variant. Every other variant (only
+    target_language's, if given) becomes an entry. Errors are reported by
+    unit number rather than line. Units are removed from the tree once
+    read, so memory stays flat on large files.
+    """
+    source_language = _language(source_language)
+    target_language = _language(target_language)
+    unit = 0
+    parents = []
+    events = ElementTree.iterparse(stream, events=("start", "end"))
+    while True:
+        try:
+            event, elem = next(events)
+        except StopIteration:
+            return
+        except ElementTree.ParseError as e:
+            raise ValueError(f"Invalid TMX: {e}") from e
+        if event == "start":
+            parents.append(elem)
+            if _local(elem.tag) == "header" and source_language is None:
+                source_language = _language(elem.get("srclang"))
+            continue
+        parents.pop()
+        if _local(elem.tag) != "tu":
+            continue
+        unit += 1
+        variants = []
+        for tuv in elem:
+            if _local(tuv.tag) != "tuv":
+                continue
+            seg = next((child for child in tuv if _local(child.tag) == "seg"), None)
+            language = _language(tuv.get(_XML_LANG) or tuv.get("lang"))
+            variants.append((language, _segment_text(seg) if seg is not None else None))
+        yield from _tmx_unit(unit, variants, source_language, target_language)
+        if parents:
+            parents[-1].remove(elem)
+
+
+def _tmx_unit(
+    unit: int,
+    variants: list[tuple[Optional[str], Optional[str]]],
+    source_language: Optional[str],
+    target_language: Optional[str]
+) -> list[Union[tuple[int, dict], EntryRowError]]:
+    if source_language is None and variants:
+        source_language = variants[0][0]
+    source = next((text for language, text in variants if language == source_language), None)
+    if source_language is None or source is None:
+        return [EntryRowError(unit, f"Unit has no '{source_language or 'source'}' segment")]
+    targets = [
+        (language, text) for language, text in variants
+        if language and language != source_language and target_language in (None, language)
+    ]
+    if not targets:
+        return [EntryRowError(unit, f"Unit has no '{target_language or 'target'}' segment")]
+    return [_parallel(unit, source_language, language, source, text) for language, text in targets]
+
+
+_PARSERS = {
+    "jsonl": _parse_jsonl,
+    "csv": _parse_csv,
+    "conll": _parse_conll,
+    "tmx": _parse_tmx,
+    "tsv": _parse_tsv,
+}
+
+
+def _prepare(
+    dataset_id: UUID,
+    rows: list[Union[tuple[int, dict], EntryRowError]]
+) -> list[Union[PreparedEntry, EntryRowError]]:
+    """Canonicalize and hash a batch of parsed rows (as DataEntryService does)"""
+    prepared = []
+    for row in rows:
+        if isinstance(row, EntryRowError):
+            prepared.append(row)
+            continue
+        line, content = row
+        content_text = DataEntryService.canonical_content(content)
+        prepared.append((line, DataEntryService.hash_content_text(dataset_id, content_text), content_text))
+    return prepared
+
+
+class EntryUploadService:
+    """Service class for loading dataset entries from files"""
+
+    jobs: BackgroundJobs[EntryImportJob] = BackgroundJobs(
+        "Entry import", "entry_import", EntryImportJob, "DATASET_IMPORT_JOB_TTL",
+        UPLOAD_FORMATS, _EXTENSIONS, noun="upload"
+    )
+
+    @staticmethod
+    def check_format(
+        format: str,
+        dataset_type: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None
+    ) -> None:
+        """
+        Check that a format can be loaded into a dataset
+
+        Args:
+            format: One of UPLOAD_FORMATS
+            dataset_type: The dataset's type
+            source_language: Source language of a parallel corpus
+            target_language: Target language of a parallel corpus
+
+        Raises:
+            ValueError: If the format produces another type's entries, or a
+                TSV file comes without its languages
+        """
+        expected = FORMAT_TYPES.get(format)
+        if expected is not None and expected != dataset_type:
+            raise ValueError(f"{format.upper()} files load into {expected} datasets, not {dataset_type}")
+        if format == "tsv" and not (source_language and target_language):
+            raise ValueError("TSV uploads need source_language and target_language")
+
+    @staticmethod
+    def open_upload(source: IO[bytes]) -> IO[bytes]:
+        """Wrap an uploaded file, transparently decompressing gzip"""
+        magic = source.read(2)
+        source.seek(0)
+        if magic == b"\x1f\x8b":
+            return gzip.GzipFile(fileobj=source, mode="rb")
+        return source
+
+    @staticmethod
+    def parse(
+        stream: IO[bytes],
+        format: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None
+    ) -> ParsedRows:
+        """
+        Incrementally parse an upload into entry content
+
+        CoNLL sentences become NER content ({tokens, tags}); TMX units and
+        TSV lines become parallel content ({source_lang, target_lang,
+        source_text, target_text}).
+
+        Args:
+            stream: Binary file object
+            format: One of UPLOAD_FORMATS
+            source_language: Source language (TSV; overrides a TMX header)
+            target_language: Target language (TSV; only this one from TMX)
+
+        Returns:
+            Iterator of (line, content), with EntryRowError instances for
+            rejected lines (units, for TMX). Unreadable files raise ValueError.
+        """
+        return _PARSERS[format](stream, source_language, target_language)
+
+    @staticmethod
+    async def ingest(
+        conn: AsyncConnection,
+        dataset_id: UUID,
+        user_id: int,
+        rows: ParsedRows,
+        on_chunk: Optional[Callable[[EntryUploadResult], Awaitable[None]]] = None
+    ) -> EntryUploadResult:
+        """
+        Load parsed entries into a dataset, DATASET_UPLOAD_CHUNK at a time
+
+        Each chunk is parsed, canonicalized and hashed in a worker thread
+        while the previous one is loaded. Loading COPYs the chunk into a
+        temporary staging table and merges it with one INSERT ... SELECT
+        ... ON CONFLICT (hash_key) DO NOTHING, so duplicates (in the
+        database or in the file) are skipped. Each chunk commits with the
+        dataset's counts; chunks committed before an error stay.
+
+        Args:
+            conn: Dedicated database connection (not shared with a session)
+            dataset_id: Dataset ID
+            user_id: Creator user ID
+            rows: Output of parse
+            on_chunk: Called with the running totals after each chunk
+
+        Returns:
+            Totals and per-chunk counts
+        """
+        started = time.perf_counter()
+        result = EntryUploadResult(total=0)
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection  # asyncpg connection
+
+        def next_chunk() -> list:
+            return _prepare(dataset_id, list(islice(rows, settings.DATASET_UPLOAD_CHUNK)))
+
+        await conn.execute(text(f"DROP TABLE IF EXISTS {STAGE_TABLE}"))
+        await conn.execute(_CREATE_STAGE)
+        await conn.commit()
+        pending = asyncio.ensure_future(asyncio.to_thread(next_chunk))
+        try:
+            while True:
+                chunk = await pending
+                if not chunk:
+                    break
+                pending = asyncio.ensure_future(asyncio.to_thread(next_chunk))
+                await EntryUploadService._load_chunk(conn, driver, dataset_id, user_id, chunk, result)
+                if on_chunk is not None:
+                    result.elapsed_seconds = round(time.perf_counter() - started, 3)
+                    await on_chunk(result)
+        finally:
+            # Never leave the parser running on a closed file
+            if not pending.done():
+                await asyncio.wait([pending])
+            await conn.rollback()
+            await conn.execute(text(f"DROP TABLE IF EXISTS {STAGE_TABLE}"))
+            await conn.commit()
+            if result.created:
+                await DataEntryService.invalidate_dataset_cache(dataset_id)
+
+        result.elapsed_seconds = round(time.perf_counter() - started, 3)
+        if result.elapsed_seconds > 0:
+            result.entries_per_second = round(result.total / result.elapsed_seconds, 1)
+        logger.info(
+            "Entry upload into %s: %d lines, %d created, %d skipped, %d failed in %.1fs",
+            dataset_id, result.total, result.created, result.skipped, result.failed, result.elapsed_seconds
+        )
+        return result
+
+    @staticmethod
+    async def _load_chunk(
+        conn: AsyncConnection,
+        driver,
+        dataset_id: UUID,
+        user_id: int,
+        chunk: list[Union[PreparedEntry, EntryRowError]],
+        result: EntryUploadResult
+    ) -> None:
+        """COPY and merge one chunk, then commit it with the dataset's counts"""
+        records = []
+        failed = 0
+        for row in chunk:
+            if isinstance(row, EntryRowError):
+                failed += 1
+                if len(result.errors) < settings.DATASET_UPLOAD_MAX_ERRORS:
+                    result.errors.append(f"Line {row.line}: {row}")
+            else:
+                line, hash_key, content_text = row
+                records.append((len(records), hash_key, content_text))
+
+        created = 0
+        if records:
+            # Also begins the chunk's transaction, which the COPY joins
+            await conn.execute(text(f"TRUNCATE {STAGE_TABLE}"))
+            await driver.copy_records_to_table(STAGE_TABLE, records=records, columns=STAGE_COLUMNS)
+            merged = await conn.execute(_MERGE_CHUNK, {"dataset_id": dataset_id, "user_id": user_id})
+            created, size = merged.one()
+            if created:
+                await DatasetMetaService.adjust_entry_counts(conn, [(dataset_id, created, size)])
+            await conn.commit()
+            await DataEntryService.cache_hashes(hash_key for _, hash_key, _ in records)
+
+        first_line = chunk[0].line if isinstance(chunk[0], EntryRowError) else chunk[0][0]
+        last_line = chunk[-1].line if isinstance(chunk[-1], EntryRowError) else chunk[-1][0]
+        result.chunks.append(EntryUploadChunk(
+            first_line=first_line,
+            last_line=last_line,
+            created=created,
+            skipped=len(records) - created,
+            failed=failed,
+        ))
+        result.total += len(chunk)
+        result.created += created
+        result.skipped += len(records) - created
+        result.failed += failed
+
+    @staticmethod
+    async def ingest_file(
+        dataset_id: UUID,
+        user_id: int,
+        source: IO[bytes],
+        format: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None
+    ) -> EntryUploadResult:
+        """
+        Ingest an uploaded file on a connection of its own
+
+        Args:
+            dataset_id: Dataset ID
+            user_id: Creator user ID
+            source: Upload's file object (optionally gzip-compressed)
+            format: One of UPLOAD_FORMATS
+            source_language: Source language (see parse)
+            target_language: Target language (see parse)
+
+        Returns:
+            Totals and per-chunk counts
+        """
+        stream = EntryUploadService.open_upload(source)
+        async with engine.connect() as conn:
+            return await EntryUploadService.ingest(
+                conn, dataset_id, user_id,
+                EntryUploadService.parse(stream, format, source_language, target_language)
+            )
+
+    # Background imports
+
+    @staticmethod
+    async def run_import(
+        conn: AsyncConnection,
+        job: EntryImportJob,
+        path: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None
+    ) -> EntryImportJob:
+        """
+        Ingest an import file, saving the job's progress after every chunk
+
+        Args:
+            conn: Dedicated database connection (not shared with a session)
+            job: Job to update
+            path: Import file (optionally gzip-compressed)
+            source_language: Source language (see parse)
+            target_language: Target language (see parse)
+
+        Returns:
+            The completed job
+        """
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        await EntryUploadService.jobs.save_job(job)
+
+        async def progress(result: EntryUploadResult) -> None:
+            EntryUploadService._update(job, result)
+            await EntryUploadService.jobs.save_job(job)
+
+        with open(path, "rb") as source:
+            stream = EntryUploadService.open_upload(source)
+            result = await EntryUploadService.ingest(
+                conn, job.dataset_id, job.user_id,
+                EntryUploadService.parse(stream, job.format, source_language, target_language),
+                on_chunk=progress
+            )
+
+        EntryUploadService._update(job, result)
+        job.status = "completed"
+        job.finished_at = datetime.utcnow()
+        await EntryUploadService.jobs.save_job(job)
+        return job
+
+    @staticmethod
+    def _update(job: EntryImportJob, result: EntryUploadResult) -> None:
+        job.total = result.total
+        job.created = result.created
+        job.skipped = result.skipped
+        job.failed = result.failed
+        job.chunks = len(result.chunks)
+        job.errors = list(result.errors)
+        job.elapsed_seconds = result.elapsed_seconds
+        if result.elapsed_seconds > 0:
+            job.entries_per_second = round(result.total / result.elapsed_seconds, 1)
+
+    @staticmethod
+    def start_import(
+        job: EntryImportJob,
+        path: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None
+    ) -> None:
+        """
+        Run an import in the background of this worker
+
+        Args:
+            job: Queued job
+            path: Import file, owned by the job from now on
+            source_language: Source language (see parse)
+            target_language: Target language (see parse)
+        """
+        async def run() -> None:
+            async with engine.connect() as conn:
+                await EntryUploadService.run_import(conn, job, path, source_language, target_language)
+
+        EntryUploadService.jobs.start(job, path, run())
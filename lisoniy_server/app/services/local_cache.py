@@ -0,0 +1,260 @@
+"""In-process LRU cache in front of Redis with pub/sub invalidation"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+
+from app.core.config import settings
+from app.services.cache import RedisCache, cache
+from app.services.redis_manager import RedisManager, redis_manager
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class LocalCache:
+    """
+    Bounded per-process LRU/TTL tier layered over RedisCache
+
+    Lookups go local -> Redis -> loader. Entries are bounded both by count
+    and by their encoded size, and expire after a short local TTL so a lost
+    invalidation message can only cause bounded staleness. invalidate()
+    removes keys from Redis and publishes them on a channel that every
+    worker subscribes to, keeping all processes coherent.
+
+    Cached values are shared between requests and must be treated as
+    read-only; cache pydantic models or plain data, never ORM instances.
+    """
+
+    def __init__(
+        self,
+        remote: RedisCache,
+        manager: RedisManager,
+        max_entries: int,
+        max_bytes: int,
+        default_ttl: float,
+        channel: str,
+    ):
+        self.remote = remote
+        self.manager = manager
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.channel = channel
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        # key -> (expires_at, value, size)
+        self._entries: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+
+    # Local tier
+
+    def get_local(self, key: str) -> Any:
+        """Return a live local entry or _MISSING"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] < time.monotonic():
+            self._remove(key)
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set_local(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value locally, evicting least-recently-used entries"""
+        try:
+            size = len(self.remote.codec.encode(value))
+        except Exception:
+            return  # Not serializable, don't cache
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + (ttl or self.default_ttl), value, size)
+        self.size_bytes += size
+
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[2]
+
+    def _remove_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            self._remove(key)
+
+    # Two-tier API
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: int,
+        local_ttl: Optional[float] = None,
+        type_: Optional[Type[T]] = None,
+    ) -> T:
+        """
+        Return a value from the local tier, Redis, or loader (in that order)
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            ttl: Redis TTL in seconds
+            local_ttl: In-process TTL in seconds (defaults to LOCAL_CACHE_TTL)
+            type_: Optional type to validate Redis values into
+        """
+        value = self.get_local(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = await self.remote.get_or_set(key, loader, ttl=ttl, type_=type_)
+        self.set_local(key, value, local_ttl)
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop keys from every worker's local tier and from Redis"""
+        for key in keys:
+            self._remove(key)
+        await self.remote.delete(*keys)
+        await self._publish([f"k:{key}" for key in keys])
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Drop all local entries whose key starts with prefix, in every worker"""
+        self._remove_prefix(prefix)
+        await self._publish([f"p:{prefix}"])
+
+    async def _publish(self, messages: list[str]) -> None:
+        if self.manager.redis is None:
+            return
+        try:
+            for message in messages:
+                await self.manager.redis.publish(self.channel, message)
+        except Exception as e:
+            logger.warning("Cache invalidation publish failed: %s", e)
+
+    def handle_message(self, message: str) -> None:
+        """Apply an invalidation message received from another worker"""
+        kind, _, target = message.partition(":")
+        if kind == "k":
+            self._remove(target)
+        elif kind == "p":
+            self._remove_prefix(target)
+
+    # Pub/sub listener
+
+    async def start(self) -> None:
+        """Start listening for invalidations from other workers"""
+        if self.manager.redis is None or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the invalidation listener"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self.manager.redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                try:
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.handle_message(message["data"])
+                finally:
+                    await pubsub.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Entries published while disconnected may be missed; drop
+                # everything so staleness stays bounded by the reconnect
+                logger.warning("Cache invalidation listener error: %s", e)
+                self.clear()
+                await asyncio.sleep(1.0)
+
+    def clear(self) -> None:
+        """Drop every local entry"""
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and memory usage"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    # Decorator
+
+    def cached(
+        self,
+        key: Callable[..., str],
+        ttl: int,
+        local_ttl: Optional[float] = None,
+        type_: Optional[Type[Any]] = None,
+    ):
+        """
+        Cache an async function's result in both tiers
+
+        Args:
+            key: Builds the cache key from the function's arguments
+            ttl: Redis TTL in seconds
+            local_ttl: In-process TTL in seconds
+            type_: Optional type to validate Redis values into
+
+        Example:
+            @staticmethod
+            @local_cache.cached(lambda db: "categories:all", ttl=7200)
+            async def list_categories(db): ...
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await self.get_or_set(
+                    key(*args, **kwargs),
+                    lambda: func(*args, **kwargs),
+                    ttl=ttl,
+                    local_ttl=local_ttl,
+                    type_=type_,
+                )
+            return wrapper
+        return decorator
+
+
+# Global local cache instance
+local_cache = LocalCache(
+    remote=cache,
+    manager=redis_manager,
+    max_entries=settings.LOCAL_CACHE_MAX_ENTRIES,
+    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+    default_ttl=settings.LOCAL_CACHE_TTL,
+    channel=settings.CACHE_INVALIDATION_CHANNEL,
+)
@@ -1,7 +1,6 @@
 """Post service for CRUD operations and business logic"""
 import os
 import uuid
-import json
 from typing import List, Optional, Tuple
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +10,8 @@ from sqlalchemy import select, func
 from app.models import Post, User, PostType
 from app.schemas.content import PostCreate, PostUpdate
 from app.services.redis_manager import redis_manager
+from app.services.cache import cache
+from app.services.local_cache import local_cache
 from app.core.config import settings
 
 
@@ -19,7 +20,7 @@ class PostService:
     async def _invalidate_post_cache(post_id: int):
         """Invalidate the cache for a single post."""
         cache_key = f"post:{post_id}"
-        await redis_manager.delete_key(cache_key)
+        await cache.delete(cache_key)
 
     @staticmethod
     async def create_post(
@@ -80,9 +81,8 @@ class PostService:
         """
         cache_key = f"post:{post_id}"
         try:
-            cached_post = await redis_manager.get_value(cache_key)
-            if cached_post:
-                post_dict = json.loads(cached_post)
+            post_dict = await cache.get(cache_key)
+            if post_dict:
                 owner_data = post_dict.pop('owner', None)
                 
                 # Only use cache if it has owner data (consistent with schema requirements)
@@ -102,7 +102,7 @@ class PostService:
             try:
                 await redis_manager.redis.incr(f"post:views:{post_id}")
                 # Cache the dict representation
-                await redis_manager.set_value(cache_key, post.to_dict(), expire=3600)
+                await cache.set(cache_key, post.to_dict(), ttl=3600)
             except Exception as e:
                 print(f"DEBUG: Cache storage failed for post:{post_id}: {e}")
         
@@ -229,11 +229,17 @@ class PostService:
         }
     
     @staticmethod
+    @local_cache.cached(
+        lambda db, limit=10: f"posts:popular_tags:{limit}",
+        ttl=300,
+        local_ttl=30
+    )
     async def get_popular_tags(db: AsyncSession, limit: int = 10) -> list[dict]:
         """
         Get the most used tags with their post counts.
         
-        Uses PostgreSQL JSONB unnesting to aggregate tag usage.
+        Uses PostgreSQL JSONB unnesting to aggregate tag usage. Results are
+        cached for 30s per worker and 5 minutes in Redis.
         
         Args:
             db: Database session
@@ -0,0 +1,144 @@
+"""Atomic token-bucket rate limiting on Redis"""
+
+import logging
+
+from app.services.redis_manager import RedisManager, redis_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+# Token bucket evaluated entirely inside Redis, so concurrent requests can't
+# all pass a check-then-increment race. The bucket holds up to `capacity`
+# tokens and refills continuously at `capacity / window`. The key expires
+# once a full refill would have happened, so idle clients are released
+# instead of having their TTL extended on every hit. Uses the server clock
+# so workers with skewed clocks agree.
+#
+# KEYS[1] bucket key
+# ARGV[1] capacity, ARGV[2] window (ms), ARGV[3] cost
+# Returns {allowed, remaining, retry_after_ms}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = capacity / window
+
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1000)
+
+return {allowed, math.floor(tokens), retry_after}
+"""
+
+
+class RateLimitResult:
+    """Outcome of a rate limit check"""
+
+    def __init__(self, allowed: bool, limit: int, remaining: int, retry_after: int = 0):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.retry_after = retry_after  # Whole seconds until a retry can succeed
+
+    def headers(self) -> dict:
+        """Standard response headers describing this result"""
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter backed by a single Lua script
+
+    Every check is one EVALSHA round-trip. When Redis is unavailable the
+    limiter fails open: rate limiting protects the service, it must not be
+    the reason requests fail.
+    """
+
+    def __init__(self, manager: RedisManager, prefix: str = "rate_limit"):
+        self.manager = manager
+        self.prefix = prefix
+        self._script = None
+        self._script_client = None
+
+    def _get_script(self):
+        # Scripts are bound to a client; rebind after reconnects
+        if self._script is None or self._script_client is not self.manager.redis:
+            self._script = self.manager.redis.register_script(TOKEN_BUCKET_SCRIPT)
+            self._script_client = self.manager.redis
+        return self._script
+
+    async def hit(
+        self,
+        identifier: str,
+        limit: int,
+        window: int,
+        cost: int = 1
+    ) -> RateLimitResult:
+        """
+        Consume tokens from an identifier's bucket
+
+        Args:
+            identifier: Bucket name, e.g. "login:user@example.com"
+            limit: Requests allowed per window (bucket capacity)
+            window: Window length in seconds
+            cost: Tokens this request consumes
+
+        Returns:
+            RateLimitResult; allowed is False when the bucket is empty
+        """
+        if self.manager.redis is None:
+            return RateLimitResult(True, limit, limit)
+
+        try:
+            allowed, remaining, retry_after_ms = await self._get_script()(
+                keys=[f"{self.prefix}:{identifier}"],
+                args=[limit, window * 1000, cost],
+            )
+        except Exception as e:
+            logger.warning("Rate limit check failed for %s: %s", identifier, e)
+            return RateLimitResult(True, limit, limit)
+
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=int(remaining),
+            retry_after=max(1, -(-int(retry_after_ms) // 1000)) if not allowed else 0,
+        )
+
+    async def reset(self, identifier: str) -> None:
+        """Clear an identifier's bucket"""
+        if self.manager.redis is None:
+            return
+        await self.manager.redis.delete(f"{self.prefix}:{identifier}")
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter(redis_manager)
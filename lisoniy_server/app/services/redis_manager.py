@@ -1,21 +1,35 @@
-"""Redis manager for caching, OTP storage, and rate limiting"""
+"""Redis manager for caching, OTP storage, and token bookkeeping"""
 
+import hashlib
 import json
 import secrets
+import time
 from typing import Optional, Any
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from redis import asyncio as aioredis
 from fastapi.encoders import jsonable_encoder
 
 from app.core.config import settings
 
 
+# Prune, add, then expire the index with its latest token so an older token
+# stored after a newer one never shortens the key's TTL
+STORE_REFRESH_TOKEN_SCRIPT = """
+redis.call('zremrangebyscore', KEYS[1], '-inf', ARGV[1])
+redis.call('zadd', KEYS[1], ARGV[3], ARGV[2])
+local latest = redis.call('zrange', KEYS[1], -1, -1, 'WITHSCORES')
+return redis.call('expireat', KEYS[1], latest[2])
+"""
+
+
 class RedisManager:
     """Redis connection manager with helper methods"""
     
     def __init__(self):
         """Initialize Redis connection pool"""
         self.redis: Optional[aioredis.Redis] = None
+        # Bytes-in/bytes-out client for binary cache codecs
+        self.binary_redis: Optional[aioredis.Redis] = None
     
     async def connect(self) -> None:
         """Create Redis connection pool with timeouts"""
@@ -28,11 +42,21 @@ class RedisManager:
             socket_connect_timeout=5.0,
             retry_on_timeout=True,
         )
+        self.binary_redis = await aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=5.0,
+            socket_connect_timeout=5.0,
+            retry_on_timeout=True,
+        )
     
     async def disconnect(self) -> None:
         """Close Redis connection pool"""
         if self.redis:
             await self.redis.close()
+        if self.binary_redis:
+            await self.binary_redis.close()
     
     async def set_value(
         self,
@@ -74,20 +98,6 @@ class RedisManager:
         """
         await self.redis.delete(key)
 
-    async def delete_pattern(self, pattern: str) -> None:
-        """
-        Delete all keys matching a pattern
-        
-        Args:
-            pattern: Redis glob-style pattern (e.g. "prefix:*")
-        """
-        keys = []
-        async for key in self.redis.scan_iter(match=pattern):
-            keys.append(key)
-            
-        if keys:
-            await self.redis.delete(*keys)
-    
     async def key_exists(self, key: str) -> bool:
         """
         Check if a key exists in Redis
@@ -139,38 +149,57 @@ class RedisManager:
         return False
     
     # Refresh Token Management
+    #
+    # Each user has one sorted set "refresh_tokens:{user_id}" whose members are
+    # token fingerprints scored by their expiry (unix seconds). Revoking every
+    # session is a single DEL, and expired members are trimmed on write.
+    @staticmethod
+    def _refresh_tokens_key(user_id: int) -> str:
+        return f"refresh_tokens:{user_id}"
+    
+    @staticmethod
+    def token_fingerprint(token: str) -> str:
+        """SHA-256 of a token, so raw tokens are never stored in Redis"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    
     async def store_refresh_token(
         self,
         user_id: int,
         token: str,
-        expire_days: int
+        expires_at: datetime
     ) -> None:
         """
-        Store refresh token in Redis
+        Store refresh token in the user's token index
         
         Args:
             user_id: User ID
             token: Refresh token
-            expire_days: Expiration in days
+            expires_at: Token expiry (naive UTC)
         """
-        key = f"refresh_token:{user_id}:{token}"
-        expire_seconds = expire_days * 24 * 60 * 60
+        key = self._refresh_tokens_key(user_id)
+        expires_ts = int(expires_at.replace(tzinfo=timezone.utc).timestamp())
         
-        await self.set_value(key, "1", expire=expire_seconds)
+        await self.redis.eval(
+            STORE_REFRESH_TOKEN_SCRIPT, 1, key,
+            int(time.time()), self.token_fingerprint(token), expires_ts
+        )
     
     async def verify_refresh_token(self, user_id: int, token: str) -> bool:
         """
-        Verify if refresh token exists in Redis
+        Verify that a refresh token is in the user's index and not expired
         
         Args:
             user_id: User ID
             token: Refresh token to verify
             
         Returns:
-            True if token exists, False otherwise
+            True if token is present and unexpired, False otherwise
         """
-        key = f"refresh_token:{user_id}:{token}"
-        return await self.key_exists(key)
+        expires_ts = await self.redis.zscore(
+            self._refresh_tokens_key(user_id),
+            self.token_fingerprint(token)
+        )
+        return expires_ts is not None and expires_ts > time.time()
     
     async def revoke_refresh_token(self, user_id: int, token: str) -> None:
         """
@@ -180,8 +209,7 @@ class RedisManager:
             user_id: User ID
             token: Refresh token to revoke
         """
-        key = f"refresh_token:{user_id}:{token}"
-        await self.delete_key(key)
+        await self.redis.zrem(self._refresh_tokens_key(user_id), self.token_fingerprint(token))
     
     async def revoke_all_user_tokens(self, user_id: int) -> None:
         """
@@ -190,34 +218,7 @@ class RedisManager:
         Args:
             user_id: User ID
         """
-        pattern = f"refresh_token:{user_id}:*"
-        async for key in self.redis.scan_iter(match=pattern):
-            await self.delete_key(key)
-    
-    # Rate Limiting
-    async def check_rate_limit(self, identifier: str) -> bool:
-        """
-        Check if identifier is rate limited
-        
-        Args:
-            identifier: Unique identifier (e.g., IP address, user email)
-            
-        Returns:
-            True if allowed, False if rate limited
-        """
-        key = f"rate_limit:{identifier}"
-        current = await self.redis.get(key)
-        
-        if current and int(current) >= settings.RATE_LIMIT_REQUESTS:
-            return False
-        
-        # Increment counter
-        pipe = self.redis.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, settings.RATE_LIMIT_WINDOW)
-        await pipe.execute()
-        
-        return True
+        await self.redis.delete(self._refresh_tokens_key(user_id))
     
     # Password Reset Token Management
     async def store_password_reset_token(self, email: str, token: str) -> None:
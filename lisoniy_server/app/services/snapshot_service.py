@@ -0,0 +1,334 @@
+"""Versioned full-dictionary snapshots (gzip JSONL and SQLite) for offline clients"""
+
+import asyncio
+import fcntl
+import gzip
+import hashlib
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.pagination import encode_cursor
+from app.db.session import AsyncSessionLocal
+from app.models.terminology import Category, Definition, Term
+from app.schemas.terminology import SnapshotFile, SnapshotManifest
+from app.services.cache import cache, get_codec
+from app.services.term_service import SEARCH_NAMESPACE
+
+
+# format -> (download name, media type, suffix of the versioned file on disk)
+SNAPSHOT_FORMATS = {
+    "jsonl": ("terminology.jsonl.gz", "application/gzip", ".jsonl.gz"),
+    "sqlite": ("terminology.sqlite", "application/vnd.sqlite3", ".sqlite"),
+}
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".lock"
+
+# Joined term/definition rows fetched (and written) per round trip
+BATCH_SIZE = 5000
+
+_SQLITE_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    uuid BLOB NOT NULL,
+    slug TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    description TEXT
+);
+CREATE TABLE terms (
+    id INTEGER PRIMARY KEY,
+    uuid BLOB NOT NULL,
+    keyword TEXT NOT NULL UNIQUE,
+    category_id INTEGER NOT NULL REFERENCES categories (id)
+);
+CREATE TABLE definitions (
+    term_id INTEGER NOT NULL REFERENCES terms (id),
+    language TEXT NOT NULL,
+    text TEXT NOT NULL,
+    example TEXT,
+    PRIMARY KEY (term_id, language)
+) WITHOUT ROWID;
+"""
+
+
+class _SnapshotWriter:
+    """
+    Writes the JSONL and SQLite files in one pass (blocking; runs in a thread)
+
+    Rows arrive as (term_id, keyword, category_id, language, text,
+    example), ordered by term, and are grouped into one JSONL line per
+    term. SQLite rows use small integer keys, with UUIDs stored as
+    16-byte blobs.
+    """
+
+    def __init__(self, jsonl_path: str, sqlite_path: str, generation: int, created_at: datetime):
+        self.codec = get_codec("orjson")
+        self.jsonl = gzip.open(jsonl_path, "wb", compresslevel=6)
+        self.sqlite = sqlite3.connect(sqlite_path, check_same_thread=False)
+        self.sqlite.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + _SQLITE_SCHEMA)
+        self.meta = {"generation": str(generation), "created_at": created_at.isoformat()}
+        self.category_ids: dict = {}
+        self.category_slugs: dict = {}
+        self.counts = {"categories": 0, "terms": 0, "definitions": 0}
+        self._term = None  # [uuid, keyword, category_id, definitions] being collected
+        self._lines = [self._encode({"type": "meta", "generation": generation, "created_at": created_at.isoformat()})]
+        self._terms: list = []
+        self._definitions: list = []
+
+    def _encode(self, record: dict) -> bytes:
+        return self.codec.encode(record) + b"\n"
+
+    def write_categories(self, rows) -> None:
+        for number, (category_id, slug, name, description) in enumerate(rows, start=1):
+            self.category_ids[category_id] = number
+            self.category_slugs[category_id] = slug
+            self._lines.append(self._encode({
+                "type": "category",
+                "id": str(category_id),
+                "slug": slug,
+                "name": name,
+                "description": description,
+            }))
+            self.sqlite.execute(
+                "INSERT INTO categories VALUES (?, ?, ?, ?, ?)",
+                (number, category_id.bytes, slug, name, description)
+            )
+        self.counts["categories"] = len(self.category_ids)
+
+    def write_rows(self, rows) -> None:
+        for term_id, keyword, category_id, language, text, example in rows:
+            if self._term is None or self._term[0] != term_id:
+                self._flush_term()
+                self._term = [term_id, keyword, category_id, []]
+            if language is not None:
+                self._term[3].append({"language": language, "text": text, "example": example})
+        self._write()
+
+    def _flush_term(self) -> None:
+        """Queue the collected term for both files"""
+        if self._term is None:
+            return
+        term_id, keyword, category_id, definitions = self._term
+        self._term = None
+        self.counts["terms"] += 1
+        self.counts["definitions"] += len(definitions)
+        number = self.counts["terms"]
+        self._lines.append(self._encode({
+            "type": "term",
+            "id": term_id,
+            "keyword": keyword,
+            "category": self.category_slugs[category_id],
+            "definitions": definitions,
+        }))
+        self._terms.append((number, term_id.bytes, keyword, self.category_ids[category_id]))
+        self._definitions.extend(
+            (number, d["language"], d["text"], d["example"]) for d in definitions
+        )
+
+    def _write(self) -> None:
+        """Write queued records (one compressor call and two executemany per batch)"""
+        self.jsonl.write(b"".join(self._lines))
+        self.sqlite.executemany("INSERT INTO terms VALUES (?, ?, ?, ?)", self._terms)
+        self.sqlite.executemany("INSERT INTO definitions VALUES (?, ?, ?, ?)", self._definitions)
+        self._lines, self._terms, self._definitions = [], [], []
+
+    def close(self) -> dict:
+        """Finish both files; returns the record counts"""
+        self._flush_term()
+        self._write()
+        self.sqlite.execute("CREATE INDEX ix_terms_category_id ON terms (category_id)")
+        self.sqlite.executemany("INSERT INTO meta VALUES (?, ?)", self.meta.items())
+        self.sqlite.commit()
+        self.sqlite.close()
+        self.jsonl.close()
+        return self.counts
+
+    def abort(self) -> None:
+        self.sqlite.close()
+        self.jsonl.close()
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SnapshotService:
+    """Service class for the downloadable dictionary snapshot"""
+
+    @staticmethod
+    def read_manifest() -> Optional[SnapshotManifest]:
+        """
+        Get the manifest of the current snapshot
+
+        Returns:
+            Manifest or None if no snapshot has been built yet
+        """
+        path = os.path.join(settings.TERM_SNAPSHOT_DIR, MANIFEST_NAME)
+        try:
+            with open(path, "rb") as f:
+                return SnapshotManifest.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def file_path(manifest: SnapshotManifest, format: str) -> str:
+        """Path on disk of one of a snapshot's files"""
+        return os.path.join(settings.TERM_SNAPSHOT_DIR, manifest.files[format].name)
+
+    @staticmethod
+    async def build(db: AsyncSession, generation: int) -> SnapshotManifest:
+        """
+        Write a new snapshot and make it current
+
+        Everything is read in one REPEATABLE READ transaction, so both
+        files describe the same state. Terms and definitions are fetched
+        with a server-side cursor, each batch written in a thread while
+        the next is fetched, so memory does not grow with the dictionary. Files are written under
+        versioned names and published by replacing the manifest; older
+        files are then deleted (open downloads keep reading them).
+
+        Args:
+            db: Database session with no transaction in progress
+            generation: Terminology generation read before the data
+
+        Returns:
+            Manifest of the new snapshot
+        """
+        directory = settings.TERM_SNAPSHOT_DIR
+        os.makedirs(directory, exist_ok=True)
+        created_at = datetime.utcnow()
+        stamp = f"{generation}-{created_at:%Y%m%d%H%M%S%f}"
+        names = {fmt: f"terminology-{stamp}{suffix}" for fmt, (_, _, suffix) in SNAPSHOT_FORMATS.items()}
+        paths = {fmt: os.path.join(directory, name) for fmt, name in names.items()}
+
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        writer = await asyncio.to_thread(
+            _SnapshotWriter, paths["jsonl"], paths["sqlite"], generation, created_at
+        )
+        pending = None
+        try:
+            categories = await db.execute(
+                select(Category.id, Category.slug, Category.name, Category.description)
+                .order_by(Category.slug)
+            )
+            await asyncio.to_thread(writer.write_categories, categories.all())
+
+            result = await db.stream(
+                select(
+                    Term.id, Term.keyword, Term.category_id,
+                    Definition.language, Definition.text, Definition.example,
+                )
+                .outerjoin(Definition, Definition.term_id == Term.id)
+                .where(Term.is_deleted == False)
+                .order_by(Term.keyword, Definition.language)
+                .execution_options(yield_per=BATCH_SIZE)
+            )
+            # Each batch is written in a thread while the next one is fetched
+            async for rows in result.partitions():
+                if pending is not None:
+                    await pending
+                pending = asyncio.ensure_future(asyncio.to_thread(writer.write_rows, rows))
+            if pending is not None:
+                await pending
+            counts = await asyncio.to_thread(writer.close)
+        except BaseException:
+            if pending is not None and not pending.done():
+                await asyncio.wait([pending])
+            writer.abort()
+            for path in paths.values():
+                if os.path.exists(path):
+                    os.unlink(path)
+            raise
+        finally:
+            await db.rollback()
+
+        files = {}
+        for fmt, (download_name, media_type, _) in SNAPSHOT_FORMATS.items():
+            sha256 = await asyncio.to_thread(_sha256, paths[fmt])
+            files[fmt] = SnapshotFile(
+                name=names[fmt],
+                url=f"/api/v1/snapshot/{download_name}",
+                media_type=media_type,
+                size=os.path.getsize(paths[fmt]),
+                sha256=sha256,
+                etag=f'"{sha256[:32]}"',
+            )
+        # Delta sync resumes a little before the snapshot; replaying a few
+        # changes it already contains is harmless, missing one is not
+        changes_cursor = encode_cursor(
+            created_at - timedelta(seconds=settings.TERM_CHANGES_SETTLE_SECONDS), UUID(int=0)
+        )
+        manifest = SnapshotManifest(
+            generation=generation,
+            created_at=created_at,
+            files=files,
+            changes_cursor=changes_cursor,
+            **counts
+        )
+
+        manifest_path = os.path.join(directory, MANIFEST_NAME)
+        with open(manifest_path + ".tmp", "w") as f:
+            f.write(manifest.model_dump_json())
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+        current = set(names.values())
+        for name in os.listdir(directory):
+            if name.startswith("terminology-") and name not in current:
+                os.unlink(os.path.join(directory, name))
+        return manifest
+
+    @staticmethod
+    async def refresh(force: bool = False, db: Optional[AsyncSession] = None) -> Optional[SnapshotManifest]:
+        """
+        Rebuild the snapshot if the terminology generation has changed
+
+        Every term and category write bumps the generation (see
+        TermService), so an unchanged generation means an unchanged
+        dictionary. Without Redis there is no generation to compare, and
+        the snapshot is rebuilt on every call. One process per snapshot
+        directory builds at a time; the others skip.
+
+        Args:
+            force: Rebuild even if the snapshot is current
+            db: Database session (a new one is opened if omitted)
+
+        Returns:
+            Manifest of the new snapshot, or None if nothing was built
+        """
+        generation = await cache.generation(SEARCH_NAMESPACE)
+
+        def is_current(manifest: Optional[SnapshotManifest]) -> bool:
+            return (
+                not force
+                and manifest is not None
+                and manifest.generation == generation
+                and cache.redis is not None
+            )
+
+        if is_current(SnapshotService.read_manifest()):
+            return None
+
+        os.makedirs(settings.TERM_SNAPSHOT_DIR, exist_ok=True)
+        with open(os.path.join(settings.TERM_SNAPSHOT_DIR, LOCK_NAME), "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None  # Another worker is building it
+            # It may have just finished
+            if is_current(SnapshotService.read_manifest()):
+                return None
+            if db is not None:
+                return await SnapshotService.build(db, generation)
+            async with AsyncSessionLocal() as session:
+                return await SnapshotService.build(session, generation)
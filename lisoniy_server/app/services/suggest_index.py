@@ -0,0 +1,273 @@
+"""In-process prefix index over term keywords for type-ahead suggestions"""
+
+import asyncio
+import heapq
+import json
+import logging
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.terminology import Term, normalize_search_text
+from app.services.redis_manager import RedisManager, redis_manager
+
+
+logger = logging.getLogger(__name__)
+
+# Above this many keywords, batches rebuild the lists in one pass instead of
+# inserting or deleting one by one
+MERGE_THRESHOLD = 256
+
+
+class SuggestIndex:
+    """
+    Sorted array of every live keyword, searched by binary search
+
+    Keywords are kept in two parallel lists ordered by their normalized
+    form (see normalize_search_text), so a prefix lookup is one bisect plus
+    a scan of at most ``limit`` entries, and exact matches come first. When
+    a keyword is already normalized both lists share the same string.
+
+    The index is built from Postgres at startup and updated in place by
+    term writes. Each change is also published on a channel that every
+    worker subscribes to, so all processes converge; a worker that loses
+    its subscription rebuilds once it reconnects.
+    """
+
+    def __init__(self, manager: RedisManager, channel: str):
+        self.manager = manager
+        self.channel = channel
+        self.ready = False
+        self._keys: list[str] = []
+        self._keywords: list[str] = []
+        # Changes applied while a rebuild is loading, replayed on top of it
+        self._pending: Optional[list[tuple[str, str]]] = None
+        self._stale = False
+        self._rebuild_lock = asyncio.Lock()
+        self._listener: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # Lookups
+
+    def suggest(self, q: str, limit: int = 10) -> list[str]:
+        """
+        Keywords starting with q, in alphabetical order
+
+        Args:
+            q: Typed prefix (normalized like search queries)
+            limit: Maximum number of keywords
+
+        Returns:
+            Matching keywords in their original spelling
+        """
+        prefix = normalize_search_text(q)
+        if not prefix:
+            return []
+        keys = self._keys
+        keywords = self._keywords
+        results = []
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and len(results) < limit and keys[i].startswith(prefix):
+            results.append(keywords[i])
+            i += 1
+        return results
+
+    # Updates
+
+    def load(self, keywords: Iterable[str]) -> None:
+        """Replace the whole index with the given keywords"""
+        normalized = {}
+        for keyword in keywords:
+            key = normalize_search_text(keyword)
+            normalized[keyword] = keyword if key == keyword else key
+        self._keywords = sorted(normalized, key=normalized.__getitem__)
+        self._keys = [normalized[keyword] for keyword in self._keywords]
+
+    def _position(self, key: str, keyword: str) -> tuple[int, bool]:
+        """Position of keyword (or the end of its key's run) and whether it is present"""
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i] == key:
+            if self._keywords[i] == keyword:
+                return i, True
+            i += 1
+        return i, False
+
+    def apply(self, op: str, keyword: str) -> None:
+        """Insert ("+") or remove ("-") a keyword locally; idempotent"""
+        if self._pending is not None:
+            self._pending.append((op, keyword))
+        key = normalize_search_text(keyword)
+        i, found = self._position(key, keyword)
+        if op == "+" and not found:
+            self._keys.insert(i, keyword if key == keyword else key)
+            self._keywords.insert(i, keyword)
+        elif op == "-" and found:
+            del self._keys[i]
+            del self._keywords[i]
+
+    def apply_many(self, op: str, keywords: list[str]) -> None:
+        """Apply one op to many keywords; large batches take one pass over the index"""
+        if len(keywords) <= MERGE_THRESHOLD:
+            for keyword in keywords:
+                self.apply(op, keyword)
+            return
+        if self._pending is not None:
+            self._pending.extend((op, keyword) for keyword in keywords)
+        if op == "-":
+            # Keywords are unique, so filtering by keyword is exact
+            removed = set(keywords)
+            kept = [(key, keyword) for key, keyword in zip(self._keys, self._keywords) if keyword not in removed]
+            self._keys = [key for key, _ in kept]
+            self._keywords = [keyword for _, keyword in kept]
+            return
+        new = {}
+        for keyword in keywords:
+            key = normalize_search_text(keyword)
+            if not self._position(key, keyword)[1]:
+                new[keyword] = keyword if key == keyword else key
+        if not new:
+            return  # e.g. our own published batch echoed back
+        merged = heapq.merge(
+            zip(self._keys, self._keywords),
+            sorted(((key, keyword) for keyword, key in new.items()), key=lambda e: e[0]),
+            key=lambda e: e[0],
+        )
+        self._keys, self._keywords = [], []
+        for key, keyword in merged:
+            self._keys.append(key)
+            self._keywords.append(keyword)
+
+    async def add(self, keyword: str) -> None:
+        """Add a keyword in this worker and publish it to the others"""
+        self.apply("+", keyword)
+        await self._publish(f"+{keyword}")
+
+    async def remove(self, keyword: str) -> None:
+        """Remove a keyword in this worker and publish it to the others"""
+        self.apply("-", keyword)
+        await self._publish(f"-{keyword}")
+
+    async def add_many(self, keywords: list[str]) -> None:
+        """Add keywords in this worker and publish them as one message"""
+        if not keywords:
+            return
+        self.apply_many("+", keywords)
+        await self._publish(json.dumps({"op": "+", "keywords": keywords}))
+
+    async def remove_many(self, keywords: list[str]) -> None:
+        """Remove keywords in this worker and publish them as one message"""
+        if not keywords:
+            return
+        self.apply_many("-", keywords)
+        await self._publish(json.dumps({"op": "-", "keywords": keywords}))
+
+    async def rebuild(self, db: Optional[AsyncSession] = None) -> None:
+        """
+        Reload every live keyword from the database
+
+        Args:
+            db: Database session (a new one is opened if omitted)
+        """
+        async with self._rebuild_lock:
+            self._pending = []
+            try:
+                if db is None:
+                    async with AsyncSessionLocal() as session:
+                        keywords = await self._fetch_keywords(session)
+                else:
+                    keywords = await self._fetch_keywords(db)
+                self.load(keywords)
+                pending, self._pending = self._pending, None
+                for op, keyword in pending:
+                    self.apply(op, keyword)
+            finally:
+                self._pending = None
+            self._stale = False
+            self.ready = True
+
+    @staticmethod
+    async def _fetch_keywords(db: AsyncSession) -> list[str]:
+        # Buffered: every keyword is kept anyway, and row-by-row streaming
+        # through a server-side cursor is several times slower
+        result = await db.execute(select(Term.keyword).where(Term.is_deleted == False))
+        return list(result.scalars())
+
+    async def request_rebuild(self) -> None:
+        """Rebuild the index in every worker (after changes not tracked per term)"""
+        if self.manager.redis is None or self._listener is None:
+            await self.rebuild()
+        else:
+            await self._publish("*")
+
+    # Pub/sub
+
+    async def _publish(self, message: str) -> None:
+        if self.manager.redis is None:
+            return
+        try:
+            await self.manager.redis.publish(self.channel, message)
+        except Exception as e:
+            # Other workers miss this change until their next rebuild
+            logger.warning("Suggest index publish failed: %s", e)
+
+    async def handle_message(self, message: str) -> None:
+        """Apply a change received from a worker (including this one)"""
+        if message == "*":
+            await self.rebuild()
+        elif message[:1] == "{":
+            batch = json.loads(message)
+            self.apply_many(batch["op"], batch["keywords"])
+        elif message[:1] in ("+", "-"):
+            self.apply(message[0], message[1:])
+
+    async def start(self) -> None:
+        """Build the index and start listening for changes from other workers"""
+        try:
+            await self.rebuild()
+        except Exception as e:
+            logger.warning("Suggest index build failed: %s", e)
+            self._stale = True
+        logger.info("Suggest index holds %d keywords", len(self))
+        if self.manager.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the change listener"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self.manager.redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                try:
+                    if self._stale:
+                        await self.rebuild()
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            await self.handle_message(message["data"])
+                finally:
+                    await pubsub.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Changes published while disconnected are lost; rebuild on reconnect
+                logger.warning("Suggest index listener error: %s", e)
+                self._stale = True
+                await asyncio.sleep(1.0)
+
+
+# Global suggest index instance
+suggest_index = SuggestIndex(manager=redis_manager, channel=settings.SUGGEST_INDEX_CHANNEL)
@@ -0,0 +1,547 @@
+"""Streaming term import from CSV, JSONL and TBX files"""
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+import logging
+import re
+import time
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime
+from itertools import islice
+from typing import IO, Iterator, Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.db.session import engine
+from app.schemas.terminology import TermImportError, TermImportJob
+from app.services.background_jobs import BackgroundJobs
+from app.services.suggest_index import suggest_index
+from app.services.term_service import TermService
+
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "jsonl", "tbx")
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".tbx": "tbx", ".xml": "tbx"}
+
+_LANGUAGE = re.compile(r"^[a-z]{2}$")
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# Above this many new keywords every worker reloads the suggest index
+# instead of receiving the keywords over pub/sub
+SUGGEST_REBUILD_THRESHOLD = 50_000
+
+# Staged rows: one per (keyword, language) definition
+STAGE_TABLE = "term_import_stage"
+STAGE_COLUMNS = ("line", "keyword", "category", "language", "text", "example")
+
+_CREATE_STAGE = text(f"""
+    CREATE TEMPORARY TABLE {STAGE_TABLE} (
+        line integer NOT NULL,
+        keyword varchar(255) NOT NULL,
+        category varchar(100),
+        language varchar(2) NOT NULL,
+        text text NOT NULL,
+        example text
+    )
+""")
+
+_UNKNOWN_CATEGORIES = text(f"""
+    SELECT s.category, min(s.line) AS line, count(DISTINCT s.keyword) AS keywords
+    FROM {STAGE_TABLE} s
+    WHERE NOT EXISTS (SELECT 1 FROM categories c WHERE c.slug = s.category)
+    GROUP BY s.category
+    ORDER BY line
+""")
+
+# Merges the next chunk of staged keywords (in keyword order, after :after)
+# in one statement: new terms take the category of their first row, each
+# gets the first definition per language and an audit row. Existing
+# keywords and unknown categories are skipped.
+_MERGE_CHUNK = text(f"""
+    WITH chunk AS (
+        SELECT DISTINCT keyword FROM {STAGE_TABLE}
+        WHERE keyword > :after
+        ORDER BY keyword
+        LIMIT :size
+    ), first_rows AS (
+        SELECT DISTINCT ON (s.keyword) s.keyword, s.category
+        FROM {STAGE_TABLE} s JOIN chunk USING (keyword)
+        ORDER BY s.keyword, s.line
+    ), new_terms AS (
+        INSERT INTO terms (id, keyword, category_id, creator_id, is_deleted, created_at, updated_at)
+        SELECT gen_random_uuid(), f.keyword, c.id, CAST(:user_id AS integer), false,
+            CAST(:now AS timestamp), CAST(:now AS timestamp)
+        FROM first_rows f JOIN categories c ON c.slug = f.category
+        ON CONFLICT (keyword) DO NOTHING
+        RETURNING id, keyword, category_id
+    ), new_definitions AS (
+        INSERT INTO definitions (id, term_id, language, text, example, is_approved, created_at, updated_at)
+        SELECT DISTINCT ON (t.id, s.language)
+            gen_random_uuid(), t.id, s.language, s.text, s.example, true,
+            CAST(:now AS timestamp), CAST(:now AS timestamp)
+        FROM new_terms t JOIN {STAGE_TABLE} s ON s.keyword = t.keyword
+        ORDER BY t.id, s.language, s.line
+        RETURNING term_id
+    ), audit AS (
+        INSERT INTO term_audit_logs (id, term_id, user_id, action, changes, timestamp)
+        SELECT gen_random_uuid(), t.id, CAST(:user_id AS integer), 'create'::auditaction,
+            json_build_object(
+                'keyword', t.keyword,
+                'definitions_count', (
+                    SELECT count(DISTINCT s.language) FROM {STAGE_TABLE} s WHERE s.keyword = t.keyword
+                ),
+                'source', 'import'
+            )::text,
+            CAST(:now AS timestamp)
+        FROM new_terms t
+    )
+    SELECT
+        (SELECT max(keyword) FROM chunk) AS last_keyword,
+        (SELECT count(*) FROM chunk) AS keywords,
+        (SELECT count(*) FROM new_definitions) AS definitions,
+        (SELECT array_agg(keyword) FROM new_terms) AS created,
+        (
+            SELECT array_agg(DISTINCT c.slug)
+            FROM new_terms t JOIN categories c ON c.id = t.category_id
+        ) AS category_slugs
+""")
+
+# (line, keyword, category, language, text, example)
+ImportRow = tuple[int, str, Optional[str], str, str, Optional[str]]
+
+
+class ImportRowError(ValueError):
+    """A row that cannot be imported; the rest of the file still is"""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(message)
+        self.line = line
+
+
+def _local(tag: str) -> str:
+    """Element name without its namespace"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _clean(value) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _validate(
+    line: int,
+    keyword,
+    category,
+    language,
+    definition,
+    example,
+    default_category: Optional[str]
+) -> ImportRow:
+    """Normalize one definition row, raising ImportRowError if it is unusable"""
+    keyword = _clean(keyword)
+    if keyword is None:
+        raise ImportRowError(line, "Missing keyword")
+    if len(keyword) > 255:
+        raise ImportRowError(line, "Keyword longer than 255 characters")
+    language = (_clean(language) or "").lower()
+    if not _LANGUAGE.match(language):
+        raise ImportRowError(line, f"Invalid language code '{language}'")
+    definition = _clean(definition)
+    if definition is None:
+        raise ImportRowError(line, "Missing definition text")
+    category = _clean(category) or default_category
+    if category is None:
+        raise ImportRowError(line, "Missing category")
+    return (line, keyword, category, language, definition, _clean(example))
+
+
+def _parse_csv(
+    stream: IO[bytes],
+    default_category: Optional[str],
+    source_language: str
+) -> Iterator[Union[ImportRow, ImportRowError]]:
+    """
+    One definition per row, header required
+
+    Columns: keyword, definition (or text), and optionally language
+    (defaults to source_language), category (slug) and example.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    fields = {name.strip().lower() for name in reader.fieldnames or ()}
+    if "keyword" not in fields or not fields & {"definition", "text"}:
+        raise ValueError("CSV header must include 'keyword' and 'definition' columns")
+    for record in reader:
+        record = {(key or "").strip().lower(): value for key, value in record.items()}
+        try:
+            yield _validate(
+                reader.line_num,
+                record.get("keyword"),
+                record.get("category"),
+                record.get("language") or source_language,
+                record.get("definition") or record.get("text"),
+                record.get("example"),
+                default_category,
+            )
+        except ImportRowError as e:
+            yield e
+
+
+def _parse_jsonl(
+    stream: IO[bytes],
+    default_category: Optional[str],
+    source_language: str
+) -> Iterator[Union[ImportRow, ImportRowError]]:
+    """
+    One term per line
+
+    Either {"keyword", "category", "definitions": [{"language", "text",
+    "example"}]} or a single definition {"keyword", "category",
+    "language", "text", "example"}.
+    """
+    for line, raw in enumerate(io.TextIOWrapper(stream, encoding="utf-8-sig"), start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            yield ImportRowError(line, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield ImportRowError(line, "Expected a JSON object")
+            continue
+        definitions = record.get("definitions")
+        if definitions is None:
+            definitions = [record]
+        elif not isinstance(definitions, list) or not definitions:
+            yield ImportRowError(line, "'definitions' must be a non-empty list")
+            continue
+        for definition in definitions:
+            if not isinstance(definition, dict):
+                yield ImportRowError(line, "Each definition must be a JSON object")
+                continue
+            try:
+                yield _validate(
+                    line,
+                    record.get("keyword"),
+                    record.get("category"),
+                    definition.get("language") or source_language,
+                    definition.get("text") or definition.get("definition"),
+                    definition.get("example"),
+                    default_category,
+                )
+            except ImportRowError as e:
+                yield e
+
+
+def _parse_tbx(
+    stream: IO[bytes],
+    default_category: Optional[str],
+    source_language: str
+) -> Iterator[Union[ImportRow, ImportRowError]]:
+    """
+    One term per termEntry (TBX 2) or conceptEntry (TBX 3)
+
+    The keyword is the entry's first term in source_language. Each language
+    section becomes a definition: its definition descrip if present,
+    otherwise (for other languages) its terms as a translation. The
+    category is the entry's subjectField descrip. Entries are removed from
+    the tree once read, so memory stays flat on large files.
+    """
+    entry = 0
+    parents = []
+    for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if _local(elem.tag) not in ("termEntry", "conceptEntry"):
+            continue
+        entry += 1
+        try:
+            yield from _tbx_entry(entry, elem, default_category, source_language)
+        except ImportRowError as e:
+            yield e
+        if parents:
+            parents[-1].remove(elem)
+
+
+def _tbx_entry(
+    entry: int,
+    elem: ElementTree.Element,
+    default_category: Optional[str],
+    source_language: str
+) -> list[ImportRow]:
+    category = None
+    for child in elem:
+        if _local(child.tag) == "descrip" and child.get("type") == "subjectField":
+            category = child.text
+    sections = []
+    for child in elem:
+        if _local(child.tag) not in ("langSet", "langSec"):
+            continue
+        language = (child.get(_XML_LANG) or child.get("lang") or "").split("-")[0].lower()
+        terms, definition, example = [], None, None
+        for node in child.iter():
+            name = _local(node.tag)
+            value = _clean("".join(node.itertext()))
+            if value is None:
+                continue
+            if name == "term":
+                terms.append(value)
+            elif name == "descrip" and node.get("type") == "definition" and definition is None:
+                definition = value
+            elif name == "descrip" and node.get("type") == "context" and example is None:
+                example = value
+        sections.append((language, terms, definition, example))
+    keyword = next(
+        (terms[0] for language, terms, _, _ in sections if language == source_language and terms),
+        None
+    )
+    if keyword is None:
+        raise ImportRowError(entry, f"Entry has no '{source_language}' term")
+    rows = []
+    for language, terms, definition, example in sections:
+        if definition is None and language != source_language:
+            definition = ", ".join(terms)
+        if definition:
+            rows.append(_validate(entry, keyword, category, language, definition, example, default_category))
+    if not rows:
+        raise ImportRowError(entry, f"Entry '{keyword}' has no definitions or translations")
+    return rows
+
+
+_PARSERS = {"csv": _parse_csv, "jsonl": _parse_jsonl, "tbx": _parse_tbx}
+
+
+class TermImportService:
+    """Service class for background term imports"""
+
+    jobs: BackgroundJobs[TermImportJob] = BackgroundJobs(
+        "Term import", "term_import", TermImportJob, "TERM_IMPORT_JOB_TTL", IMPORT_FORMATS, _EXTENSIONS
+    )
+
+    @staticmethod
+    def open_source(path: str) -> IO[bytes]:
+        """Open an import file, transparently decompressing gzip"""
+        stream = open(path, "rb")
+        if stream.peek(2)[:2] == b"\x1f\x8b":
+            return gzip.GzipFile(fileobj=stream)
+        return stream
+
+    @staticmethod
+    def parse(
+        stream: IO[bytes],
+        format: str,
+        default_category: Optional[str] = None,
+        source_language: str = "uz"
+    ) -> Iterator[Union[ImportRow, ImportRowError]]:
+        """
+        Incrementally parse an import file
+
+        Args:
+            stream: Binary file object
+            format: One of IMPORT_FORMATS
+            default_category: Category slug for rows without one
+            source_language: Language of the keyword (TBX) and of CSV/JSONL
+                rows without a language
+
+        Returns:
+            Iterator of rows (line, keyword, category, language, text,
+            example), with ImportRowError instances for rejected rows.
+            Unreadable files raise ValueError (or ElementTree.ParseError).
+        """
+        return _PARSERS[format](stream, default_category, source_language)
+
+    # Import
+
+    @staticmethod
+    async def run_import(
+        conn: AsyncConnection,
+        job: TermImportJob,
+        path: str,
+        default_category: Optional[str] = None,
+        source_language: str = "uz"
+    ) -> TermImportJob:
+        """
+        Import a file into terms, definitions and the audit log
+
+        The file is parsed incrementally in a worker thread, one batch
+        ahead of the database, and each batch is COPYed into a temporary
+        staging table. Only once the whole file has been staged are the
+        rows merged into the real tables, a chunk of keywords per
+        transaction with set-based INSERT ... SELECT statements, so an
+        unreadable file imports nothing. Keywords that already exist are
+        skipped. Progress is saved to the job after every batch and chunk.
+
+        Args:
+            conn: Dedicated database connection (not shared with a session)
+            job: Job to update
+            path: Import file (optionally gzip-compressed)
+            default_category: Category slug for rows without one
+            source_language: Keyword language (see parse)
+
+        Returns:
+            The completed job, with rows_per_second over the whole run
+        """
+        started = time.perf_counter()
+        job.status = "running"
+        job.phase = "staging"
+        job.started_at = datetime.utcnow()
+        await TermImportService.jobs.save_job(job)
+
+        stream = TermImportService.open_source(path)
+        try:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {STAGE_TABLE}"))
+            await conn.execute(_CREATE_STAGE)
+            await TermImportService._stage(
+                conn,
+                job,
+                TermImportService.parse(stream, job.format, default_category, source_language)
+            )
+            await conn.execute(text(f"CREATE INDEX ON {STAGE_TABLE} (keyword, line)"))
+            await conn.execute(text(f"ANALYZE {STAGE_TABLE}"))
+            await conn.commit()
+
+            job.phase = "merging"
+            await TermImportService.jobs.save_job(job)
+            await TermImportService._report_unknown_categories(conn, job)
+            await TermImportService._merge(conn, job)
+        finally:
+            stream.close()
+            await conn.rollback()
+            await conn.execute(text(f"DROP TABLE IF EXISTS {STAGE_TABLE}"))
+            await conn.commit()
+
+        elapsed = time.perf_counter() - started
+        job.status = "completed"
+        job.phase = None
+        job.finished_at = datetime.utcnow()
+        job.elapsed_seconds = round(elapsed, 3)
+        job.rows_per_second = round(job.rows_staged / elapsed, 1) if elapsed > 0 else None
+        await TermImportService.jobs.save_job(job)
+        logger.info(
+            "Term import %s: %d rows staged, %d terms created in %.1fs (%.0f rows/s)",
+            job.id, job.rows_staged, job.terms_created, elapsed, job.rows_per_second or 0
+        )
+        return job
+
+    @staticmethod
+    def _reject(job: TermImportJob, line: int, message: str) -> None:
+        job.rows_rejected += 1
+        if len(job.errors) < settings.TERM_IMPORT_MAX_ERRORS:
+            job.errors.append(TermImportError(line=line, message=message))
+
+    @staticmethod
+    async def _stage(
+        conn: AsyncConnection,
+        job: TermImportJob,
+        rows: Iterator[Union[ImportRow, ImportRowError]]
+    ) -> None:
+        """COPY parsed rows into the staging table, parsing the next batch meanwhile"""
+        batch_size = settings.TERM_IMPORT_COPY_BATCH
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection  # asyncpg connection, in the current transaction
+
+        def next_batch() -> list:
+            return list(islice(rows, batch_size))
+
+        pending = asyncio.ensure_future(asyncio.to_thread(next_batch))
+        try:
+            while True:
+                batch = await pending
+                if not batch:
+                    break
+                pending = asyncio.ensure_future(asyncio.to_thread(next_batch))
+
+                records = []
+                for row in batch:
+                    if isinstance(row, ImportRowError):
+                        TermImportService._reject(job, row.line, str(row))
+                    else:
+                        records.append(row)
+                job.rows_parsed += len(batch)
+                if records:
+                    await driver.copy_records_to_table(STAGE_TABLE, records=records, columns=STAGE_COLUMNS)
+                    job.rows_staged += len(records)
+                await TermImportService.jobs.save_job(job)
+        finally:
+            # Never leave the parser running on a closed file
+            if not pending.done():
+                await asyncio.wait([pending])
+
+    @staticmethod
+    async def _report_unknown_categories(conn: AsyncConnection, job: TermImportJob) -> None:
+        result = await conn.execute(_UNKNOWN_CATEGORIES)
+        for category, line, keywords in result.all():
+            TermImportService._reject(
+                job, line, f"Category '{category}' not found ({keywords} keywords skipped)"
+            )
+        await conn.commit()
+
+    @staticmethod
+    async def _merge(conn: AsyncConnection, job: TermImportJob) -> None:
+        """Merge staged rows into the real tables, one committed chunk at a time"""
+        created_keywords = []
+        after = ""
+        while True:
+            # Stamped per chunk: GET /terms/changes only holds back rows a few
+            # seconds old, so a chunk must not commit with a timestamp from minutes ago
+            now = datetime.utcnow()
+            result = await conn.execute(_MERGE_CHUNK, {
+                "after": after,
+                "size": settings.TERM_IMPORT_MERGE_CHUNK,
+                "user_id": job.user_id,
+                "now": now,
+            })
+            last_keyword, keywords, definitions, created, category_slugs = result.one()
+            await conn.commit()
+            if last_keyword is None:
+                break
+            after = last_keyword
+
+            created = created or []
+            job.keywords_merged += keywords
+            job.terms_created += len(created)
+            job.terms_skipped += keywords - len(created)
+            job.definitions_created += definitions
+            if created:
+                await TermService._invalidate_terms_cache(created, set(category_slugs or ()))
+                created_keywords.extend(created)
+            await TermImportService.jobs.save_job(job)
+
+        if len(created_keywords) > SUGGEST_REBUILD_THRESHOLD:
+            await suggest_index.request_rebuild()
+        else:
+            await suggest_index.add_many(created_keywords)
+
+    # Background execution
+
+    @staticmethod
+    def start_import(
+        job: TermImportJob,
+        path: str,
+        default_category: Optional[str] = None,
+        source_language: str = "uz"
+    ) -> None:
+        """
+        Run an import in the background of this worker
+
+        Args:
+            job: Queued job
+            path: Import file, owned by the job from now on
+            default_category: Category slug for rows without one
+            source_language: Keyword language (see parse)
+        """
+        async def run() -> None:
+            async with engine.connect() as conn:
+                await TermImportService.run_import(conn, job, path, default_category, source_language)
+
+        TermImportService.jobs.start(job, path, run())
@@ -1,25 +1,100 @@
 """Term management service with business logic"""
 
-import json
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 from typing import Optional, List
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, insert, update, or_, func, case, union, union_all, any_, literal, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
 
-from app.models.terminology import Term, Definition, Category, AuditAction
+from app.core.config import settings
+from app.core.pagination import encode_cursor, decode_cursor
+from app.db.session import replica_router
+from app.models.terminology import (
+    Term,
+    DeletedTerm,
+    Definition,
+    Category,
+    AuditAction,
+    normalize_search_text,
+)
 from app.schemas.terminology import (
     TermCreate, 
     TermUpdate, 
-    BulkTermCreate,
     BulkOperationResult,
-    SearchQuery
+    SearchQuery,
+    SearchResponse,
+    TermResponse,
+    TermDetailResponse,
+    DefinitionBase,
+    TermChange,
+    TermTombstone,
+    TermChangesResponse,
 )
 from app.services.audit_service import AuditService
-from app.services.redis_manager import redis_manager
+from app.services.category_service import CategoryService
+from app.services.cache import cache
+from app.services.suggest_index import suggest_index
+
+
+# Term detail cache lifetimes (seconds); writes invalidate keys explicitly
+TERM_DETAIL_TTL = 3600
+TERM_MISSING_TTL = 60
+
+# Search page cache, invalidated by bumping the generation on every term
+# write. Misses get a short TTL: there are many distinct ones, each cheap to keep
+SEARCH_NAMESPACE = "terminology"
+SEARCH_PAGE_TTL = 1800
+SEARCH_EMPTY_TTL = 30
+
+# Fuzzy lookup: trigram candidates fetched per query, then verified by edit distance
+FUZZY_MAX_DISTANCE = 2
+FUZZY_CANDIDATES = 100
+
+# Uzbek Cyrillic -> Latin, so Cyrillic (or mixed-script) input matches Latin keywords
+_CYRILLIC_TO_LATIN = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "yo",
+    "ж": "j", "з": "z", "и": "i", "й": "y", "к": "k", "л": "l", "м": "m",
+    "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+    "ф": "f", "х": "x", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "sh", "ъ": "'",
+    "ь": "", "ы": "i", "э": "e", "ю": "yu", "я": "ya", "ў": "o'", "қ": "q",
+    "ғ": "g'", "ҳ": "h",
+})
+_DOUBLED = re.compile(r"(.)\1+")
+
+
+def _fuzzy_fold(value: str) -> str:
+    """Normalize, transliterate Cyrillic and collapse doubled letters"""
+    value = normalize_search_text(value)
+    if not value.isascii():
+        value = value.translate(_CYRILLIC_TO_LATIN)
+    return _DOUBLED.sub(r"\1", value)
+
+
+def _edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Damerau-Levenshtein (optimal string alignment) distance, bounded
+    
+    Returns max_distance + 1 as soon as the distance must exceed it.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = None
+    current = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+    return min(current[-1], max_distance + 1)
 
 
 class TermService:
@@ -100,6 +175,7 @@ class TermService:
             
             # Invalidate cache
             await TermService._invalidate_term_cache(term.keyword, category.slug)
+            await suggest_index.add(term.keyword)
             
             return term
             
@@ -117,7 +193,7 @@ class TermService:
         include_deleted: bool = False
     ) -> Optional[Term]:
         """
-        Get term by keyword with caching
+        Get term by keyword
         
         Args:
             db: Database session
@@ -127,14 +203,6 @@ class TermService:
         Returns:
             Term if found, None otherwise
         """
-        # Try cache first (only for non-deleted terms)
-        if not include_deleted:
-            cache_key = f"term:{keyword}"
-            cached = await redis_manager.get(cache_key)
-            if cached:
-                # Return cached data (would need to deserialize properly in production)
-                pass
-        
         # Query database
         query = select(Term).where(Term.keyword == keyword)
         if not include_deleted:
@@ -146,15 +214,47 @@ class TermService:
         )
         
         result = await db.execute(query)
-        term = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def get_detail_by_keyword(
+        db: AsyncSession,
+        keyword: str
+    ) -> Optional[TermDetailResponse]:
+        """
+        Get the serialized detail of a live term, read through the cache
         
-        # Cache the result
-        if term and not include_deleted:
-            cache_key = f"term:{keyword}"
-            # In production, serialize the term properly
-            await redis_manager.set(cache_key, "cached", expire=3600)  # 1 hour
+        Hits are served from Redis without touching the database. Unknown
+        keywords are cached as misses for a short time so repeated lookups
+        of missing terms don't reach Postgres either.
         
-        return term
+        Args:
+            db: Database session
+            keyword: Term keyword
+            
+        Returns:
+            Term detail if found, None otherwise
+        """
+        async def load() -> Optional[TermDetailResponse]:
+            result = await db.execute(
+                select(Term)
+                .where(Term.keyword == keyword, Term.is_deleted == False)
+                .options(
+                    selectinload(Term.definitions),
+                    selectinload(Term.category),
+                    selectinload(Term.creator),
+                )
+            )
+            term = result.scalar_one_or_none()
+            return TermDetailResponse.model_validate(term) if term else None
+        
+        return await cache.get_or_set(
+            TermService._detail_cache_key(keyword),
+            load,
+            ttl=TERM_DETAIL_TTL,
+            type_=TermDetailResponse,
+            negative_ttl=TERM_MISSING_TTL,
+        )
     
     @staticmethod
     async def get_by_id(
@@ -196,6 +296,8 @@ class TermService:
         """
         changes = {}
         update_data = term_data.model_dump(exclude_unset=True)
+        old_keyword = term.keyword
+        old_category_slug = term.category.slug
         
         for field, value in update_data.items():
             if getattr(term, field) != value:
@@ -218,8 +320,13 @@ class TermService:
         await db.commit()
         await db.refresh(term, ["definitions", "category", "creator"])
         
-        # Invalidate cache
+        # Invalidate cache (both sides of a rename or category move)
         await TermService._invalidate_term_cache(term.keyword, term.category.slug)
+        if old_keyword != term.keyword or old_category_slug != term.category.slug:
+            await TermService._invalidate_term_cache(old_keyword, old_category_slug)
+        if old_keyword != term.keyword:
+            await suggest_index.remove(old_keyword)
+            await suggest_index.add(term.keyword)
         
         return term
     
@@ -250,69 +357,165 @@ class TermService:
             changes={"keyword": term.keyword}
         )
         
-        await db.flush()
+        # Commit before invalidating so a concurrent read can't re-cache the live term
+        await db.commit()
         
         # Invalidate cache
         await TermService._invalidate_term_cache(term.keyword, term.category.slug)
+        await suggest_index.remove(term.keyword)
     
     @staticmethod
     async def bulk_create_terms(
         db: AsyncSession,
-        bulk_data: BulkTermCreate,
-        user_id: Optional[int] = None
+        terms: List[TermCreate],
+        user_id: Optional[int] = None,
+        chunk_size: Optional[int] = None
     ) -> List[BulkOperationResult]:
         """
-        Create multiple terms efficiently
+        Create many terms with set-based inserts
+        
+        Categories are validated in one query. Each chunk inserts its terms
+        with a multi-row INSERT ... ON CONFLICT (keyword) DO NOTHING
+        RETURNING, then its definitions and audit rows in multi-row
+        inserts, and commits. A failing chunk is rolled back and reported
+        without affecting the others. Caches are invalidated once at the end.
         
         Args:
             db: Database session
-            bulk_data: Bulk creation data
+            terms: Terms to create (later duplicates of a keyword are ignored)
             user_id: ID of the user creating terms
+            chunk_size: Terms per transaction (defaults to TERM_BULK_CHUNK_SIZE)
             
         Returns:
-            List of operation results
+            One result per distinct keyword, in input order
         """
-        results = []
+        chunk_size = chunk_size or settings.TERM_BULK_CHUNK_SIZE
         
         # Deduplicate input
-        unique_keywords = {}
-        for term_data in bulk_data.terms:
-            if term_data.keyword not in unique_keywords:
-                unique_keywords[term_data.keyword] = term_data
-        
-        # Check existing keywords in one query
-        existing_result = await db.execute(
-            select(Term.keyword).where(
-                Term.keyword.in_(list(unique_keywords.keys()))
-            )
-        )
-        existing_keywords = set(existing_result.scalars().all())
+        unique_terms = {}
+        for term_data in terms:
+            unique_terms.setdefault(term_data.keyword, term_data)
         
-        # Process each term
-        for keyword, term_data in unique_keywords.items():
-            if keyword in existing_keywords:
-                results.append(BulkOperationResult(
+        # Validate categories in one query
+        category_ids = {term_data.category_id for term_data in unique_terms.values()}
+        result = await db.execute(
+            select(Category.id, Category.slug).where(Category.id.in_(category_ids))
+        )
+        category_slugs = dict(result.all())
+        
+        results: dict[str, BulkOperationResult] = {}
+        valid = []
+        for keyword, term_data in unique_terms.items():
+            if term_data.category_id in category_slugs:
+                valid.append(term_data)
+            else:
+                results[keyword] = BulkOperationResult(
                     success=False,
                     keyword=keyword,
-                    error="Keyword already exists"
-                ))
-                continue
-            
+                    error=f"Category with ID {term_data.category_id} not found"
+                )
+        
+        created_keywords = []
+        touched_slugs = set()
+        for start in range(0, len(valid), chunk_size):
+            chunk = valid[start:start + chunk_size]
             try:
-                term = await TermService.create_term(db, term_data, user_id)
-                results.append(BulkOperationResult(
-                    success=True,
-                    id=term.id,
-                    keyword=term.keyword
-                ))
+                created = await TermService._insert_terms_chunk(db, chunk, user_id)
+                await db.commit()
             except Exception as e:
-                results.append(BulkOperationResult(
-                    success=False,
-                    keyword=keyword,
-                    error=str(e)
-                ))
+                await db.rollback()
+                for term_data in chunk:
+                    results[term_data.keyword] = BulkOperationResult(
+                        success=False,
+                        keyword=term_data.keyword,
+                        error=str(e)
+                    )
+                continue
+            
+            for term_data in chunk:
+                term_id = created.get(term_data.keyword)
+                if term_id is None:
+                    results[term_data.keyword] = BulkOperationResult(
+                        success=False,
+                        keyword=term_data.keyword,
+                        error="Keyword already exists"
+                    )
+                else:
+                    results[term_data.keyword] = BulkOperationResult(
+                        success=True,
+                        id=term_id,
+                        keyword=term_data.keyword
+                    )
+                    created_keywords.append(term_data.keyword)
+                    touched_slugs.add(category_slugs[term_data.category_id])
+        
+        if created_keywords:
+            await TermService._invalidate_terms_cache(created_keywords, touched_slugs)
+            await suggest_index.add_many(created_keywords)
+        
+        return [results[keyword] for keyword in unique_terms]
+    
+    @staticmethod
+    async def _insert_terms_chunk(
+        db: AsyncSession,
+        chunk: List[TermCreate],
+        user_id: Optional[int]
+    ) -> dict[str, UUID]:
+        """Insert a chunk of terms with definitions and audit rows; returns {keyword: id} of new terms"""
+        now = datetime.utcnow()
+        # A list of parameter sets runs as batched multi-row INSERTs
+        # ("insertmanyvalues") from one cached compilation
+        result = await db.execute(
+            pg_insert(Term)
+            .on_conflict_do_nothing(index_elements=["keyword"])
+            .returning(Term.id, Term.keyword),
+            [
+                {
+                    "id": uuid4(),
+                    "keyword": term_data.keyword,
+                    "category_id": term_data.category_id,
+                    "creator_id": user_id,
+                    "is_deleted": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for term_data in chunk
+            ]
+        )
+        created = {keyword: term_id for term_id, keyword in result.all()}
         
-        return results
+        definitions = []
+        audit_logs = []
+        for term_data in chunk:
+            term_id = created.get(term_data.keyword)
+            if term_id is None:
+                continue
+            definitions.extend(
+                {
+                    "id": uuid4(),
+                    "term_id": term_id,
+                    "language": def_data.language,
+                    "text": def_data.text,
+                    "example": def_data.example,
+                    "is_approved": True,  # Auto-approve
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for def_data in term_data.definitions
+            )
+            audit_logs.append(AuditService.build_row(
+                term_id,
+                user_id,
+                AuditAction.create,
+                {"keyword": term_data.keyword, "definitions_count": len(term_data.definitions)},
+                timestamp=now,
+            ))
+        
+        if definitions:
+            await db.execute(insert(Definition), definitions)
+            await AuditService.log_actions(db, audit_logs)
+        
+        return created
     
     @staticmethod
     async def bulk_delete_terms(
@@ -321,7 +524,11 @@ class TermService:
         user_id: Optional[int] = None
     ) -> List[BulkOperationResult]:
         """
-        Delete multiple terms efficiently
+        Soft delete many terms with one UPDATE
+        
+        Runs UPDATE ... WHERE id = ANY(:ids) AND NOT is_deleted RETURNING,
+        one multi-row audit insert and one commit, then invalidates the
+        caches of all affected terms and categories at once.
         
         Args:
             db: Database session
@@ -329,176 +536,448 @@ class TermService:
             user_id: ID of the user deleting terms
             
         Returns:
-            List of operation results
+            One result per requested ID, in input order
         """
-        results = []
-        
-        # Get all terms in one query
+        now = datetime.utcnow()
         result = await db.execute(
-            select(Term)
-            .where(Term.id.in_(term_ids))
-            .options(selectinload(Term.category))
+            update(Term)
+            .where(
+                Term.id == any_(literal(list(set(term_ids)), ARRAY(PG_UUID(as_uuid=True)))),
+                Term.is_deleted == False,
+            )
+            .values(is_deleted=True, deleted_at=now, deleted_by=user_id, updated_at=now)
+            .returning(Term.id, Term.keyword, Term.category_id)
+            .execution_options(synchronize_session=False)
         )
-        terms = {term.id: term for term in result.scalars().all()}
+        deleted = {term_id: (keyword, category_id) for term_id, keyword, category_id in result.all()}
+        
+        if deleted:
+            await AuditService.log_actions(db, [
+                AuditService.build_row(term_id, user_id, AuditAction.delete, {"keyword": keyword}, timestamp=now)
+                for term_id, (keyword, _) in deleted.items()
+            ])
+            category_ids = {category_id for _, category_id in deleted.values()}
+            slugs = await db.execute(select(Category.slug).where(Category.id.in_(category_ids)))
+            category_slugs = set(slugs.scalars())
+        
+        # Commit before invalidating so a concurrent read can't re-cache live terms
+        await db.commit()
+        
+        if deleted:
+            keywords = [keyword for keyword, _ in deleted.values()]
+            await TermService._invalidate_terms_cache(keywords, category_slugs)
+            await suggest_index.remove_many(keywords)
         
-        # Process each ID
+        results = []
         for term_id in term_ids:
-            term = terms.get(term_id)
-            if not term:
-                results.append(BulkOperationResult(
-                    success=False,
-                    id=term_id,
-                    error="Term not found"
-                ))
-                continue
-            
-            try:
-                await TermService.delete_term(db, term, user_id)
+            if term_id in deleted:
                 results.append(BulkOperationResult(
                     success=True,
                     id=term_id,
-                    keyword=term.keyword
+                    keyword=deleted[term_id][0]
                 ))
-            except Exception as e:
+            else:
                 results.append(BulkOperationResult(
                     success=False,
                     id=term_id,
-                    keyword=term.keyword,
-                    error=str(e)
+                    error="Term not found"
                 ))
-        
-        await db.commit()
         return results
     
+    @staticmethod
+    def _search_statement(search_query: SearchQuery, category_id: Optional[UUID]):
+        """
+        Build the ranked search statement
+        
+        Candidates are the union of three index-backed lookups on
+        normalize_search_text(keyword) (prefix via the text_pattern_ops btree, substring and
+        trigram similarity via the pg_trgm GIN index) and the definitions
+        full-text GIN index. They are ranked exact > prefix > trigram >
+        full-text, then by similarity and ts_rank, and paginated in SQL with
+        the total computed by a window function in the same statement.
+        """
+        q = normalize_search_text(search_query.q)
+        # Postgres LIKE escapes with backslash by default
+        pattern = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        keyword = func.normalize_search_text(Term.keyword)
+        tsquery = func.plainto_tsquery("simple", q)
+        
+        # Best full-text rank per term over its (optionally filtered) definitions
+        fts_filters = [Definition.search_vector.op("@@")(tsquery)]
+        if search_query.language:
+            fts_filters.append(Definition.language == search_query.language)
+        fulltext = (
+            select(
+                Definition.term_id.label("term_id"),
+                func.max(func.ts_rank(Definition.search_vector, tsquery)).label("rank"),
+            )
+            .where(*fts_filters)
+            .group_by(Definition.term_id)
+            .cte("fulltext")
+        )
+        
+        # Substring matching needs at least one trigram to use the index
+        fuzzy = keyword.op("%")(q)
+        if len(q) >= 3:
+            fuzzy = or_(fuzzy, keyword.like(f"%{pattern}%"))
+        
+        live = Term.is_deleted == False
+        candidates = union(
+            select(Term.id.label("id")).where(live, keyword.like(f"{pattern}%")),
+            select(Term.id.label("id")).where(live, fuzzy),
+            select(fulltext.c.term_id.label("id")),
+        ).subquery()
+        
+        tier = case(
+            (keyword == q, 4),
+            (keyword.like(f"{pattern}%"), 3),
+            (fuzzy, 2),
+            else_=1,  # Only matched by a definition
+        )
+        
+        statement = (
+            select(Term, func.count().over().label("total"))
+            .join(candidates, candidates.c.id == Term.id)
+            .outerjoin(fulltext, fulltext.c.term_id == Term.id)
+            .where(Term.is_deleted == False)
+            .order_by(
+                tier.desc(),
+                func.similarity(keyword, q).desc(),
+                func.coalesce(fulltext.c.rank, 0).desc(),
+                Term.keyword,
+            )
+            .offset(search_query.offset)
+            .limit(search_query.limit)
+            .options(
+                selectinload(Term.definitions),
+                selectinload(Term.category),
+                selectinload(Term.creator),
+            )
+        )
+        if category_id:
+            statement = statement.where(Term.category_id == category_id)
+        return statement
+    
     @staticmethod
     async def search_terms(
         db: AsyncSession,
         search_query: SearchQuery
     ) -> tuple[List[Term], int]:
         """
-        Multi-strategy search: exact match → partial match → full-text
+        Ranked search: exact → prefix → trigram/substring → full-text
         
         Args:
             db: Database session
             search_query: Search parameters
             
         Returns:
-            Tuple of (terms list, total count)
+            Tuple of (terms page, total number of matches)
         """
-        # Try cache first
-        cache_key = f"search:{search_query.q}:{search_query.language}:{search_query.category}"
-        cached = await redis_manager.get(cache_key)
-        if cached:
-            # Would deserialize cached results
-            pass
+        # Resolve the category filter once (served from the in-process cache)
+        category_id = None
+        if search_query.category:
+            category_id = await CategoryService.get_id_by_slug(db, search_query.category)
+            if category_id is None:
+                return [], 0
         
-        results = []
-        seen_ids = set()
+        statement = TermService._search_statement(search_query, category_id)
+        rows = (await db.execute(statement)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
         
-        # 1. Exact match on keyword
-        exact_query = select(Term).where(
-            Term.keyword.ilike(search_query.q),
-            Term.is_deleted == False
-        )
-        if search_query.category:
-            category_result = await db.execute(
-                select(Category).where(Category.slug == search_query.category)
-            )
-            category = category_result.scalar_one_or_none()
-            if category:
-                exact_query = exact_query.where(Term.category_id == category.id)
+        if search_query.offset == 0:
+            return [], 0
         
-        exact_query = exact_query.options(
-            selectinload(Term.definitions),
-            selectinload(Term.category)
+        # Page past the end: the window count saw no rows, count separately
+        count_statement = select(func.count()).select_from(
+            statement.limit(None).offset(None).order_by(None).subquery()
         )
+        return [], await db.scalar(count_statement)
+    
+    @staticmethod
+    async def fuzzy_search(
+        db: AsyncSession,
+        search_query: SearchQuery
+    ) -> tuple[List[Term], int]:
+        """
+        Typo-tolerant keyword lookup ("did you mean")
         
-        exact_result = await db.execute(exact_query)
-        for term in exact_result.scalars().all():
-            if term.id not in seen_ids:
-                results.append(term)
-                seen_ids.add(term.id)
+        The pg_trgm GIN index on normalize_search_text(keyword), which
+        Postgres keeps current on every term write, supplies at most
+        FUZZY_CANDIDATES keywords by trigram similarity. Each is then
+        checked by edit distance after folding Cyrillic to Latin and
+        collapsing doubled letters on both sides, so the work per query is
+        bounded regardless of dictionary size.
         
-        # 2. Partial match on keyword
-        if len(results) < search_query.limit:
-            partial_query = select(Term).where(
-                Term.keyword.ilike(f"%{search_query.q}%"),
-                Term.is_deleted == False,
-                Term.id.notin_(seen_ids) if seen_ids else True
-            )
-            if search_query.category:
-                category_result = await db.execute(
-                    select(Category).where(Category.slug == search_query.category)
-                )
-                category = category_result.scalar_one_or_none()
-                if category:
-                    partial_query = partial_query.where(Term.category_id == category.id)
+        Args:
+            db: Database session
+            search_query: Search parameters (language is ignored)
             
-            partial_query = partial_query.options(
+        Returns:
+            Tuple of (terms page, number of keywords within FUZZY_MAX_DISTANCE),
+            closest first
+        """
+        q = _fuzzy_fold(search_query.q)
+        if not q:
+            return [], 0
+        
+        keyword = func.normalize_search_text(Term.keyword)
+        statement = (
+            select(Term.id, Term.keyword)
+            .where(Term.is_deleted == False, keyword.op("%")(q))
+            .order_by(func.similarity(keyword, q).desc())
+            .limit(FUZZY_CANDIDATES)
+        )
+        if search_query.category:
+            category_id = await CategoryService.get_id_by_slug(db, search_query.category)
+            if category_id is None:
+                return [], 0
+            statement = statement.where(Term.category_id == category_id)
+        
+        matches = []
+        for rank, (term_id, term_keyword) in enumerate(await db.execute(statement)):
+            distance = _edit_distance(q, _fuzzy_fold(term_keyword), FUZZY_MAX_DISTANCE)
+            if distance <= FUZZY_MAX_DISTANCE:
+                # Ties keep the trigram similarity order
+                matches.append((distance, rank, term_id))
+        matches.sort()
+        
+        page_ids = [term_id for _, _, term_id in matches[search_query.offset:][:search_query.limit]]
+        if not page_ids:
+            return [], len(matches)
+        
+        result = await db.execute(
+            select(Term)
+            .where(Term.id.in_(page_ids))
+            .options(
                 selectinload(Term.definitions),
-                selectinload(Term.category)
-            ).limit(search_query.limit - len(results))
-            
-            partial_result = await db.execute(partial_query)
-            for term in partial_result.scalars().all():
-                if term.id not in seen_ids:
-                    results.append(term)
-                    seen_ids.add(term.id)
-        
-        # 3. Full-text search on definitions
-        if len(results) < search_query.limit:
-            fulltext_query = (
-                select(Term)
-                .join(Definition)
-                .where(
-                    Definition.search_vector.op('@@')(func.plainto_tsquery('simple', search_query.q)),
-                    Term.is_deleted == False,
-                    Term.id.notin_(seen_ids) if seen_ids else True
-                )
+                selectinload(Term.category),
+                selectinload(Term.creator),
             )
+        )
+        terms = {term.id: term for term in result.scalars()}
+        return [terms[term_id] for term_id in page_ids if term_id in terms], len(matches)
+    
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        search_query: SearchQuery
+    ) -> SearchResponse:
+        """
+        Serialized search page, read through the cache
+        
+        Pages are keyed by the normalized query, so "O‘zbek", "o'zbek" and
+        "oʻzbek" share one entry, under the terminology generation that
+        every term write bumps. Zero-result pages are cached briefly so
+        popular misses don't keep hitting the full-text index.
+        
+        Args:
+            db: Database session
+            search_query: Search parameters
             
-            if search_query.language:
-                fulltext_query = fulltext_query.where(Definition.language == search_query.language)
-            
-            if search_query.category:
-                category_result = await db.execute(
-                    select(Category).where(Category.slug == search_query.category)
-                )
-                category = category_result.scalar_one_or_none()
-                if category:
-                    fulltext_query = fulltext_query.where(Term.category_id == category.id)
-            
-            fulltext_query = fulltext_query.options(
-                selectinload(Term.definitions),
-                selectinload(Term.category)
-            ).limit(search_query.limit - len(results))
-            
-            fulltext_result = await db.execute(fulltext_query)
-            for term in fulltext_result.scalars().all():
-                if term.id not in seen_ids:
-                    results.append(term)
-                    seen_ids.add(term.id)
+        Returns:
+            Search response page
+        """
+        search_query = search_query.model_copy(
+            update={"q": normalize_search_text(search_query.q)}
+        )
+        
+        lookup = TermService.fuzzy_search if search_query.fuzzy else TermService.search_terms
+        
+        async def load() -> Optional[SearchResponse]:
+            async with replica_router.primary_session(db) as session:
+                terms, total = await lookup(session, search_query)
+            if total == 0:
+                return None
+            return SearchResponse(
+                total=total,
+                offset=search_query.offset,
+                limit=search_query.limit,
+                results=[TermResponse.model_validate(term) for term in terms],
+            )
+        
+        # The query goes last: it is the only part that may contain ":"
+        suffix = (
+            f"{'fuzzy' if search_query.fuzzy else 'ranked'}:"
+            f"{search_query.language or '*'}:{search_query.category or '*'}:"
+            f"{search_query.offset}:{search_query.limit}:{search_query.q}"
+        )
+        page = await cache.get_or_set(
+            await cache.versioned_key(SEARCH_NAMESPACE, suffix),
+            load,
+            ttl=SEARCH_PAGE_TTL,
+            type_=SearchResponse,
+            negative_ttl=SEARCH_EMPTY_TTL,
+        )
+        return page or SearchResponse(
+            total=0,
+            offset=search_query.offset,
+            limit=search_query.limit,
+            results=[],
+        )
+    
+    @staticmethod
+    async def get_changes(
+        db: AsyncSession,
+        since: Optional[str] = None,
+        limit: int = 500
+    ) -> TermChangesResponse:
+        """
+        Get terms created, updated or deleted after a cursor
         
-        # Apply pagination
-        total = len(results)
-        paginated = results[search_query.offset:search_query.offset + search_query.limit]
+        Walks terms in (updated_at, id) order with a keyset condition, so
+        every page is an index range scan on ix_terms_updated_at_id no
+        matter how far into the history it starts. Rows changed in the
+        last TERM_CHANGES_SETTLE_SECONDS are held back: updated_at is set
+        before commit, so a slower transaction could otherwise commit a
+        timestamp behind a cursor already handed out. Terms deleted with
+        their category are merged in from deleted_terms, in the same order.
         
-        # Cache the results
-        await redis_manager.set(cache_key, "cached", expire=1800)  # 30 minutes
+        Args:
+            db: Database session
+            since: Cursor from a previous page (None starts from the beginning)
+            limit: Maximum number of changes in the page
+            
+        Returns:
+            Live terms with their definitions, tombstones for deleted ones,
+            and the cursor to pass next time
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        horizon = datetime.utcnow() - timedelta(seconds=settings.TERM_CHANGES_SETTLE_SECONDS)
+        terms_query = (
+            select(Term.id, Term.updated_at, Term.is_deleted)
+            .where(Term.updated_at < horizon)
+            .order_by(Term.updated_at, Term.id)
+            .limit(limit + 1)
+        )
+        # Terms deleted with their category have no row left, only a tombstone
+        removed_query = (
+            select(
+                DeletedTerm.term_id.label("id"),
+                DeletedTerm.deleted_at.label("updated_at"),
+                literal(True).label("is_deleted"),
+            )
+            .where(DeletedTerm.deleted_at < horizon)
+            .order_by(DeletedTerm.deleted_at, DeletedTerm.term_id)
+            .limit(limit + 1)
+        )
+        if since:
+            updated_at, term_id = decode_cursor(since)
+            terms_query = terms_query.where(tuple_(Term.updated_at, Term.id) > tuple_(updated_at, term_id))
+            removed_query = removed_query.where(
+                tuple_(DeletedTerm.deleted_at, DeletedTerm.term_id) > tuple_(updated_at, term_id)
+            )
         
-        return paginated, total
+        terms_page = terms_query.subquery()
+        removed_page = removed_query.subquery()
+        feed = union_all(select(terms_page), select(removed_page)).subquery()
+        page = (await db.execute(
+            select(feed.c.id, feed.c.updated_at, feed.c.is_deleted)
+            .order_by(feed.c.updated_at, feed.c.id)
+            .limit(limit + 1)
+        )).all()
+        has_more = len(page) > limit
+        page = page[:limit]
+        if not page:
+            return TermChangesResponse(upserts=[], deletes=[], next_cursor=since, has_more=False)
+        
+        # Page keys come from the index alone; fetch the rows they point at
+        ids = [term_id for term_id, _, _ in page]
+        live_ids = [term_id for term_id, _, is_deleted in page if not is_deleted]
+        rows = await db.execute(
+            select(Term.id, Term.keyword, Term.category_id, Category.slug, Term.deleted_at)
+            .join(Category, Category.id == Term.category_id)
+            .where(Term.id.in_(ids))
+        )
+        terms = {row.id: row for row in rows}
+        removed_ids = [term_id for term_id, _, _ in page if term_id not in terms]
+        if removed_ids:
+            result = await db.execute(
+                select(DeletedTerm.term_id, DeletedTerm.keyword, DeletedTerm.deleted_at)
+                .where(DeletedTerm.term_id.in_(removed_ids))
+            )
+            terms.update({row.term_id: row for row in result})
+        definitions = {term_id: [] for term_id in live_ids}
+        if live_ids:
+            result = await db.execute(
+                select(Definition.term_id, Definition.language, Definition.text, Definition.example)
+                .where(Definition.term_id.in_(live_ids))
+                .order_by(Definition.term_id, Definition.language)
+            )
+            for term_id, language, text, example in result:
+                definitions[term_id].append(DefinitionBase(language=language, text=text, example=example))
+        
+        upserts, deletes = [], []
+        for term_id, updated_at, is_deleted in page:
+            term = terms[term_id]
+            if is_deleted:
+                deletes.append(TermTombstone(id=term_id, keyword=term.keyword, deleted_at=term.deleted_at))
+            else:
+                upserts.append(TermChange(
+                    id=term_id,
+                    keyword=term.keyword,
+                    category_id=term.category_id,
+                    category=term.slug,
+                    definitions=definitions[term_id],
+                    updated_at=updated_at,
+                ))
+        last_id, last_updated_at, _ = page[-1]
+        return TermChangesResponse(
+            upserts=upserts,
+            deletes=deletes,
+            next_cursor=encode_cursor(last_updated_at, last_id),
+            has_more=has_more,
+        )
+    
+    @staticmethod
+    def _detail_cache_key(keyword: str) -> str:
+        return f"term:{keyword}"
     
     @staticmethod
     async def _invalidate_term_cache(keyword: str, category_slug: Optional[str] = None) -> None:
         """Invalidate Redis cache for a term and its category"""
-        # Invalidate term detail cache
-        cache_key = f"term:{keyword}"
-        await redis_manager.delete_key(cache_key)
+        await TermService._invalidate_terms_cache([keyword], {category_slug} if category_slug else set())
+    
+    @staticmethod
+    async def _invalidate_terms_cache(keywords: List[str], category_slugs: set[str]) -> None:
+        """Invalidate Redis cache for many terms and their categories at once"""
+        # Invalidate term detail cache (also clears cached misses)
+        await TermService.invalidate_term_details(keywords)
+        
+        # Invalidate search pages and the categories' term lists
+        await cache.bump(
+            SEARCH_NAMESPACE,
+            *(f"category:{slug}:terms" for slug in category_slugs)
+        )
+    
+    @staticmethod
+    async def invalidate_term_details(keywords: List[str]) -> None:
+        """Drop cached details of the given terms, in chunks"""
+        keys = [TermService._detail_cache_key(keyword) for keyword in keywords]
+        for start in range(0, len(keys), 500):
+            await cache.delete(*keys[start:start + 500])
+    
+    @staticmethod
+    async def invalidate_search_cache() -> None:
+        """Invalidate every cached search page"""
+        await cache.bump(SEARCH_NAMESPACE)
+    
+    @staticmethod
+    async def invalidate_category_terms(db: AsyncSession, category_id: UUID) -> None:
+        """
+        Drop cached details of every term in a category
         
-        # Invalidate category terms list cache if slug provided
-        if category_slug:
-            pattern = f"category:{category_slug}:terms:*"
-            await redis_manager.delete_pattern(pattern)
+        Term details and search pages embed their category, so renaming a
+        category must evict them. Keys are deleted in chunks.
         
-        # Also invalidate search cache (simplified - in production, track related searches)
-        # await redis_manager.delete_pattern("search:*")
+        Args:
+            db: Database session
+            category_id: Category ID
+        """
+        result = await db.execute(
+            select(Term.keyword).where(Term.category_id == category_id)
+        )
+        await TermService.invalidate_term_details(list(result.scalars()))
+        await TermService.invalidate_search_cache()
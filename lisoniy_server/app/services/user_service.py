@@ -243,10 +243,9 @@ class UserService:
             Dictionary with activity_logs, datasets, discussions, articles
         """
         from app.models.terminology import TermAuditLog
-        from app.models.dataset import Dataset, DataEntry
+        from app.models.dataset import Dataset
         from app.models.post import Post
         from sqlalchemy.orm import selectinload
-        from sqlalchemy import func as sql_func
         
         # Get last 10 term audit logs
         activity_logs_result = await db.execute(
@@ -258,21 +257,16 @@ class UserService:
         )
         activity_logs = list(activity_logs_result.scalars().all())
         
-        # Get last 10 datasets with entry counts
+        # Get last 10 datasets (entry counts come with their meta)
         datasets_result = await db.execute(
             select(Dataset)
+            .options(selectinload(Dataset.meta))
             .where(Dataset.creator_id == user_id)
             .order_by(Dataset.created_at.desc())
             .limit(10)
         )
         datasets = list(datasets_result.scalars().all())
         
-        # Add entry count for each dataset
-        for dataset in datasets:
-            count_query = select(sql_func.count()).where(DataEntry.dataset_id == dataset.id)
-            count = await db.scalar(count_query)
-            dataset.entry_count = count or 0
-        
         # Get last 10 discussions
         discussions_result = await db.execute(
             select(Post)
@@ -383,7 +377,7 @@ class UserService:
         from app.models.user_meta import UserMeta
         from app.models.post import Post
         from app.models.dataset import Dataset, DataEntry
-        from app.models.dataset_meta import DatasetStar
+        from app.models.dataset_meta import DatasetMeta, DatasetStar
         from app.models.terminology import Term
         from app.services.redis_manager import redis_manager
         from sqlalchemy import func as sql_func, desc
@@ -452,18 +446,13 @@ class UserService:
                 print(f"Error fetching likes for user {user_id}: {e}")
         
         # Dataset Size Bonuses
-        # Get all datasets of user and their entry counts
-        # Optimised query: select dataset_id, count(entries) from data_entries join dataset ... group by dataset_id
-        # Actually easier: select count(id) from data_entries where creator_id=user group by dataset_id
-        # Wait, DataEntry.creator_id might differ from Dataset.creator_id (collaboration).
-        # We want size of DATASETS created by User.
-        # So: select Dataset.id, count(DataEntry.id) from Dataset left join DataEntry on ... where Dataset.creator_id == user ...
-        
+        # Entry counts of the DATASETS created by User (DataEntry.creator_id
+        # might differ from Dataset.creator_id with collaboration), as kept
+        # on their meta rows
         ds_sizes_result = await db.execute(
-            select(Dataset.id, sql_func.count(DataEntry.id))
-            .outerjoin(DataEntry, Dataset.id == DataEntry.dataset_id)
+            select(Dataset.id, DatasetMeta.entry_count)
+            .join(DatasetMeta, Dataset.id == DatasetMeta.dataset_id)
             .where(Dataset.creator_id == user_id)
-            .group_by(Dataset.id)
         )
         ds_sizes = ds_sizes_result.all() # list of (id, count)
         
@@ -0,0 +1,122 @@
+"""
+Benchmark streaming dataset downloads
+
+Optionally seeds a dataset with synthetic instruction entries (generated
+in SQL) into the configured DATABASE_URL, then runs
+DatasetExportService.iter_export for each format, discarding the output,
+and prints bytes, time, entries/s and the process's peak RSS. With
+streaming the peak should not move with the number of entries.
+
+Usage:
+    python -m scripts.bench_download --seed 5000000
+    python -m scripts.bench_download --dataset <uuid> --formats jsonl csv
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.db.session import AsyncSessionLocal, engine
+from app.services.dataset_export_service import DatasetExportService, EXPORT_FORMATS
+
+# Seeded entries: an instruction/output pair, every tenth with a nested
+# "source" object, so CSV has a key union and JSON values to encode
+SEED_ENTRIES = text("""
+    INSERT INTO data_entries (id, dataset_id, content, metadata, hash_key, creator_id, created_at, updated_at)
+    SELECT
+        gen_random_uuid(), CAST(:dataset_id AS uuid),
+        jsonb_build_object(
+            'instruction', 'Savol ' || i || ': ' || md5(i::text),
+            'output', 'Javob ' || md5((i * 7)::text) || ' ' || md5((i * 13)::text)
+        ) || CASE WHEN i % 10 = 0
+            THEN jsonb_build_object('source', jsonb_build_object('id', i, 'lang', 'uz'))
+            ELSE '{}'::jsonb END,
+        NULL, md5(CAST(:dataset_id AS text) || i::text) || md5(i::text), :user_id,
+        now() + i * interval '1 microsecond', now()
+    FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS i
+""")
+
+
+def peak_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def seed(entries: int, batch: int = 500_000) -> UUID:
+    async with AsyncSessionLocal() as db:
+        user_id = await db.scalar(text("SELECT min(id) FROM users"))
+        if user_id is None:
+            user_id = await db.scalar(text(
+                "INSERT INTO users (email, hashed_password, full_name, is_active, is_verified, role, created_at, updated_at)"
+                " VALUES ('bench@example.com', 'x', 'Bench', true, true, 'user', now(), now()) RETURNING id"
+            ))
+        dataset_id = await db.scalar(text(
+            "INSERT INTO datasets (id, name, type, is_public, creator_id, created_at, updated_at)"
+            " VALUES (gen_random_uuid(), 'Bench download', 'instruction', true, :user_id, now(), now())"
+            " RETURNING id"
+        ), {"user_id": user_id})
+        await db.commit()
+
+        for start in range(1, entries + 1, batch):
+            await db.execute(SEED_ENTRIES, {
+                "dataset_id": str(dataset_id), "user_id": user_id,
+                "start": start, "stop": min(start + batch - 1, entries),
+            })
+            await db.commit()
+        await db.execute(text(
+            "INSERT INTO dataset_meta (dataset_id, stars_count, downloads_count, views_count,"
+            " entry_count, size_bytes, created_at, updated_at)"
+            " SELECT :id, 0, 0, 0, count(*), sum(octet_length(content::text)), now(), now()"
+            " FROM data_entries WHERE dataset_id = :id"
+        ), {"id": dataset_id})
+        await db.commit()
+        await db.execute(text("ANALYZE data_entries"))
+        await db.commit()
+    print(f"seeded     {entries:,} entries into dataset {dataset_id}")
+    return dataset_id
+
+
+async def run(dataset_id: UUID, fmt: str) -> None:
+    size = 0
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        async for chunk in DatasetExportService.iter_export(db, dataset_id, fmt):
+            size += len(chunk)
+    elapsed = time.perf_counter() - start
+    entries = await _count(dataset_id)
+    print(
+        f"{fmt:<6} {size / 2**20:9.1f} MiB {elapsed:8.2f}s "
+        f"{entries / elapsed:10,.0f} entries/s  peak RSS {peak_rss_mib():.0f} MiB"
+    )
+
+
+async def _count(dataset_id: UUID) -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(
+            text("SELECT count(*) FROM data_entries WHERE dataset_id = :id"), {"id": dataset_id}
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=0, help="Seed a new dataset with this many entries")
+    parser.add_argument("--dataset", type=UUID, help="Existing dataset to export")
+    parser.add_argument("--formats", nargs="+", default=list(EXPORT_FORMATS), choices=list(EXPORT_FORMATS))
+    args = parser.parse_args()
+
+    try:
+        dataset_id = await seed(args.seed) if args.seed else args.dataset
+        if dataset_id is None:
+            parser.error("--seed or --dataset is required")
+        print(f"baseline   peak RSS {peak_rss_mib():.0f} MiB")
+        for fmt in args.formats:
+            await run(dataset_id, fmt)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Benchmark the streaming term importer
+
+Writes a synthetic CSV (two definitions per term) and imports it into the
+configured DATABASE_URL with TermImportService.run_import, then reports
+rows/s for the whole run. The category must exist.
+
+Usage:
+    python -m scripts.bench_import --terms 200000 --category bench
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import tempfile
+import time
+from uuid import uuid4
+
+from app.db.session import engine
+from app.services.term_import_service import TermImportService
+
+
+def write_csv(path: str, terms: int, category: str) -> None:
+    prefix = uuid4().hex[:8]  # fresh keywords on every run
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["keyword", "category", "language", "definition", "example"])
+        for i in range(terms):
+            keyword = f"import-{prefix}-{i}"
+            writer.writerow([keyword, category, "uz", f"{keyword} atamasining ta'rifi", ""])
+            writer.writerow([keyword, category, "en", f"Definition of {keyword}", f"{keyword} in use"])
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=200_000, help="Terms in the generated file")
+    parser.add_argument("--category", default="bench", help="Existing category slug")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        write_csv(path, args.terms, args.category)
+        print(f"file       {os.path.getsize(path) / 2**20:.1f} MiB, {args.terms * 2:,} rows")
+
+        job = await TermImportService.create_job("csv", os.path.basename(path), None)
+        start = time.perf_counter()
+        async with engine.connect() as conn:
+            job = await TermImportService.run_import(conn, job, path)
+        print(f"import     {time.perf_counter() - start:.2f}s")
+        print(f"created    {job.terms_created:,} terms, {job.definitions_created:,} definitions")
+        print(f"throughput {job.rows_per_second:,.0f} rows/s")
+    finally:
+        os.unlink(path)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Benchmark term search latency
+
+Optionally seeds synthetic terms (with one definition each) into the
+configured DATABASE_URL, then times TermService.search_terms for a set of
+queries covering every ranking tier and prints p50/p95 per query. Run the
+migrations first so the pg_trgm and lower(keyword) indexes exist.
+
+Usage:
+    python -m scripts.bench_search --seed 1000000
+    python -m scripts.bench_search --runs 50
+"""
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.db.session import AsyncSessionLocal, engine
+from app.schemas.terminology import SearchQuery
+from app.services.term_service import TermService
+
+
+def _word(seed: str, length: int = 10) -> str:
+    return hashlib.md5(seed.encode()).hexdigest()[:length]
+
+
+# Seeded keywords are md5(i)[:10] and definitions "bench md5('d' || i)[:8]",
+# so queries for every ranking tier can be derived here
+QUERIES = [
+    ("exact", _word("500000"), 0),
+    ("prefix", _word("12345", 5), 0),
+    ("substring", _word("99999")[2:8], 0),
+    ("trigram", _word("777")[:9] + "x", 0),
+    ("full-text", _word("d4242", 8), 0),
+    ("deep page", _word("1")[:2], 200),
+]
+
+SEED_SQL = """
+WITH category AS (
+    INSERT INTO categories (id, slug, name, created_at, updated_at)
+    VALUES (gen_random_uuid(), 'bench', 'Bench', now(), now())
+    ON CONFLICT (slug) DO UPDATE SET name = EXCLUDED.name
+    RETURNING id
+), new_terms AS (
+    INSERT INTO terms (id, keyword, category_id, is_deleted, created_at, updated_at)
+    SELECT gen_random_uuid(), substr(md5(i::text), 1, 10), (SELECT id FROM category), false, now(), now()
+    FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS i
+    ON CONFLICT (keyword) DO NOTHING
+    RETURNING id, keyword
+)
+INSERT INTO definitions (id, term_id, language, text, is_approved, created_at, updated_at)
+SELECT gen_random_uuid(), t.id, 'uz', 'bench ' || substr(md5('d' || i), 1, 8), true, now(), now()
+FROM new_terms t
+JOIN generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS i
+    ON t.keyword = substr(md5(i::text), 1, 10)
+"""
+
+
+async def seed(count: int, batch: int = 100_000) -> None:
+    for start in range(1, count + 1, batch):
+        async with engine.begin() as conn:
+            await conn.execute(text(SEED_SQL), {"start": start, "stop": min(start + batch - 1, count)})
+        print(f"seeded {min(start + batch - 1, count)} terms")
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE terms"))
+        await conn.execute(text("ANALYZE definitions"))
+
+
+async def bench(runs: int) -> None:
+    async with AsyncSessionLocal() as db:
+        for name, q, offset in QUERIES:
+            search_query = SearchQuery(q=q, offset=offset, limit=20)
+
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                _, total = await TermService.search_terms(db, search_query)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            print(
+                f"{name:<10} q={q!r:<14} offset={offset:<4} total={total:<8} "
+                f"p50={statistics.median(timings):.1f}ms "
+                f"p95={timings[max(0, int(len(timings) * 0.95) - 1)]:.1f}ms"
+            )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic terms to insert first")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query")
+    args = parser.parse_args()
+
+    try:
+        if args.seed:
+            await seed(args.seed)
+        await bench(args.runs)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
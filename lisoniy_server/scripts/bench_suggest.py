@@ -0,0 +1,105 @@
+"""
+Benchmark the keyword suggest index
+
+Builds the in-process prefix index from synthetic keywords (or from the
+terms table of the configured DATABASE_URL with --from-db) and reports
+build time, memory held by the index and suggest() latency for prefixes
+of one to six characters.
+
+Usage:
+    python -m scripts.bench_suggest --keywords 1000000
+    python -m scripts.bench_suggest --from-db
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+
+from app.services.redis_manager import RedisManager
+from app.services.suggest_index import SuggestIndex
+
+
+# Uzbek-like syllables so prefixes have realistic fan-out
+SYLLABLES = [
+    "a", "ba", "da", "ga", "ka", "la", "ma", "na", "o'", "pa", "ra", "sa", "ta",
+    "ya", "za", "sh", "ch", "g'", "er", "in", "lik", "chi", "lar", "tar", "kom",
+    "pyu", "ter", "mo", "del", "tex", "no", "lo", "gi", "ya", "ish", "ga", "dan",
+]
+
+
+def synthetic_keywords(count: int) -> list[str]:
+    rng = random.Random(42)
+    keywords = set()
+    while len(keywords) < count:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+        if rng.random() < 0.2:
+            word += " " + "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        keywords.add(word)
+    return list(keywords)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keywords", type=int, default=1_000_000, help="Synthetic keywords to index")
+    parser.add_argument("--from-db", action="store_true", help="Index the terms table instead")
+    parser.add_argument("--lookups", type=int, default=10_000, help="Timed suggest() calls")
+    args = parser.parse_args()
+
+    index = SuggestIndex(manager=RedisManager(), channel="bench:suggest")
+
+    if args.from_db:
+        from app.db.session import engine
+
+        async def build() -> None:
+            await index.rebuild()
+    else:
+        synthetic = synthetic_keywords(args.keywords)
+
+        async def build() -> None:
+            # Copies so the index doesn't share the generator's strings
+            index.load([k[:1] + k[1:] for k in synthetic])
+
+    start = time.perf_counter()
+    await build()
+    build_seconds = time.perf_counter() - start
+
+    # Second build under tracemalloc (too slow to time) to measure memory
+    index.load([])
+    tracemalloc.start()
+    await build()
+    index_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    keywords = list(index._keywords)
+    if args.from_db:
+        await engine.dispose()
+
+    print(f"keywords   {len(index):,}")
+    print(f"build      {build_seconds:.2f}s")
+    print(f"memory     {index_bytes / 2**20:.1f} MiB (peak during build {peak_bytes / 2**20:.1f} MiB)")
+
+    rng = random.Random(7)
+    for length in range(1, 7):
+        prefixes = [rng.choice(keywords)[:length] for _ in range(args.lookups)]
+        timings = []
+        for prefix in prefixes:
+            start = time.perf_counter()
+            index.suggest(prefix, 10)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+        timings.sort()
+        print(
+            f"prefix={length} p50={statistics.median(timings):.1f}us "
+            f"p99={timings[int(len(timings) * 0.99) - 1]:.1f}us"
+        )
+
+    start = time.perf_counter()
+    for keyword in rng.sample(keywords, 1000):
+        index.apply("-", keyword)
+        index.apply("+", keyword)
+    print(f"update     {(time.perf_counter() - start) / 2:.3f}ms per add/remove")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Benchmark GET /terms/{keyword} lookups through the term detail cache
+
+Runs every lookup twice against the configured DATABASE_URL and REDIS_URL:
+once cold (cache flushed for those keys) and once warm, and reports SQL
+statements per lookup and latency for each pass.
+
+Usage:
+    python -m scripts.bench_term_cache [number_of_keywords]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import event, select
+
+from app.db.session import AsyncSessionLocal, engine
+from app.models.terminology import Term
+from app.services.cache import cache
+from app.services.redis_manager import redis_manager
+from app.services.term_service import TermService
+
+
+async def run_pass(keywords: list[str], counter: dict) -> tuple[float, list[float]]:
+    """Look up every keyword once; returns (queries per lookup, latencies in ms)"""
+    counter["queries"] = 0
+    latencies = []
+    async with AsyncSessionLocal() as db:
+        for keyword in keywords:
+            start = time.perf_counter()
+            await TermService.get_detail_by_keyword(db, keyword)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return counter["queries"] / len(keywords), latencies
+
+
+def report(name: str, queries: float, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+    print(
+        f"{name:<5} queries/lookup={queries:.2f} "
+        f"mean={statistics.mean(latencies):.2f}ms p95={p95:.2f}ms"
+    )
+
+
+async def main(limit: int) -> None:
+    await redis_manager.connect()
+
+    counter = {"queries": 0}
+
+    def on_execute(*args):
+        counter["queries"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Term.keyword).where(Term.is_deleted == False).limit(limit)
+            )
+            keywords = list(result.scalars())
+        if not keywords:
+            print("No terms in the database")
+            return
+
+        # Include a missing keyword to exercise negative caching
+        keywords.append("__bench_missing_term__")
+        await cache.delete(*[TermService._detail_cache_key(k) for k in keywords])
+
+        report("cold", *await run_pass(keywords, counter))
+        report("warm", *await run_pass(keywords, counter))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+        await redis_manager.disconnect()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
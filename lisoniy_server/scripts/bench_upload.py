@@ -0,0 +1,88 @@
+"""
+Benchmark streaming entry uploads
+
+Writes a synthetic JSONL file of instruction entries and loads it into a
+new dataset in the configured DATABASE_URL with
+EntryUploadService.ingest_file, then reports entries/s for the whole run.
+A second pass over the same file measures the all-duplicates path.
+Needs Redis (REDIS_URL) for the hash cache.
+
+Usage:
+    python -m scripts.bench_upload --entries 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from app.db.session import AsyncSessionLocal, engine
+from app.services.entry_upload_service import EntryUploadService
+from app.services.redis_manager import redis_manager
+
+
+def write_jsonl(path: str, entries: int) -> None:
+    prefix = uuid4().hex[:8]  # fresh content on every run
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(entries):
+            entry = {
+                "instruction": f"Savol {prefix}-{i}: matnni tarjima qiling",
+                "input": f"Hello world number {i}",
+                "output": f"Salom dunyo, {i}-raqam",
+            }
+            if i % 10 == 0:
+                entry["source"] = {"id": i, "lang": "uz"}
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+async def create_dataset() -> tuple:
+    async with AsyncSessionLocal() as db:
+        user_id = await db.scalar(text("SELECT min(id) FROM users"))
+        dataset_id = await db.scalar(text(
+            "INSERT INTO datasets (id, name, type, is_public, creator_id, created_at, updated_at)"
+            " VALUES (gen_random_uuid(), 'Bench upload', 'instruction', true, :user_id, now(), now())"
+            " RETURNING id"
+        ), {"user_id": user_id})
+        await db.commit()
+    return dataset_id, user_id
+
+
+async def run(label: str, path: str, dataset_id, user_id) -> None:
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        result = await EntryUploadService.ingest_file(dataset_id, user_id, f, "jsonl")
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<10} {elapsed:7.2f}s {result.total / elapsed:10,.0f} entries/s  "
+        f"created {result.created:,} skipped {result.skipped:,} failed {result.failed:,} "
+        f"in {len(result.chunks)} chunks"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000, help="Entries in the generated file")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    try:
+        write_jsonl(path, args.entries)
+        print(f"file       {os.path.getsize(path) / 2**20:.1f} MiB, {args.entries:,} entries")
+        if redis_manager.redis is None:
+            await redis_manager.connect()
+        dataset_id, user_id = await create_dataset()
+        await run("load", path, dataset_id, user_id)
+        await run("reload", path, dataset_id, user_id)
+    finally:
+        os.unlink(path)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,16 +5,23 @@ import asyncio
 from typing import AsyncGenerator
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from fakeredis import aioredis as fake_aioredis
 
 from app.main import app
+from app.core.config import settings
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.replica import ReplicaRouter
+from app.db.session import get_db, get_read_db
 from app.models.user import User, UserRole
 from app.models.dataset import Dataset
 from app.models.post import Post
 from app.models.terminology import Term, TermAuditLog, AuditAction, Category
 from app.core.security import get_password_hash
+from app.services import dataset_export_service
+from app.services.dataset_export_service import DatasetExportService
+from app.services.redis_manager import redis_manager
 
 
 # Test database URL
@@ -55,6 +62,7 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
@@ -62,6 +70,15 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+async def fake_redis(monkeypatch):
+    """Point the global RedisManager at an in-memory fake Redis"""
+    client = fake_aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_manager, "redis", client)
+    yield client
+    await client.flushall()
+
+
 @pytest.fixture
 async def test_user(db_session: AsyncSession) -> dict:
     """Create test user"""
@@ -257,3 +274,26 @@ async def test_datasets_with_dates(db_session: AsyncSession, test_user: dict):
     
     await db_session.commit()
     return datasets
+
+
+@pytest.fixture
+async def export_dir(db_session: AsyncSession, monkeypatch, tmp_path):
+    """Build dataset exports from the test database into a temporary UPLOADS_DIR"""
+    factory = async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(dataset_export_service, "replica_router", ReplicaRouter(primary_factory=factory))
+    monkeypatch.setattr(settings, "UPLOADS_DIR", str(tmp_path))
+    yield tmp_path
+    await DatasetExportService.cancel_running()
+
+
+@pytest.fixture
+async def entries(request, db_session: AsyncSession, test_dataset: dict, test_user: dict) -> str:
+    """The test dataset with the test module's ENTRIES, committed one by one so their created_at differ"""
+    from app.services.data_entry_service import DataEntryService
+    
+    for content in request.module.ENTRIES:
+        await DataEntryService.bulk_create_entries(
+            db_session, UUID(test_dataset["id"]), [content], test_user["id"]
+        )
+        await db_session.commit()
+    return test_dataset["id"]
@@ -0,0 +1,121 @@
+"""Tests for the term audit log: write-behind sink, history pages, partitions"""
+
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.terminology import AuditAction, TermAuditLog
+from app.schemas.terminology import TermCreate, DefinitionCreate
+from app.services import audit_service
+from app.services.audit_service import AuditService, audit_sink
+from app.services.term_service import TermService
+
+
+@pytest.fixture
+def buffered(db_session, monkeypatch):
+    """Buffered mode, with the sink writing to the test database"""
+    monkeypatch.setattr(settings, "AUDIT_LOG_MODE", "buffered")
+    monkeypatch.setattr(
+        audit_service, "AsyncSessionLocal",
+        async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    )
+    yield
+    audit_sink._rows.clear()
+
+
+async def count_logs(db_session) -> int:
+    return await db_session.scalar(select(func.count()).select_from(TermAuditLog))
+
+
+class TestAuditSink:
+    """Test suite for AUDIT_LOG_MODE=buffered"""
+
+    @pytest.mark.asyncio
+    async def test_written_after_commit(self, db_session, test_category, buffered):
+        term = await TermService.create_term(db_session, TermCreate(
+            keyword="bufer",
+            category_id=UUID(test_category["id"]),
+            definitions=[DefinitionCreate(language="uz", text="Vaqtinchalik xotira")],
+        ))
+
+        assert await count_logs(db_session) == 0
+        assert len(audit_sink) == 1
+
+        assert await audit_sink.flush() == 1
+        logs, _ = await AuditService.get_term_history(db_session, term.id)
+        assert [log.action for log in logs] == [AuditAction.create]
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_rows_dropped(self, db_session, test_term, buffered):
+        await AuditService.log_action(db_session, UUID(test_term["id"]), None, AuditAction.update)
+        await db_session.rollback()
+
+        assert len(audit_sink) == 0
+
+
+class TestTermHistory:
+    """Test suite for AuditService.get_term_history"""
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages(self, db_session, test_term):
+        term_id = UUID(test_term["id"])
+        start = datetime(2026, 1, 1)
+        await AuditService.log_actions(db_session, [
+            AuditService.build_row(term_id, None, AuditAction.update, {"n": n}, timestamp=start + timedelta(hours=n))
+            for n in range(5)
+        ])
+        await db_session.commit()
+
+        seen, cursor = [], None
+        while True:
+            logs, cursor = await AuditService.get_term_history(db_session, term_id, limit=2, cursor=cursor)
+            seen += [log.timestamp for log in logs]
+            if cursor is None:
+                break
+
+        assert seen == [start + timedelta(hours=n) for n in reversed(range(5))]
+
+        with pytest.raises(ValueError):
+            await AuditService.get_term_history(db_session, term_id, cursor="nonsense")
+
+
+class TestAuditPartitions:
+    """Test suite for AuditService.maintain_partitions"""
+
+    @staticmethod
+    async def partition_of(db_session, timestamp: datetime) -> str:
+        result = await db_session.execute(
+            text('SELECT tableoid::regclass::text FROM term_audit_logs WHERE "timestamp" = :ts'),
+            {"ts": timestamp}
+        )
+        return result.scalar_one_or_none()
+
+    @pytest.mark.asyncio
+    async def test_create_move_and_expire(self, db_session, test_term, monkeypatch):
+        monkeypatch.setattr(settings, "AUDIT_LOG_RETENTION_MONTHS", 12)
+        term_id = UUID(test_term["id"])
+        recent, expired = datetime(2026, 10, 5), datetime(2024, 1, 1)
+        await AuditService.log_actions(db_session, [
+            AuditService.build_row(term_id, None, AuditAction.update, timestamp=recent),
+            AuditService.build_row(term_id, None, AuditAction.update, timestamp=expired),
+        ])
+        await db_session.commit()
+        assert await self.partition_of(db_session, recent) == "term_audit_logs_default"
+
+        created, dropped = await AuditService.maintain_partitions(db_session, today=date(2026, 10, 18))
+
+        assert created == ["term_audit_logs_p202610", "term_audit_logs_p202611", "term_audit_logs_p202612"]
+        assert dropped == []
+        assert await self.partition_of(db_session, recent) == "term_audit_logs_p202610"
+        assert await self.partition_of(db_session, expired) is None
+
+        assert await AuditService.maintain_partitions(db_session, today=date(2026, 10, 31)) == ([], [])
+
+        created, dropped = await AuditService.maintain_partitions(db_session, today=date(2027, 12, 1))
+        assert created == ["term_audit_logs_p202712", "term_audit_logs_p202801", "term_audit_logs_p202802"]
+        assert dropped == ["term_audit_logs_p202610", "term_audit_logs_p202611"]
+        assert await count_logs(db_session) == 0
@@ -0,0 +1,187 @@
+"""Tests for set-based bulk term creation and deletion"""
+
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from sqlalchemy import func, select
+
+from app.core.dependencies import get_current_active_user
+from app.main import app
+from app.models.terminology import AuditAction, Definition, TermAuditLog
+from app.schemas.terminology import TermCreate, DefinitionCreate
+from app.services.term_service import TermService
+from app.services.suggest_index import suggest_index
+from app.services.redis_manager import redis_manager
+from tests.test_term_cache import count_queries
+
+
+@pytest.fixture
+async def fake_cache(monkeypatch):
+    """Point the global cache at an in-memory fake Redis"""
+    client = fake_aioredis.FakeRedis()
+    monkeypatch.setattr(redis_manager, "binary_redis", client)
+    yield client
+    await client.flushall()
+
+
+def make_term(keyword: str, category_id, languages=("uz",)) -> TermCreate:
+    return TermCreate(
+        keyword=keyword,
+        category_id=category_id,
+        definitions=[DefinitionCreate(language=lang, text=f"{keyword} ({lang})") for lang in languages],
+    )
+
+
+class TestBulkCreateTerms:
+    """Test suite for TermService.bulk_create_terms"""
+
+    @pytest.mark.asyncio
+    async def test_creates_terms_definitions_and_audit_rows(self, db_session, test_category):
+        category_id = UUID(test_category["id"])
+        terms = [make_term(f"atama{i}", category_id, ("uz", "en")) for i in range(30)]
+
+        results = await TermService.bulk_create_terms(db_session, terms)
+
+        assert [r.keyword for r in results] == [t.keyword for t in terms]
+        assert all(r.success and r.id for r in results)
+        definitions = await db_session.scalar(
+            select(func.count()).select_from(Definition).where(Definition.term_id.in_([r.id for r in results]))
+        )
+        audit_rows = await db_session.scalar(
+            select(func.count()).select_from(TermAuditLog).where(TermAuditLog.term_id.in_([r.id for r in results]))
+        )
+        assert definitions == 60
+        assert audit_rows == 30
+
+    @pytest.mark.asyncio
+    async def test_statement_count_does_not_grow_with_input(self, db_session, test_category):
+        category_id = UUID(test_category["id"])
+
+        with count_queries(db_session) as small:
+            await TermService.bulk_create_terms(db_session, [make_term(f"kichik{i}", category_id) for i in range(5)])
+        with count_queries(db_session) as large:
+            await TermService.bulk_create_terms(db_session, [make_term(f"katta{i}", category_id) for i in range(500)])
+
+        assert large["queries"] == small["queries"]
+
+    @pytest.mark.asyncio
+    async def test_per_item_failures(self, db_session, test_term, test_category):
+        """Existing keywords, unknown categories and repeats are reported per item"""
+        category_id = UUID(test_category["id"])
+        missing_category = uuid4()
+
+        results = await TermService.bulk_create_terms(db_session, [
+            make_term("yangi", category_id),
+            make_term(test_term["keyword"], category_id),
+            make_term("yetim", missing_category),
+            make_term("yangi", category_id),
+        ])
+
+        assert len(results) == 3
+        new, existing, orphan = results
+        assert new.success and new.keyword == "yangi"
+        assert not existing.success and existing.error == "Keyword already exists"
+        assert not orphan.success and str(missing_category) in orphan.error
+
+    @pytest.mark.asyncio
+    async def test_chunks_commit_independently(self, db_session, test_category):
+        category_id = UUID(test_category["id"])
+        terms = [make_term(f"bo'lak{i}", category_id) for i in range(5)]
+
+        with count_queries(db_session) as counter:
+            results = await TermService.bulk_create_terms(db_session, terms, chunk_size=2)
+
+        assert all(r.success for r in results)
+        # category lookup + 3 chunks x (terms, definitions, audit rows)
+        assert counter["queries"] == 1 + 3 * 3
+
+    @pytest.mark.asyncio
+    async def test_invalidates_caches_once(self, db_session, test_category, fake_cache):
+        """Cached misses are dropped and the suggest index learns the new keywords"""
+        category_id = UUID(test_category["id"])
+        assert await TermService.get_detail_by_keyword(db_session, "ommaviy0") is None
+
+        suggest_index.load([])
+        await TermService.bulk_create_terms(
+            db_session, [make_term(f"ommaviy{i}", category_id) for i in range(300)]
+        )
+
+        term = await TermService.get_detail_by_keyword(db_session, "ommaviy0")
+        assert term is not None and term.definitions[0].text == "ommaviy0 (uz)"
+        assert len(suggest_index.suggest("ommaviy", limit=1000)) == 300
+        suggest_index.load([])
+
+
+class TestBulkDeleteTerms:
+    """Test suite for TermService.bulk_delete_terms"""
+
+    @pytest.mark.asyncio
+    async def test_soft_deletes_with_per_id_results(self, db_session, test_category, test_user):
+        category_id = UUID(test_category["id"])
+        created = await TermService.bulk_create_terms(
+            db_session, [make_term(f"o'chir{i}", category_id) for i in range(3)]
+        )
+        ids = [r.id for r in created]
+        missing = uuid4()
+
+        results = await TermService.bulk_delete_terms(db_session, [ids[0], missing, ids[1]], test_user["id"])
+
+        assert [(r.id, r.success) for r in results] == [(ids[0], True), (missing, False), (ids[1], True)]
+        assert results[0].keyword == "o'chir0"
+        assert results[1].error == "Term not found"
+        assert await TermService.get_by_id(db_session, ids[0]) is None
+        assert await TermService.get_by_id(db_session, ids[2]) is not None
+
+        deleted = await TermService.get_by_id(db_session, ids[1], include_deleted=True)
+        assert deleted.deleted_by == test_user["id"] and deleted.deleted_at is not None
+        audit_rows = await db_session.scalar(
+            select(func.count()).select_from(TermAuditLog)
+            .where(TermAuditLog.term_id.in_(ids), TermAuditLog.action == AuditAction.delete)
+        )
+        assert audit_rows == 2
+
+        # Already deleted terms are reported as missing
+        again = await TermService.bulk_delete_terms(db_session, [ids[0]])
+        assert not again[0].success
+
+    @pytest.mark.asyncio
+    async def test_statement_count_does_not_grow_with_input(self, db_session, test_category):
+        category_id = UUID(test_category["id"])
+        created = await TermService.bulk_create_terms(
+            db_session, [make_term(f"olib{i}", category_id) for i in range(60)]
+        )
+        ids = [r.id for r in created]
+
+        with count_queries(db_session) as small:
+            await TermService.bulk_delete_terms(db_session, ids[:2])
+        with count_queries(db_session) as large:
+            await TermService.bulk_delete_terms(db_session, ids[2:])
+
+        # UPDATE ... RETURNING, audit insert, category slugs
+        assert small["queries"] == large["queries"] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidates_caches(self, db_session, test_term, fake_cache):
+        await TermService.get_detail_by_keyword(db_session, test_term["keyword"])
+        suggest_index.load([test_term["keyword"]])
+
+        await TermService.bulk_delete_terms(db_session, [UUID(test_term["id"])])
+
+        assert await TermService.get_detail_by_keyword(db_session, test_term["keyword"]) is None
+        assert suggest_index.suggest(test_term["keyword"]) == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_route(self, async_client, test_user, test_term):
+        """DELETE /terms/bulk is not captured by DELETE /terms/{term_id}"""
+        app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=test_user["id"])
+
+        response = await async_client.request(
+            "DELETE",
+            "/api/v1/terms/bulk",
+            json={"term_ids": [test_term["id"]]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["successful"] == 1
@@ -0,0 +1,160 @@
+"""Tests for the typed Redis cache layer"""
+
+import asyncio
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from pydantic import BaseModel
+
+from app.services.cache import RedisCache, JsonCodec, OrjsonCodec, MsgpackCodec
+from app.services.redis_manager import RedisManager
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+
+
+@pytest.fixture
+async def redis_cache():
+    """Cache backed by an in-memory fake Redis"""
+    manager = RedisManager()
+    manager.binary_redis = fake_aioredis.FakeRedis()
+    yield RedisCache(manager, codec=OrjsonCodec())
+    await manager.binary_redis.flushall()
+
+
+class TestCodecs:
+    """Codecs round-trip the values services cache"""
+
+    @pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec(), MsgpackCodec()])
+    def test_round_trip(self, codec):
+        item = Item(id=1, name="so‘z", created_at=datetime(2026, 1, 1, 12, 0))
+        value = {"item": item, "id": uuid4(), "tags": ["a", "b"]}
+
+        decoded = codec.decode(codec.encode(value))
+
+        assert decoded["item"]["name"] == "so‘z"
+        assert decoded["item"]["created_at"].startswith("2026-01-01T12:00")
+        assert decoded["tags"] == ["a", "b"]
+
+
+class TestRedisCache:
+    """Test suite for RedisCache"""
+
+    @pytest.mark.asyncio
+    async def test_typed_get_or_set(self, redis_cache):
+        """Values are validated into the requested type on hits"""
+        items = [Item(id=1, name="a", created_at=datetime.utcnow())]
+
+        async def load():
+            return items
+
+        first = await redis_cache.get_or_set("items", load, ttl=60, type_=List[Item])
+        second = await redis_cache.get_or_set("items", load, ttl=60, type_=List[Item])
+
+        assert first == items
+        assert isinstance(second[0], Item)
+        assert second == items
+
+    @pytest.mark.asyncio
+    async def test_single_flight_on_miss(self, redis_cache):
+        """Concurrent misses for one key run the loader once"""
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(*[
+            redis_cache.get_or_set("hot", load, ttl=60) for _ in range(100)
+        ])
+
+        assert calls == 1
+        assert all(r == {"value": 42} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_locked(self, redis_cache):
+        """A stale value is returned when another worker holds the lock"""
+        await redis_cache.set("key", "old", ttl=1, stale_ttl=60)
+        redis_cache.jitter = 0
+        await redis_cache.redis.set("lock:key", "other-worker")
+
+        # Force the stored value to be stale
+        raw = await redis_cache.redis.get("key")
+        _, value = redis_cache.codec.decode(raw)
+        await redis_cache.redis.set("key", redis_cache.codec.encode([0, value]))
+
+        async def load():
+            return "new"
+
+        assert await redis_cache.get_or_set("key", load, ttl=60, stale_ttl=60) == "old"
+
+        await redis_cache.redis.delete("lock:key")
+        assert await redis_cache.get_or_set("key", load, ttl=60, stale_ttl=60) == "new"
+
+    @pytest.mark.asyncio
+    async def test_ttl_jitter_bounds(self, redis_cache):
+        """Jittered TTLs stay within the configured fraction"""
+        redis_cache.jitter = 0.1
+        ttls = {redis_cache._ttl(1000) for _ in range(200)}
+
+        assert min(ttls) >= 900
+        assert max(ttls) <= 1100
+        assert len(ttls) > 1
+
+    @pytest.mark.asyncio
+    async def test_without_redis_falls_through(self):
+        """An unconnected cache simply calls the loader"""
+        disconnected = RedisCache(RedisManager(), codec=JsonCodec())
+
+        async def load():
+            return "fresh"
+
+        assert await disconnected.get_or_set("key", load, ttl=60) == "fresh"
+        assert await disconnected.get("key") is None
+
+
+class TestCacheInvalidation:
+    """Generation counters and tag purges"""
+
+    @pytest.mark.asyncio
+    async def test_bump_changes_versioned_key(self, redis_cache):
+        """Bumping a namespace moves readers to a new key"""
+        before = await redis_cache.versioned_key("entries:abc", "None:0:20")
+        await redis_cache.set(before, ["old"], ttl=60)
+
+        await redis_cache.bump("entries:abc")
+        after = await redis_cache.versioned_key("entries:abc", "None:0:20")
+
+        assert before == "entries:abc:v0:None:0:20"
+        assert after == "entries:abc:v1:None:0:20"
+        assert await redis_cache.get(after) is None
+
+    @pytest.mark.asyncio
+    async def test_bump_is_isolated_per_namespace(self, redis_cache):
+        """Other namespaces keep their generation"""
+        await redis_cache.bump("entries:a", "entries:all")
+
+        assert await redis_cache.generation("entries:a") == 1
+        assert await redis_cache.generation("entries:all") == 1
+        assert await redis_cache.generation("entries:b") == 0
+
+    @pytest.mark.asyncio
+    async def test_purge_tag(self, redis_cache):
+        """Tagged keys are deleted explicitly, untagged ones survive"""
+        await redis_cache.set("k1", 1, ttl=60, tags=["dataset:1"])
+        await redis_cache.set("k2", 2, ttl=60, tags=["dataset:1"])
+        await redis_cache.set("k3", 3, ttl=60, tags=["dataset:2"])
+
+        await redis_cache.purge_tag("dataset:1")
+
+        assert await redis_cache.get("k1") is None
+        assert await redis_cache.get("k2") is None
+        assert await redis_cache.get("k3") == 3
@@ -0,0 +1,82 @@
+"""Tests for category term listings: cursor pagination and term counts"""
+
+from uuid import UUID
+
+import pytest
+
+from app.models.terminology import Category
+from app.schemas.terminology import TermCreate, TermUpdate, DefinitionCreate
+from app.services.category_service import CategoryService
+from app.services.term_service import TermService
+
+
+@pytest.fixture
+async def terms(db_session, test_category) -> list[str]:
+    """Seven terms in the test category, newest last"""
+    category_id = UUID(test_category["id"])
+    keywords = [f"soz-{i}" for i in range(7)]
+    for start in (0, 4):
+        await TermService.bulk_create_terms(db_session, [
+            TermCreate(keyword=keyword, category_id=category_id, definitions=[
+                DefinitionCreate(language="uz", text=f"{keyword} ma'nosi"),
+            ])
+            for keyword in keywords[start:start + 4]
+        ])
+    return keywords
+
+
+class TestCategoryTermCount:
+    """Test suite for the trigger-maintained categories.term_count"""
+
+    @pytest.mark.asyncio
+    async def test_follows_term_writes(self, db_session, test_category, terms):
+        category_id = UUID(test_category["id"])
+        assert await CategoryService.count_category_terms(db_session, category_id) == 7
+
+        ids = [(await TermService.get_by_keyword(db_session, k)).id for k in terms[:2]]
+        await TermService.bulk_delete_terms(db_session, ids)
+        await TermService.delete_term(db_session, await TermService.get_by_keyword(db_session, "soz-2"))
+        assert await CategoryService.count_category_terms(db_session, category_id) == 4
+
+        other = Category(slug="boshqa", name="Boshqa")
+        db_session.add(other)
+        await db_session.commit()
+        term = await TermService.get_by_keyword(db_session, "soz-3")
+        await TermService.update_term(db_session, term, TermUpdate(category_id=other.id))
+
+        assert await CategoryService.count_category_terms(db_session, category_id) == 3
+        assert await CategoryService.count_category_terms(db_session, other.id) == 1
+
+
+class TestCategoryTermsAPI:
+    """Test suite for GET /api/v1/categories/{slug}/terms"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages(self, async_client, terms):
+        url = "/api/v1/categories/test-category/terms"
+        keywords, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = await async_client.get(url, params=params)
+            assert response.status_code == 200
+            page = response.json()
+            assert page["total"] == 7
+            keywords += [term["keyword"] for term in page["terms"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(keywords) == 7 and set(keywords) == set(terms)
+        # Newest chunk first
+        assert set(keywords[:3]) == set(terms[4:])
+
+        # Offset mode still works and agrees with the cursor order
+        response = await async_client.get(url, params={"offset": 3, "limit": 3})
+        assert [term["keyword"] for term in response.json()["terms"]] == keywords[3:6]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, async_client, terms):
+        response = await async_client.get(
+            "/api/v1/categories/test-category/terms", params={"cursor": "bogus"}
+        )
+        assert response.status_code == 400
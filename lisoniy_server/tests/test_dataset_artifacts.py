@@ -0,0 +1,127 @@
+"""Tests for cached dataset download artifacts"""
+
+import asyncio
+import gzip
+import json
+from uuid import UUID
+
+import pytest
+
+from app.services.data_entry_service import DataEntryService
+from app.services.dataset_export_service import DatasetExportService
+
+
+ENTRIES = [
+    {"question": "Nima?", "answer": "Javob"},
+    {"question": "Qayer?", "answer": "Toshkentda"},
+]
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis", "export_dir")
+
+
+async def _download(async_client, dataset_id, headers=IDENTITY, **params):
+    return await async_client.get(f"/api/v1/datasets/{dataset_id}/download", params=params, headers=headers)
+
+
+async def _built(async_client, dataset_id, **params):
+    """Download once (streamed) and wait for the artifact build it starts"""
+    response = await _download(async_client, dataset_id, **params)
+    assert "etag" not in response.headers
+    await asyncio.gather(*DatasetExportService._tasks)
+    return response
+
+
+class TestDatasetArtifacts:
+    """Test suite for cached downloads"""
+
+    @pytest.mark.asyncio
+    async def test_built_once_then_served_from_disk(self, async_client, entries, export_dir):
+        streamed = await _built(async_client, entries, format="jsonl")
+
+        response = await _download(async_client, entries, format="jsonl")
+        assert response.status_code == 200
+        assert response.content == streamed.content
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["accept-ranges"] == "bytes"
+        assert "filename=" in response.headers["content-disposition"]
+        # Named by content version and hash; older versions are gone
+        sha = response.headers["etag"].strip('"')
+        name = f"jsonl-{len(ENTRIES)}-{sha}.jsonl"
+        files = sorted(p.name for p in (export_dir / "exports" / entries).iterdir())
+        assert files == [".jsonl.lock", name, name + ".gz"]
+
+    @pytest.mark.asyncio
+    async def test_if_none_match(self, async_client, entries):
+        await _built(async_client, entries)
+        etag = (await _download(async_client, entries)).headers["etag"]
+
+        response = await _download(async_client, entries, headers={**IDENTITY, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_range(self, async_client, entries):
+        await _built(async_client, entries)
+        whole = (await _download(async_client, entries)).content
+
+        response = await _download(async_client, entries, headers={**IDENTITY, "Range": "bytes=5-"})
+        assert response.status_code == 206
+        assert response.headers["content-range"] == f"bytes 5-{len(whole) - 1}/{len(whole)}"
+        assert response.content == whole[5:]
+
+    @pytest.mark.asyncio
+    async def test_gzip_variant(self, async_client, entries):
+        await _built(async_client, entries)
+        plain = await _download(async_client, entries)
+
+        # httpx would decode the body; read the raw bytes
+        async with async_client.stream(
+            "GET", f"/api/v1/datasets/{entries}/download", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] != plain.headers["etag"]
+        assert gzip.decompress(raw) == plain.content
+        assert json.loads(plain.content) == ENTRIES
+
+    @pytest.mark.asyncio
+    async def test_entry_write_makes_artifact_stale(self, async_client, db_session, entries, test_user):
+        await _built(async_client, entries)
+        old = await _download(async_client, entries)
+
+        await DataEntryService.bulk_create_entries(
+            db_session, UUID(entries), [{"question": "Kim?"}], test_user["id"]
+        )
+        await db_session.commit()
+        db_session.expire_all()
+
+        streamed = await _built(async_client, entries)
+        assert json.loads(streamed.content) == ENTRIES + [{"question": "Kim?"}]
+        new = await _download(async_client, entries)
+        assert new.headers["etag"] != old.headers["etag"]
+        assert new.content == streamed.content
+
+    @pytest.mark.asyncio
+    async def test_downloads_counted(self, async_client, db_session, entries):
+        await _built(async_client, entries)
+        etag = (await _download(async_client, entries)).headers["etag"]
+        # Resumed: counted by its first range only
+        await _download(async_client, entries, headers={**IDENTITY, "Range": "bytes=0-9"})
+        await _download(async_client, entries, headers={**IDENTITY, "Range": "bytes=10-"})
+        await _download(async_client, entries, headers={**IDENTITY, "If-None-Match": etag})
+
+        db_session.expire_all()
+        response = await async_client.get(f"/api/v1/datasets/{entries}/meta")
+        assert response.json()["downloads_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_purge(self, db_session, entries, export_dir):
+        await DatasetExportService.refresh_artifact(UUID(entries), "csv")
+        assert (export_dir / "exports" / entries).exists()
+
+        DatasetExportService.purge(UUID(entries))
+        assert not (export_dir / "exports" / entries).exists()
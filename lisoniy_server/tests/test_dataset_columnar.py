@@ -0,0 +1,113 @@
+"""Tests for Parquet and Arrow dataset downloads"""
+
+import asyncio
+import io
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.core.config import settings
+from app.services.data_entry_service import DataEntryService
+from app.services.dataset_export_service import DatasetExportService
+
+
+# test_dataset is a legal_qa dataset
+ENTRIES = [
+    {"question": "Nima?", "answer": "Javob", "article": 5, "score": 0.5, "verified": True,
+     "tags": ["civil", "tax"]},
+    {"question": "Qayer?", "context": {"law": "Kodeks"}, "article": 12, "score": 1, "tags": []},
+    {"question": "Qachon?", "answer": "Ertaga", "verified": False, "tags": None, "note": 3},
+    {"answer": "Faqat javob", "note": "matn"},
+]
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis", "export_dir")
+
+
+@pytest.fixture(autouse=True)
+def batch_sizes(monkeypatch):
+    """Several fetches per row group and several row groups"""
+    monkeypatch.setattr(settings, "DATASET_EXPORT_BATCH_SIZE", 1)
+    monkeypatch.setattr(settings, "DATASET_EXPORT_ROW_GROUP_SIZE", 2)
+
+
+class TestColumnarDownload:
+    """Test suite for GET /api/v1/datasets/{id}/download?format=parquet|arrow"""
+
+    @pytest.mark.asyncio
+    async def test_parquet_schema(self, async_client, entries):
+        response = await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "parquet"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        parquet = pq.ParquetFile(io.BytesIO(response.content))
+        assert parquet.metadata.num_row_groups == 2
+        assert parquet.metadata.row_group(0).column(0).compression == "ZSTD"
+        # legal_qa columns first, then the other keys alphabetically
+        assert parquet.schema_arrow == pa.schema([
+            ("question", pa.string()),
+            ("context", pa.string()),
+            ("answer", pa.string()),
+            ("article", pa.int64()),
+            ("note", pa.string()),
+            ("score", pa.float64()),
+            ("tags", pa.list_(pa.string())),
+            ("verified", pa.bool_()),
+        ])
+
+    @pytest.mark.asyncio
+    async def test_parquet_values(self, async_client, entries):
+        response = await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "parquet"})
+
+        rows = pq.read_table(io.BytesIO(response.content)).to_pylist()
+        assert rows[0] == {
+            "question": "Nima?", "context": None, "answer": "Javob", "article": 5,
+            "note": None, "score": 0.5, "tags": ["civil", "tax"], "verified": True,
+        }
+        assert rows[1]["context"] == '{"law": "Kodeks"}' and rows[1]["tags"] == []
+        assert rows[2]["tags"] is None and rows[2]["note"] == "3"
+        assert rows[3]["question"] is None and rows[3]["note"] == "matn"
+
+    @pytest.mark.asyncio
+    async def test_arrow(self, async_client, entries):
+        parquet = await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "parquet"})
+        response = await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "arrow"})
+
+        assert response.status_code == 200
+        table = pa.ipc.open_file(pa.BufferReader(response.content)).read_all()
+        assert table.equals(pq.read_table(io.BytesIO(parquet.content)))
+
+    @pytest.mark.asyncio
+    async def test_scalar_entries(self, async_client, db_session, test_dataset, test_user):
+        for content in ({"content": "kalit"}, ["a", 1]):
+            await DataEntryService.bulk_create_entries(
+                db_session, UUID(test_dataset["id"]), [content], test_user["id"]
+            )
+            await db_session.commit()
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{test_dataset['id']}/download", params={"format": "parquet"}
+        )
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.to_pydict() == {"content": ["kalit", '["a", 1]']}
+
+    @pytest.mark.asyncio
+    async def test_empty_dataset(self, async_client, test_dataset):
+        response = await async_client.get(
+            f"/api/v1/datasets/{test_dataset['id']}/download", params={"format": "parquet"}
+        )
+
+        assert pq.read_table(io.BytesIO(response.content)).num_rows == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_without_gzip_variant(self, async_client, entries):
+        url = f"/api/v1/datasets/{entries}/download"
+        streamed = await async_client.get(url, params={"format": "parquet"})
+        await asyncio.gather(*DatasetExportService._tasks)
+
+        response = await async_client.get(url, params={"format": "parquet"}, headers={"Accept-Encoding": "gzip"})
+        assert response.headers["etag"]
+        assert "content-encoding" not in response.headers
+        assert response.content == streamed.content
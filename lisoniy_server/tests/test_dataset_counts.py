@@ -0,0 +1,157 @@
+"""Tests for the entry_count and size_bytes kept on dataset_meta"""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.models.dataset_meta import DatasetMeta
+from app.schemas.dataset import (
+    DatasetCreate, DatasetUpdate, DatasetResponse, DataEntryCreate, DataEntryUpdate
+)
+from app.services.data_entry_service import DataEntryService
+from app.services.dataset_meta_service import DatasetMetaService
+from app.services.dataset_service import DatasetService
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+async def stored_counts(db_session, dataset_id: UUID) -> tuple[int, int]:
+    meta = await DatasetMetaService.get_meta(db_session, dataset_id)
+    await db_session.refresh(meta)
+    return meta.entry_count, meta.size_bytes
+
+
+async def actual_counts(db_session, dataset_id: UUID) -> tuple[int, int]:
+    dataset, total = await DataEntryService.search_entries(db_session, dataset_id=dataset_id, limit=1)
+    return total, await DatasetMetaService.calculate_size(db_session, dataset_id)
+
+
+class TestEntryCounts:
+    """Test suite for the counts maintained by DataEntryService"""
+
+    @pytest.mark.asyncio
+    async def test_follow_entry_writes(self, db_session, test_dataset, test_user):
+        dataset_id = UUID(test_dataset["id"])
+        user_id = test_user["id"]
+
+        entry = await DataEntryService.create_entry(
+            db_session, DataEntryCreate(dataset_id=dataset_id, content={"q": "Savol", "a": "Javob"}), user_id
+        )
+        result = await DataEntryService.bulk_create_entries(
+            db_session, dataset_id, [{"q": f"Savol {i}"} for i in range(5)] + [{"q": "Savol 0"}], user_id
+        )
+        await db_session.commit()
+        assert result.created == 5 and result.skipped == 1
+        assert await stored_counts(db_session, dataset_id) == await actual_counts(db_session, dataset_id)
+        assert (await stored_counts(db_session, dataset_id))[0] == 6
+
+        await DataEntryService.update_entry(
+            db_session, entry.id, DataEntryUpdate(content={"q": "Uzunroq savol", "a": "Uzunroq javob"}), user_id
+        )
+        entries, _ = await DataEntryService.search_entries(db_session, dataset_id=dataset_id, limit=3)
+        await DataEntryService.delete_entry(db_session, entries[0].id, user_id)
+        result = await DataEntryService.bulk_delete_entries(
+            db_session, [e.id for e in entries[1:]], user_id
+        )
+        await db_session.commit()
+
+        assert result.deleted == 2
+        assert await stored_counts(db_session, dataset_id) == await actual_counts(db_session, dataset_id)
+        assert (await stored_counts(db_session, dataset_id))[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fixes_drift(self, db_session, test_dataset, test_user):
+        dataset_id = UUID(test_dataset["id"])
+        await DataEntryService.bulk_create_entries(
+            db_session, dataset_id, [{"text": f"Gap {i}"} for i in range(4)], test_user["id"]
+        )
+        await db_session.commit()
+        expected = await stored_counts(db_session, dataset_id)
+
+        assert await DatasetMetaService.reconcile_entry_counts(db_session) == 0
+
+        await db_session.execute(
+            update(DatasetMeta).where(DatasetMeta.dataset_id == dataset_id).values(entry_count=99, size_bytes=1)
+        )
+        await db_session.commit()
+
+        assert await DatasetMetaService.reconcile_entry_counts(db_session) == 1
+        assert await stored_counts(db_session, dataset_id) == expected
+
+    @pytest.mark.asyncio
+    async def test_missing_meta_rows_get_real_counts(self, db_session, test_dataset, test_user):
+        """Datasets from before meta rows were created eagerly have none"""
+        dataset_id = UUID(test_dataset["id"])
+
+        async def drop_meta():
+            await db_session.execute(delete(DatasetMeta).where(DatasetMeta.dataset_id == dataset_id))
+            await db_session.commit()
+            db_session.expire_all()
+
+        await DataEntryService.bulk_create_entries(
+            db_session, dataset_id, [{"text": f"Eski {i}"} for i in range(3)], test_user["id"]
+        )
+        await db_session.commit()
+        expected = await stored_counts(db_session, dataset_id)
+        assert expected[0] == 3
+
+        await drop_meta()
+        await DatasetMetaService.increment_downloads(db_session, dataset_id)
+        await db_session.commit()
+        assert await stored_counts(db_session, dataset_id) == expected
+        assert (await DatasetMetaService.get_meta(db_session, dataset_id)).downloads_count == 1
+
+        await drop_meta()
+        await DataEntryService.bulk_create_entries(db_session, dataset_id, [{"text": "Yangi"}], test_user["id"])
+        await db_session.commit()
+        assert await stored_counts(db_session, dataset_id) == await actual_counts(db_session, dataset_id)
+        assert (await stored_counts(db_session, dataset_id))[0] == 4
+
+        await drop_meta()
+        assert await DatasetMetaService.reconcile_entry_counts(db_session) == 1
+        assert await stored_counts(db_session, dataset_id) == await actual_counts(db_session, dataset_id)
+
+
+class TestDatasetListings:
+    """Test suite for entry counts in dataset responses"""
+
+    @pytest.mark.asyncio
+    async def test_largest_first(self, async_client, db_session, test_user):
+        ids = []
+        for size in (1, 3, 2):
+            dataset = await DatasetService.create_dataset(
+                db_session, DatasetCreate(name=f"Korpus {size}", type="parallel", is_public=True), test_user["id"]
+            )
+            await DataEntryService.bulk_create_entries(
+                db_session, dataset.id, [{"uz": f"{size}-{i}"} for i in range(size)], test_user["id"]
+            )
+            ids.append(str(dataset.id))
+        await db_session.commit()
+        # The API shares this session; drop the meta rows loaded before the writes
+        db_session.expire_all()
+
+        response = await async_client.get("/api/v1/datasets/public", params={"sort_by": "largest"})
+        assert response.status_code == 200
+        datasets = response.json()["datasets"]
+        assert [d["entry_count"] for d in datasets] == [3, 2, 1]
+        assert datasets[0]["meta"]["entry_count"] == 3
+
+        response = await async_client.get(f"/api/v1/datasets/{ids[1]}")
+        assert response.json()["entry_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_update_keeps_count(self, db_session, test_dataset, test_user):
+        dataset_id = UUID(test_dataset["id"])
+        await DataEntryService.bulk_create_entries(
+            db_session, dataset_id, [{"text": "Bir"}, {"text": "Ikki"}], test_user["id"]
+        )
+        await db_session.commit()
+
+        dataset = await DatasetService.update_dataset(
+            db_session, dataset_id, DatasetUpdate(description="Yangilandi"), test_user["id"]
+        )
+        await db_session.commit()
+
+        assert DatasetResponse.model_validate(dataset).entry_count == 2
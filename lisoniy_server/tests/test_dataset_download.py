@@ -0,0 +1,70 @@
+"""Tests for streaming dataset downloads"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from app.core.config import settings
+
+
+ENTRIES = [
+    {"question": "Nima?", "answer": "Javob"},
+    {"question": "Qayer?", "context": {"law": "Kodeks", "article": 5}},
+    {"question": "Qachon?", "answer": "Ertaga, soat 5 da", "verified": True},
+]
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis", "export_dir")
+
+
+@pytest.fixture(autouse=True)
+def batch_size(monkeypatch):
+    """Several round trips even for a handful of entries"""
+    monkeypatch.setattr(settings, "DATASET_EXPORT_BATCH_SIZE", 2)
+
+
+class TestDatasetDownload:
+    """Test suite for GET /api/v1/datasets/{id}/download"""
+
+    @pytest.mark.asyncio
+    async def test_json(self, async_client, entries):
+        response = await async_client.get(f"/api/v1/datasets/{entries}/download")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.content) == ENTRIES
+
+    @pytest.mark.asyncio
+    async def test_jsonl(self, async_client, entries):
+        response = await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "jsonl"})
+
+        assert response.status_code == 200
+        assert "filename=test_dataset_" in response.headers["content-disposition"]
+        assert [json.loads(line) for line in response.text.splitlines()] == ENTRIES
+
+    @pytest.mark.asyncio
+    async def test_csv_header_is_union_of_keys(self, async_client, entries):
+        response = await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "csv"})
+
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0]) == ["answer", "context", "question", "verified"]
+        assert rows[0] == {"answer": "Javob", "context": "", "question": "Nima?", "verified": ""}
+        assert json.loads(rows[1]["context"]) == {"law": "Kodeks", "article": 5}
+        assert rows[2]["answer"] == "Ertaga, soat 5 da" and rows[2]["verified"] == "true"
+
+    @pytest.mark.asyncio
+    async def test_empty_dataset(self, async_client, test_dataset):
+        url = f"/api/v1/datasets/{test_dataset['id']}/download"
+
+        assert json.loads((await async_client.get(url)).content) == []
+        assert (await async_client.get(url, params={"format": "csv"})).content == b""
+
+    @pytest.mark.asyncio
+    async def test_counts_download(self, async_client, db_session, entries):
+        await async_client.get(f"/api/v1/datasets/{entries}/download", params={"format": "jsonl"})
+
+        response = await async_client.get(f"/api/v1/datasets/{entries}/meta")
+        assert response.json()["downloads_count"] == 1
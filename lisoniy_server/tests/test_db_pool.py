@@ -0,0 +1,50 @@
+"""Tests for database pool telemetry"""
+
+import time
+
+from app.db.pool import PoolMonitor
+
+
+class TestPoolMonitor:
+    """Test suite for PoolMonitor"""
+
+    def test_checkout_and_checkin_tracking(self):
+        """Checked-out connections are tracked until checkin"""
+        monitor = PoolMonitor(leak_threshold=30.0)
+        record = object()
+
+        monitor._on_checkout(None, record, None)
+        assert monitor.checkouts == 1
+        assert monitor.stats()["checked_out"] == 1
+
+        monitor._on_checkin(None, record)
+        assert monitor.stats()["checked_out"] == 0
+        assert monitor.leaks_reported == 0
+
+    def test_wait_statistics(self):
+        """Wait times and timeouts are aggregated"""
+        monitor = PoolMonitor(leak_threshold=30.0)
+        monitor.record_wait(0.010)
+        monitor.record_wait(0.030, timed_out=True)
+
+        stats = monitor.stats()
+        assert stats["avg_wait_ms"] == 20.0
+        assert stats["max_wait_ms"] == 30.0
+        assert stats["timeouts"] == 1
+
+    def test_connection_held_past_threshold_is_reported_once(self):
+        """A long-held connection is reported as a leak exactly once"""
+        monitor = PoolMonitor(leak_threshold=0.01)
+        record = object()
+
+        monitor._on_checkout(None, record, None)
+        time.sleep(0.02)
+
+        # The next checkout sweeps overdue connections
+        other = object()
+        monitor._on_checkout(None, other, None)
+        assert monitor.leaks_reported == 1
+        assert len(monitor.stats()["held_over_threshold"]) == 1
+
+        monitor._on_checkin(None, record)
+        assert monitor.leaks_reported == 1
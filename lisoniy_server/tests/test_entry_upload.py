@@ -0,0 +1,146 @@
+"""Tests for streaming entry uploads (POST /entries/upload)"""
+
+import gzip
+import io
+import json
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.dependencies import get_current_active_user
+from app.main import app
+from app.models.dataset import DataEntry
+from app.models.dataset_meta import DatasetMeta
+from app.services import entry_upload_service
+from app.services.data_entry_service import DataEntryService
+from app.services.entry_upload_service import EntryRowError, EntryUploadService
+
+
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+def parse(data: bytes, format: str) -> list:
+    return list(EntryUploadService.parse(io.BytesIO(data), format))
+
+
+@pytest.fixture
+def uploader(async_client, db_session, test_user, test_dataset, monkeypatch):
+    """POST a file to /entries/upload as the test user"""
+    monkeypatch.setattr(entry_upload_service, "engine", db_session.bind)
+    app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=test_user["id"])
+
+    async def upload(name: str, data: bytes, **params):
+        return await async_client.post(
+            "/api/v1/entries/upload",
+            params={"dataset_id": test_dataset["id"], **params},
+            files={"file": (name, data, "application/octet-stream")},
+        )
+    return upload
+
+
+class TestParsers:
+    """Test suite for the incremental upload parsers"""
+
+    def test_jsonl(self):
+        rows = parse(b'\xef\xbb\xbf{"a": 1}\n\n[1]\n{}\n{"b": \n{"c": "d"}\n', "jsonl")
+
+        assert rows[0] == (1, {"a": 1})
+        assert [(row.line, str(row)[:12]) for row in rows[1:4]] == [
+            (3, "Expected a n"), (4, "Expected a n"), (5, "Invalid JSON"),
+        ]
+        assert rows[4] == (6, {"c": "d"})
+
+    def test_csv(self):
+        rows = parse('instruction,output\nSalom,"Hello, world"\n,\nBir,Bitta,Ortiqcha\nIkki,\n'.encode(), "csv")
+
+        assert rows[0] == (2, {"instruction": "Salom", "output": "Hello, world"})
+        assert isinstance(rows[1], EntryRowError) and rows[1].line == 3
+        assert isinstance(rows[2], EntryRowError) and rows[2].line == 4
+        assert rows[3] == (5, {"instruction": "Ikki"})
+
+    def test_csv_requires_header(self):
+        with pytest.raises(ValueError):
+            parse(b"", "csv")
+
+    def test_detect_format(self):
+        assert EntryUploadService.jobs.detect_format("data.ndjson.gz") == "jsonl"
+        assert EntryUploadService.jobs.detect_format("data.txt", "CSV") == "csv"
+        with pytest.raises(ValueError):
+            EntryUploadService.jobs.detect_format("data.parquet")
+
+
+class TestUploadAPI:
+    """Test suite for POST /api/v1/entries/upload"""
+
+    @pytest.mark.asyncio
+    async def test_jsonl_in_chunks(self, uploader, db_session, test_dataset, monkeypatch):
+        monkeypatch.setattr(settings, "DATASET_UPLOAD_CHUNK", 4)
+        lines = [json.dumps({"n": i, "text": f"Matn {i}"}) for i in range(10)]
+        lines.insert(5, "not json")
+        lines.append(lines[0])  # Duplicate within the file
+
+        response = await uploader("entries.jsonl", "\n".join(lines).encode())
+
+        assert response.status_code == 201
+        result = response.json()
+        assert (result["total"], result["created"], result["skipped"], result["failed"]) == (12, 10, 1, 1)
+        assert result["errors"] == [result["errors"][0]] and result["errors"][0].startswith("Line 6:")
+        assert [(c["first_line"], c["last_line"], c["created"], c["skipped"], c["failed"]) for c in result["chunks"]] == [
+            (1, 4, 4, 0, 0), (5, 8, 3, 0, 1), (9, 12, 3, 1, 0),
+        ]
+
+        dataset_id = UUID(test_dataset["id"])
+        contents = (await db_session.execute(
+            select(DataEntry.content).where(DataEntry.dataset_id == dataset_id)
+            .order_by(DataEntry.created_at, DataEntry.id)
+        )).scalars().all()
+        assert [content["n"] for content in contents] == list(range(10))
+        db_session.expire_all()
+        meta = await db_session.scalar(select(DatasetMeta).where(DatasetMeta.dataset_id == dataset_id))
+        assert meta.entry_count == 10
+        assert meta.content_version == 3
+
+    @pytest.mark.asyncio
+    async def test_dedup_matches_bulk_create(self, uploader, db_session, test_dataset, test_user, fake_redis):
+        content = {"savol": "Nima?", "javob": "Ha", "son": 1.5}
+        await DataEntryService.bulk_create_entries(db_session, UUID(test_dataset["id"]), [content], test_user["id"])
+        await db_session.commit()
+        await fake_redis.flushall()
+
+        response = await uploader("entries.jsonl", json.dumps(content, ensure_ascii=False).encode() + b"\n")
+
+        assert (response.json()["created"], response.json()["skipped"]) == (0, 1)
+        hash_key = DataEntryService.generate_hash_key(UUID(test_dataset["id"]), content)
+        assert await fake_redis.get(f"hash:{hash_key}") == "1"
+
+    @pytest.mark.asyncio
+    async def test_gzip_csv(self, uploader, db_session, test_dataset):
+        data = gzip.compress("savol,javob\nNima?,Ha\nQayer?,Toshkent\n".encode())
+
+        response = await uploader("entries.csv.gz", data)
+
+        assert response.json()["created"] == 2
+        contents = (await db_session.execute(
+            select(DataEntry.content).where(DataEntry.dataset_id == UUID(test_dataset["id"]))
+        )).scalars().all()
+        assert {"savol": "Qayer?", "javob": "Toshkent"} in contents
+
+    @pytest.mark.asyncio
+    async def test_unknown_dataset(self, uploader, async_client):
+        response = await async_client.post(
+            "/api/v1/entries/upload",
+            params={"dataset_id": "00000000-0000-0000-0000-000000000000"},
+            files={"file": ("entries.jsonl", b'{"a": 1}\n', "application/x-ndjson")},
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_files(self, uploader, db_session):
+        assert (await uploader("entries.txt", b"abc")).status_code == 400
+        assert (await uploader("entries.csv", b"")).status_code == 400
+
+        count = await db_session.scalar(select(func.count()).select_from(DataEntry))
+        assert count == 0
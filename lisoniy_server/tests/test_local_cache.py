@@ -0,0 +1,92 @@
+"""Tests for the in-process cache tier"""
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from app.services.cache import RedisCache, JsonCodec
+from app.services.local_cache import LocalCache
+from app.services.redis_manager import RedisManager
+
+
+@pytest.fixture
+def local():
+    """Local cache over a fake Redis"""
+    manager = RedisManager()
+    manager.redis = fake_aioredis.FakeRedis(decode_responses=True)
+    manager.binary_redis = fake_aioredis.FakeRedis()
+    remote = RedisCache(manager, codec=JsonCodec())
+    return LocalCache(
+        remote=remote,
+        manager=manager,
+        max_entries=3,
+        max_bytes=1024,
+        default_ttl=60,
+        channel="cache:invalidate",
+    )
+
+
+class TestLocalCache:
+    """Test suite for LocalCache"""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_first_load(self, local):
+        """The second lookup is served locally"""
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return ["a", "b"]
+
+        assert await local.get_or_set("k", load, ttl=60) == ["a", "b"]
+        assert await local.get_or_set("k", load, ttl=60) == ["a", "b"]
+
+        assert calls == 1
+        assert local.stats()["hits"] == 1
+        assert local.stats()["misses"] == 1
+
+    def test_lru_eviction_by_count(self, local):
+        """Least recently used entries are evicted first"""
+        for key in ("a", "b", "c"):
+            local.set_local(key, key)
+        local.get_local("a")
+        local.set_local("d", "d")
+
+        assert set(local._entries) == {"a", "c", "d"}
+        assert local.evictions == 1
+
+    def test_memory_bound(self, local):
+        """Entries are evicted to stay under max_bytes"""
+        local.set_local("big1", "x" * 600)
+        local.set_local("big2", "y" * 600)
+
+        assert local.size_bytes <= local.max_bytes
+        assert list(local._entries) == ["big2"]
+
+    @pytest.mark.asyncio
+    async def test_invalidation_message(self, local):
+        """Messages from other workers drop keys and prefixes"""
+        local.set_local("categories:all", [1])
+        local.set_local("posts:popular_tags:10", [2])
+        local.set_local("posts:popular_tags:20", [3])
+
+        local.handle_message("k:categories:all")
+        local.handle_message("p:posts:popular_tags:")
+
+        assert local._entries == {}
+        assert local.size_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_decorator(self, local):
+        """The decorator keys results by the function arguments"""
+        calls = []
+
+        @local.cached(lambda db, slug: f"category:slug:{slug}", ttl=60)
+        async def lookup(db, slug):
+            calls.append(slug)
+            return slug.upper()
+
+        assert await lookup(None, "it") == "IT"
+        assert await lookup(None, "it") == "IT"
+        assert await lookup(None, "law") == "LAW"
+        assert calls == ["it", "law"]
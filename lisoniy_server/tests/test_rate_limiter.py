@@ -0,0 +1,120 @@
+"""Tests for the token-bucket rate limiter and its middleware"""
+
+import asyncio
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.core.rate_limit import RateLimitMiddleware, RateLimitPolicy
+from app.core.security import create_access_token
+from app.services.rate_limiter import RateLimiter
+from app.services.redis_manager import RedisManager
+
+
+@pytest.fixture
+async def limiter():
+    """Limiter backed by an in-memory fake Redis"""
+    manager = RedisManager()
+    manager.redis = fake_aioredis.FakeRedis(decode_responses=True)
+    yield RateLimiter(manager)
+    await manager.redis.flushall()
+
+
+def _limited_app(limiter: RateLimiter) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/bulk")
+    async def bulk():
+        return {"ok": True}
+
+    @app.get("/open")
+    async def open_route():
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=limiter,
+        policies={("POST", "/bulk"): RateLimitPolicy("bulk", limit=2, window=60)},
+        enabled=True,
+    )
+    return app
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter"""
+
+    @pytest.mark.asyncio
+    async def test_allows_up_to_limit(self, limiter):
+        """The bucket admits `limit` requests, then rejects with a retry hint"""
+        results = [await limiter.hit("k", limit=3, window=60) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert results[2].remaining == 0
+        assert results[3].retry_after >= 1
+        assert results[3].headers()["Retry-After"] == str(results[3].retry_after)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_hits_are_atomic(self, limiter):
+        """Concurrent requests can't all slip past the check"""
+        results = await asyncio.gather(*[
+            limiter.hit("burst", limit=5, window=60) for _ in range(50)
+        ])
+
+        assert sum(r.allowed for r in results) == 5
+
+    @pytest.mark.asyncio
+    async def test_idle_bucket_expires(self, limiter):
+        """The key lives only as long as a full refill takes"""
+        await limiter.hit("ttl", limit=10, window=60)
+
+        ttl = await limiter.manager.redis.pttl("rate_limit:ttl")
+        assert 0 < ttl <= 60 * 1000 / 10 + 1000
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(self):
+        """An unconnected limiter admits everything"""
+        result = await RateLimiter(RedisManager()).hit("k", limit=1, window=60)
+        assert result.allowed
+
+
+class TestRateLimitMiddleware:
+    """Test suite for RateLimitMiddleware"""
+
+    @pytest.mark.asyncio
+    async def test_limited_route_returns_429(self, limiter):
+        """Requests over the policy get 429 with Retry-After"""
+        async with AsyncClient(app=_limited_app(limiter), base_url="http://test") as client:
+            first = await client.post("/bulk")
+            await client.post("/bulk")
+            blocked = await client.post("/bulk/")
+
+        assert first.status_code == 200
+        assert first.headers["X-RateLimit-Limit"] == "2"
+        assert blocked.status_code == 429
+        assert int(blocked.headers["Retry-After"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_unlisted_route_is_not_limited(self, limiter):
+        """Routes without a policy skip Redis entirely"""
+        async with AsyncClient(app=_limited_app(limiter), base_url="http://test") as client:
+            responses = [await client.get("/open") for _ in range(5)]
+
+        assert all(r.status_code == 200 for r in responses)
+        assert "X-RateLimit-Limit" not in responses[0].headers
+
+    @pytest.mark.asyncio
+    async def test_users_have_separate_buckets(self, limiter):
+        """Authenticated users are keyed by user id, not by address"""
+        alice = {"Authorization": f"Bearer {create_access_token({'sub': 'alice'})}"}
+        bob = {"Authorization": f"Bearer {create_access_token({'sub': 'bob'})}"}
+
+        async with AsyncClient(app=_limited_app(limiter), base_url="http://test") as client:
+            for _ in range(2):
+                await client.post("/bulk", headers=alice)
+            alice_blocked = await client.post("/bulk", headers=alice)
+            bob_allowed = await client.post("/bulk", headers=bob)
+
+        assert alice_blocked.status_code == 429
+        assert bob_allowed.status_code == 200
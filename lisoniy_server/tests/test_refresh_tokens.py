@@ -0,0 +1,116 @@
+"""Tests for the per-user refresh token index"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from app.core.security import create_refresh_token
+from app.models.user import RefreshToken
+from app.services.auth_service import AuthService
+from app.services.redis_manager import RedisManager, redis_manager
+
+
+class TestRefreshTokenIndex:
+    """Test suite for the Redis side of refresh tokens"""
+
+    @pytest.mark.asyncio
+    async def test_store_verify_and_revoke_all(self):
+        """Tokens live in one per-user key that a single DEL revokes"""
+        manager = RedisManager()
+        manager.redis = fake_aioredis.FakeRedis(decode_responses=True)
+        expires_at = datetime.utcnow() + timedelta(days=7)
+
+        await manager.store_refresh_token(1, "token-a", expires_at)
+        await manager.store_refresh_token(1, "token-b", expires_at)
+        await manager.store_refresh_token(2, "token-c", expires_at)
+
+        assert await manager.redis.zcard("refresh_tokens:1") == 2
+        assert "token-a" not in await manager.redis.zrange("refresh_tokens:1", 0, -1)
+        assert await manager.verify_refresh_token(1, "token-a")
+
+        await manager.revoke_all_user_tokens(1)
+
+        assert not await manager.verify_refresh_token(1, "token-a")
+        assert not await manager.verify_refresh_token(1, "token-b")
+        assert await manager.verify_refresh_token(2, "token-c")
+
+    @pytest.mark.asyncio
+    async def test_expired_tokens_are_rejected_and_trimmed(self):
+        """Per-token expiry is enforced and expired members are pruned on write"""
+        manager = RedisManager()
+        manager.redis = fake_aioredis.FakeRedis(decode_responses=True)
+
+        await manager.store_refresh_token(1, "old", datetime.utcnow() - timedelta(seconds=5))
+        assert not await manager.verify_refresh_token(1, "old")
+
+        await manager.store_refresh_token(1, "new", datetime.utcnow() + timedelta(days=7))
+        assert await manager.redis.zcard("refresh_tokens:1") == 1
+
+    @pytest.mark.asyncio
+    async def test_older_token_never_shortens_ttl(self):
+        """The index outlives its latest token whatever order tokens are stored in"""
+        manager = RedisManager()
+        manager.redis = fake_aioredis.FakeRedis(decode_responses=True)
+
+        await manager.store_refresh_token(1, "long", datetime.utcnow() + timedelta(days=30))
+        await manager.store_refresh_token(1, "short", datetime.utcnow() + timedelta(days=1))
+
+        assert await manager.redis.ttl("refresh_tokens:1") > timedelta(days=29).total_seconds()
+        assert await manager.verify_refresh_token(1, "long")
+        assert await manager.verify_refresh_token(1, "short")
+
+
+class TestRefreshTokenValidation:
+    """Test suite for AuthService refresh token handling"""
+
+    async def _db_token(self, db_session, user_id: int, expires_in: timedelta) -> str:
+        token = create_refresh_token({"sub": str(user_id), "jti": uuid4().hex})
+        db_session.add(RefreshToken(
+            token=token,
+            user_id=user_id,
+            expires_at=datetime.utcnow() + expires_in,
+            is_revoked=False,
+        ))
+        await db_session.commit()
+        return token
+
+    @pytest.mark.asyncio
+    async def test_database_fallback_reseeds_index(self, db_session, test_user, fake_redis):
+        """A token unknown to Redis is checked in the database once, then indexed"""
+        user_id = test_user["id"]
+        token = await self._db_token(db_session, user_id, timedelta(days=7))
+
+        assert await AuthService.refresh_access_token(db_session, token)
+        assert await redis_manager.verify_refresh_token(user_id, token)
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_blocks_fallback(self, db_session, test_user, fake_redis):
+        """Revoked tokens can't be resurrected from the database"""
+        user_id = test_user["id"]
+        token = await self._db_token(db_session, user_id, timedelta(days=7))
+        await AuthService.refresh_access_token(db_session, token)
+
+        await AuthService.revoke_all_user_tokens(db_session, user_id)
+
+        with pytest.raises(HTTPException) as exc:
+            await AuthService.refresh_access_token(db_session, token)
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_purge_expired_in_batches(self, db_session, test_user):
+        """Expired rows are deleted across several batches, live rows survive"""
+        user_id = test_user["id"]
+        for _ in range(5):
+            await self._db_token(db_session, user_id, timedelta(days=-1))
+        live = await self._db_token(db_session, user_id, timedelta(days=7))
+
+        deleted = await AuthService.purge_expired_refresh_tokens(db_session, batch_size=2)
+
+        remaining = await db_session.scalars(select(RefreshToken.token))
+        assert deleted == 5
+        assert list(remaining) == [live]
+        assert await db_session.scalar(select(func.count(RefreshToken.id))) == 1
@@ -0,0 +1,240 @@
+"""Tests for ranked term search"""
+
+from uuid import UUID
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from sqlalchemy import func, text, update
+
+from app.core.config import settings
+from app.models.terminology import Term, Definition, normalize_search_text
+from app.schemas.terminology import SearchQuery, TermCreate, DefinitionCreate
+from app.services.redis_manager import redis_manager
+from app.services.term_service import TermService, SEARCH_EMPTY_TTL, _edit_distance
+from tests.test_term_cache import count_queries
+
+
+@pytest.fixture
+async def trigram(db_session):
+    """Ensure pg_trgm's similarity() and % operator exist, or skip"""
+    try:
+        async with db_session.begin_nested():
+            await db_session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except Exception:
+        pass
+    if await db_session.scalar(text("SELECT to_regproc('similarity')")) is None:
+        pytest.skip("pg_trgm is not available")
+
+
+@pytest.fixture
+async def search_terms(db_session, test_category, trigram):
+    """Terms covering every ranking tier for the query 'kompyuter'"""
+    category_id = UUID(test_category["id"])
+    rows = {
+        "kompyuter": "computer",
+        "kompyuter tarmog'i": "network of computers",
+        "shaxsiy kompyuter": "personal computer",
+        "kompyter": "misspelled",
+        "protsessor": "kompyuter markaziy qismi",
+        "monitor": "display",
+        "o\u02bbzbek tili": "uzbek language",
+    }
+    for keyword, definition in rows.items():
+        term = Term(keyword=keyword, category_id=category_id)
+        db_session.add(term)
+        await db_session.flush()
+        db_session.add(Definition(term_id=term.id, language="uz", text=definition))
+    await db_session.flush()
+
+    # Tests build the schema with create_all, so there is no trigger
+    await db_session.execute(
+        update(Definition).values(search_vector=func.to_tsvector("simple", Definition.text))
+    )
+    await db_session.commit()
+
+
+@pytest.fixture
+async def fake_cache(monkeypatch):
+    """Point the global cache at an in-memory fake Redis"""
+    client = fake_aioredis.FakeRedis()
+    monkeypatch.setattr(redis_manager, "binary_redis", client)
+    yield client
+    await client.flushall()
+
+
+class TestSearchTerms:
+    """Test suite for TermService.search_terms"""
+
+    @pytest.mark.asyncio
+    async def test_ranking_tiers(self, db_session, search_terms):
+        """Exact > prefix > substring/trigram > definition-only matches"""
+        terms, total = await TermService.search_terms(db_session, SearchQuery(q="Kompyuter"))
+
+        keywords = [t.keyword for t in terms]
+        assert keywords[0] == "kompyuter"
+        assert keywords[1] == "kompyuter tarmog'i"
+        assert set(keywords[2:4]) == {"shaxsiy kompyuter", "kompyter"}
+        assert keywords[4] == "protsessor"
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_offset_pages_and_total(self, db_session, search_terms):
+        """Pages come from the database and keep the full total"""
+        first, total = await TermService.search_terms(
+            db_session, SearchQuery(q="kompyuter", limit=2)
+        )
+        second, second_total = await TermService.search_terms(
+            db_session, SearchQuery(q="kompyuter", offset=2, limit=2)
+        )
+        beyond, beyond_total = await TermService.search_terms(
+            db_session, SearchQuery(q="kompyuter", offset=50, limit=2)
+        )
+
+        assert len(first) == 2 and len(second) == 2
+        assert not {t.id for t in first} & {t.id for t in second}
+        assert total == second_total == beyond_total == 5
+        assert beyond == []
+
+    @pytest.mark.asyncio
+    async def test_like_wildcards_are_literal(self, db_session, search_terms):
+        """User input can't widen the match with % or _"""
+        terms, total = await TermService.search_terms(db_session, SearchQuery(q="%"))
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_filters(self, db_session, search_terms):
+        """Unknown categories match nothing; language filters definition matches"""
+        _, total = await TermService.search_terms(
+            db_session, SearchQuery(q="kompyuter", category="missing")
+        )
+        assert total == 0
+
+        terms, _ = await TermService.search_terms(
+            db_session, SearchQuery(q="markaziy", language="en")
+        )
+        assert terms == []
+
+    @pytest.mark.asyncio
+    async def test_apostrophe_variants_match(self, db_session, search_terms):
+        """o‘, o’, o' and oʻ all find a keyword stored with oʻ"""
+        for q in ("O\u2018zbek tili", "o\u2019zbek  tili", "o'zbek tili", "o`zbek"):
+            terms, _ = await TermService.search_terms(db_session, SearchQuery(q=q))
+            assert terms and terms[0].keyword == "o\u02bbzbek tili", q
+
+
+class TestFuzzySearch:
+    """Test suite for TermService.fuzzy_search"""
+
+    def test_edit_distance(self):
+        assert _edit_distance("kompyuter", "kompyuter", 2) == 0
+        assert _edit_distance("kompyuter", "kmopyuter", 2) == 1  # transposition
+        assert _edit_distance("kompyuter", "kampyutr", 2) == 2
+        assert _edit_distance("kompyuter", "kompyuterlar", 2) == 3
+        assert _edit_distance("monitor", "protsessor", 2) == 3
+
+    @pytest.mark.asyncio
+    async def test_typos_within_two_edits(self, db_session, search_terms):
+        """Closest keywords first; the exact keyword ranks above its misspelling"""
+        terms, total = await TermService.fuzzy_search(db_session, SearchQuery(q="kompyutr"))
+        assert [t.keyword for t in terms] == ["kompyuter", "kompyter"]
+        assert total == 2
+
+        terms, _ = await TermService.fuzzy_search(db_session, SearchQuery(q="monitr"))
+        assert [t.keyword for t in terms] == ["monitor"]
+
+    @pytest.mark.asyncio
+    async def test_script_and_doubled_letters(self, db_session, search_terms):
+        """Cyrillic input and doubled letters fold before comparing"""
+        for q in ("Компьютер", "kommpyuterr", "ўзбек тили"):
+            terms, _ = await TermService.fuzzy_search(db_session, SearchQuery(q=q))
+            assert terms, q
+            assert terms[0].keyword in ("kompyuter", "o\u02bbzbek tili"), q
+
+    @pytest.mark.asyncio
+    async def test_nothing_close(self, db_session, search_terms):
+        terms, total = await TermService.fuzzy_search(db_session, SearchQuery(q="qalam"))
+        assert terms == [] and total == 0
+
+
+class TestSearchCache:
+    """Test suite for the cached TermService.search"""
+
+    def test_normalize_search_text(self):
+        assert normalize_search_text("  G\u2018ALLA  o\u02bbrim ") == "g'alla o'rim"
+        assert normalize_search_text("o\u2019t`") == "o't'"
+
+    @pytest.mark.asyncio
+    async def test_sql_normalization_matches_python(self, db_session):
+        """Queries are normalized in Python and keywords by the SQL function"""
+        for value in ("  Kompyuter \t  TARMOG`i\n", "shaxsiy  kompyuter", "monitor"):
+            normalized = await db_session.scalar(text("SELECT normalize_search_text(:value)"), {"value": value})
+            assert normalized == normalize_search_text(value), value
+
+    @pytest.mark.asyncio
+    async def test_variants_share_a_cached_page(self, db_session, search_terms, fake_cache):
+        """A spelling variant of a cached query is served without SQL"""
+        first = await TermService.search(db_session, SearchQuery(q="O\u2018zbek tili"))
+        with count_queries(db_session) as counter:
+            second = await TermService.search(db_session, SearchQuery(q="o'zbek  TILI"))
+
+        assert counter["queries"] == 0
+        assert second == first
+        assert first.total == 1
+        assert first.results[0].keyword == "o\u02bbzbek tili"
+
+    @pytest.mark.asyncio
+    async def test_term_write_invalidates_pages(self, db_session, search_terms, test_category, fake_cache):
+        """Creating a term bumps the generation, including cached misses"""
+        assert (await TermService.search(db_session, SearchQuery(q="kompyuter"))).total == 5
+        assert (await TermService.search(db_session, SearchQuery(q="planshet"))).total == 0
+
+        await TermService.create_term(db_session, TermCreate(
+            keyword="planshet kompyuter",
+            category_id=UUID(test_category["id"]),
+            definitions=[DefinitionCreate(language="uz", text="tablet")],
+        ))
+
+        assert (await TermService.search(db_session, SearchQuery(q="kompyuter"))).total == 6
+        assert (await TermService.search(db_session, SearchQuery(q="planshet"))).total == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_result_pages_expire_quickly(self, db_session, search_terms, fake_cache):
+        """Misses are cached, but only for the short empty-page TTL"""
+        page = await TermService.search(db_session, SearchQuery(q="zzzz"))
+        assert page.total == 0 and page.results == []
+
+        with count_queries(db_session) as counter:
+            await TermService.search(db_session, SearchQuery(q="ZZZZ"))
+        assert counter["queries"] == 0
+
+        keys = await fake_cache.keys("terminology:*zzzz")
+        assert len(keys) == 1
+        # TTLs are jittered
+        assert 0 < await fake_cache.ttl(keys[0]) <= SEARCH_EMPTY_TTL * (1 + settings.CACHE_TTL_JITTER)
+
+
+class TestSearchAPI:
+    """Test suite for GET /api/v1/search/"""
+
+    @pytest.mark.asyncio
+    async def test_search_endpoint(self, async_client, search_terms, fake_cache):
+        response = await async_client.get("/api/v1/search/", params={"q": "kompyuter", "limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert [t["keyword"] for t in data["results"]] == ["kompyuter", "kompyuter tarmog'i"]
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_endpoint(self, async_client, search_terms, fake_cache):
+        response = await async_client.get("/api/v1/search/", params={"q": "monitr", "fuzzy": "true"})
+
+        assert response.status_code == 200
+        assert [t["keyword"] for t in response.json()["results"]] == ["monitor"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_root_path(self, async_client, search_terms, fake_cache):
+        response = await async_client.get("/api/v1/", params={"q": "kompyuter", "limit": 2})
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 5
@@ -0,0 +1,143 @@
+"""Tests for the downloadable dictionary snapshot"""
+
+import gzip
+import json
+import os
+import sqlite3
+from uuid import UUID
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from app.core.config import settings
+from app.schemas.terminology import TermCreate, DefinitionCreate
+from app.services.redis_manager import redis_manager
+from app.services.snapshot_service import SnapshotService
+from app.services.term_service import TermService
+
+
+@pytest.fixture
+async def fake_cache(monkeypatch):
+    """Point the global cache at an in-memory fake Redis"""
+    client = fake_aioredis.FakeRedis()
+    monkeypatch.setattr(redis_manager, "binary_redis", client)
+    yield client
+    await client.flushall()
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TERM_SNAPSHOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+async def dictionary(db_session, test_category):
+    """Two terms, one with two definitions"""
+    category_id = UUID(test_category["id"])
+    await TermService.bulk_create_terms(db_session, [
+        TermCreate(keyword="kompyuter", category_id=category_id, definitions=[
+            DefinitionCreate(language="uz", text="Hisoblash mashinasi", example="Kompyuter yoqildi"),
+            DefinitionCreate(language="en", text="Computer"),
+        ]),
+        TermCreate(keyword="algoritm", category_id=category_id, definitions=[
+            DefinitionCreate(language="uz", text="Amallar ketma-ketligi"),
+        ]),
+    ])
+
+
+class TestSnapshotBuild:
+    """Test suite for SnapshotService.build / refresh"""
+
+    @pytest.mark.asyncio
+    async def test_build_writes_both_formats(self, db_session, dictionary, snapshot_dir):
+        manifest = await SnapshotService.build(db_session, generation=7)
+
+        assert (manifest.generation, manifest.categories, manifest.terms, manifest.definitions) == (7, 1, 2, 3)
+        assert SnapshotService.read_manifest() == manifest
+
+        with gzip.open(SnapshotService.file_path(manifest, "jsonl")) as f:
+            records = [json.loads(line) for line in f]
+        assert [r["type"] for r in records] == ["meta", "category", "term", "term"]
+        assert records[0]["generation"] == 7
+        assert records[2]["keyword"] == "algoritm"
+        assert records[3]["category"] == "test-category"
+        assert records[3]["definitions"] == [
+            {"language": "en", "text": "Computer", "example": None},
+            {"language": "uz", "text": "Hisoblash mashinasi", "example": "Kompyuter yoqildi"},
+        ]
+
+        db = sqlite3.connect(SnapshotService.file_path(manifest, "sqlite"))
+        rows = db.execute(
+            "SELECT t.keyword, c.slug, d.language, d.text FROM terms t"
+            " JOIN categories c ON c.id = t.category_id JOIN definitions d ON d.term_id = t.id"
+            " ORDER BY t.keyword, d.language"
+        ).fetchall()
+        assert rows == [
+            ("algoritm", "test-category", "uz", "Amallar ketma-ketligi"),
+            ("kompyuter", "test-category", "en", "Computer"),
+            ("kompyuter", "test-category", "uz", "Hisoblash mashinasi"),
+        ]
+        assert dict(db.execute("SELECT key, value FROM meta"))["generation"] == "7"
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_follows_generation(self, db_session, dictionary, snapshot_dir, fake_cache):
+        first = await SnapshotService.refresh(db=db_session)
+        assert first is not None
+        assert await SnapshotService.refresh(db=db_session) is None
+
+        await TermService.invalidate_search_cache()
+        second = await SnapshotService.refresh(db=db_session)
+
+        assert second.generation == first.generation + 1
+        files = sorted(os.listdir(snapshot_dir))
+        assert files == sorted([".lock", "manifest.json", *(f.name for f in second.files.values())])
+
+
+class TestSnapshotAPI:
+    """Test suite for /api/v1/snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_not_built(self, async_client, snapshot_dir):
+        response = await async_client.get("/api/v1/snapshot/")
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_manifest_and_download(self, async_client, db_session, dictionary, snapshot_dir):
+        manifest = await SnapshotService.build(db_session, generation=1)
+        sqlite_file = manifest.files["sqlite"]
+
+        response = await async_client.get("/api/v1/snapshot/")
+        assert response.status_code == 200
+        assert response.json()["files"]["sqlite"]["url"] == "/api/v1/snapshot/terminology.sqlite"
+
+        response = await async_client.get(sqlite_file.url)
+        assert response.status_code == 200
+        assert response.headers["etag"] == sqlite_file.etag
+        assert response.headers["accept-ranges"] == "bytes"
+        assert len(response.content) == sqlite_file.size
+        content = response.content
+
+        response = await async_client.get(sqlite_file.url, headers={"If-None-Match": sqlite_file.etag})
+        assert response.status_code == 304
+
+        response = await async_client.get(sqlite_file.url, headers={"Range": "bytes=100-"})
+        assert response.status_code == 206
+        assert response.headers["content-range"] == f"bytes 100-{sqlite_file.size - 1}/{sqlite_file.size}"
+        assert response.content == content[100:]
+
+        response = await async_client.get(sqlite_file.url, headers={"Range": "bytes=-10"})
+        assert response.content == content[-10:]
+
+        # A resume against an older version gets the whole new file
+        response = await async_client.get(
+            sqlite_file.url, headers={"Range": "bytes=0-9", "If-Range": '"old"'}
+        )
+        assert response.status_code == 200 and response.content == content
+
+        response = await async_client.get(sqlite_file.url, headers={"Range": f"bytes={sqlite_file.size}-"})
+        assert response.status_code == 416
+
+        response = await async_client.get("/api/v1/snapshot/other.db")
+        assert response.status_code == 404
@@ -0,0 +1,103 @@
+"""Tests for the in-process keyword prefix index"""
+
+from uuid import UUID
+
+import pytest
+
+from app.schemas.terminology import TermCreate, TermUpdate, DefinitionCreate
+from app.services.redis_manager import RedisManager
+from app.services.suggest_index import SuggestIndex, suggest_index
+from app.services.term_service import TermService
+from tests.test_term_cache import count_queries
+
+
+@pytest.fixture
+def index():
+    """Index without Redis (changes stay local)"""
+    index = SuggestIndex(manager=RedisManager(), channel="test:suggest")
+    index.load(["kompyuter", "Kompyuter tarmogʻi", "kompas", "monitor", "klaviatura"])
+    return index
+
+
+@pytest.fixture
+async def live_index(db_session):
+    """The global index, rebuilt from the test database"""
+    await suggest_index.rebuild(db_session)
+    yield suggest_index
+    suggest_index.load([])
+
+
+class TestSuggestIndex:
+    """Test suite for SuggestIndex"""
+
+    def test_prefix_lookup(self, index):
+        assert index.suggest("komp") == ["kompas", "kompyuter", "Kompyuter tarmogʻi"]
+        assert index.suggest("KOMPY", limit=1) == ["kompyuter"]
+        assert index.suggest("x") == []
+        assert index.suggest("  ") == []
+
+    def test_apostrophe_variants(self, index):
+        """Prefixes match regardless of apostrophe spelling"""
+        assert index.suggest("kompyuter tarmog'") == ["Kompyuter tarmogʻi"]
+        assert index.suggest("kompyuter tarmog‘") == ["Kompyuter tarmogʻi"]
+
+    def test_apply_is_idempotent(self, index):
+        index.apply("+", "kompyuter")
+        index.apply("+", "komp")
+        index.apply("+", "komp")
+        assert index.suggest("komp") == ["komp", "kompas", "kompyuter", "Kompyuter tarmogʻi"]
+
+        index.apply("-", "kompas")
+        index.apply("-", "kompas")
+        index.apply("-", "missing")
+        assert index.suggest("komp") == ["komp", "kompyuter", "Kompyuter tarmogʻi"]
+        assert len(index) == 5
+
+    @pytest.mark.asyncio
+    async def test_messages(self, index):
+        await index.handle_message("+kompakt")
+        await index.handle_message("-kompas")
+        assert index.suggest("kompa") == ["kompakt"]
+
+
+class TestSuggestIndexSync:
+    """Term writes keep the global index current"""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_loads_live_terms(self, db_session, test_term, live_index):
+        assert live_index.ready
+        assert live_index.suggest("test_") == ["test_keyword"]
+
+    @pytest.mark.asyncio
+    async def test_term_writes_update_index(self, db_session, test_category, live_index):
+        term = await TermService.create_term(db_session, TermCreate(
+            keyword="algoritm",
+            category_id=UUID(test_category["id"]),
+            definitions=[DefinitionCreate(language="uz", text="algorithm")],
+        ))
+        assert live_index.suggest("algo") == ["algoritm"]
+
+        await TermService.update_term(db_session, term, TermUpdate(keyword="algoritmlar"))
+        assert live_index.suggest("algo") == ["algoritmlar"]
+
+        await TermService.delete_term(db_session, term)
+        assert live_index.suggest("algo") == []
+
+
+class TestSuggestAPI:
+    """Test suite for GET /api/v1/search/suggest"""
+
+    @pytest.mark.asyncio
+    async def test_suggest_without_database(self, async_client, db_session, test_term, live_index):
+        with count_queries(db_session) as counter:
+            response = await async_client.get("/api/v1/search/suggest", params={"q": "TEST"})
+
+        assert response.status_code == 200
+        assert response.json() == {"query": "TEST", "suggestions": ["test_keyword"]}
+        assert counter["queries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_not_ready(self, async_client, monkeypatch):
+        monkeypatch.setattr(suggest_index, "ready", False)
+        response = await async_client.get("/api/v1/search/suggest", params={"q": "a"})
+        assert response.status_code == 503
@@ -0,0 +1,117 @@
+"""Tests for the term detail read-through cache"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from sqlalchemy import event
+
+from app.core.dependencies import get_current_active_user
+from app.main import app
+from app.schemas.terminology import TermCreate, TermUpdate, DefinitionCreate, TermDetailResponse
+from app.services.redis_manager import redis_manager
+from app.services.suggest_index import suggest_index
+from app.services.term_service import TermService
+
+
+@pytest.fixture
+async def fake_cache(monkeypatch):
+    """Point the global cache at an in-memory fake Redis"""
+    client = fake_aioredis.FakeRedis()
+    monkeypatch.setattr(redis_manager, "binary_redis", client)
+    yield client
+    await client.flushall()
+
+
+@contextmanager
+def count_queries(db_session):
+    """Count SQL statements executed on the session's engine"""
+    counter = {"queries": 0}
+    engine = db_session.bind.sync_engine
+
+    def on_execute(*args):
+        counter["queries"] += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+class TestTermDetailCache:
+    """Test suite for TermService.get_detail_by_keyword"""
+
+    @pytest.mark.asyncio
+    async def test_warm_lookup_skips_database(self, db_session, test_term, fake_cache):
+        """A cached term is served without any SQL"""
+        with count_queries(db_session) as cold:
+            first = await TermService.get_detail_by_keyword(db_session, test_term["keyword"])
+        with count_queries(db_session) as warm:
+            second = await TermService.get_detail_by_keyword(db_session, test_term["keyword"])
+
+        assert cold["queries"] > 0
+        assert warm["queries"] == 0
+        assert isinstance(second, TermDetailResponse)
+        assert second == first
+        assert second.creator.email == "test@example.com"
+
+    @pytest.mark.asyncio
+    async def test_missing_term_is_negatively_cached(self, db_session, test_category, fake_cache):
+        """Unknown keywords are cached until a term with that keyword is created"""
+        assert await TermService.get_detail_by_keyword(db_session, "yangi") is None
+        with count_queries(db_session) as counter:
+            assert await TermService.get_detail_by_keyword(db_session, "yangi") is None
+        assert counter["queries"] == 0
+
+        await TermService.create_term(db_session, TermCreate(
+            keyword="yangi",
+            category_id=UUID(test_category["id"]),
+            definitions=[DefinitionCreate(language="uz", text="new")],
+        ))
+
+        term = await TermService.get_detail_by_keyword(db_session, "yangi")
+        assert term is not None
+        assert term.definitions[0].text == "new"
+
+    @pytest.mark.asyncio
+    async def test_rename_invalidates_both_keywords(self, db_session, test_term, fake_cache):
+        """Renaming evicts the old keyword and any cached miss of the new one"""
+        await TermService.get_detail_by_keyword(db_session, "test_keyword")
+        await TermService.get_detail_by_keyword(db_session, "renamed")
+
+        term = await TermService.get_by_id(db_session, UUID(test_term["id"]))
+        await TermService.update_term(db_session, term, TermUpdate(keyword="renamed"))
+
+        assert await TermService.get_detail_by_keyword(db_session, "test_keyword") is None
+        renamed = await TermService.get_detail_by_keyword(db_session, "renamed")
+        assert renamed is not None and renamed.keyword == "renamed"
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, db_session, test_term, fake_cache):
+        """Soft-deleted terms stop being served from the cache"""
+        await TermService.get_detail_by_keyword(db_session, "test_keyword")
+
+        term = await TermService.get_by_id(db_session, UUID(test_term["id"]))
+        await TermService.delete_term(db_session, term)
+
+        assert await TermService.get_detail_by_keyword(db_session, "test_keyword") is None
+
+    @pytest.mark.asyncio
+    async def test_category_delete_invalidates(self, async_client, db_session, test_term, test_user, fake_cache, monkeypatch):
+        """Terms removed with their category stop being served from the cache"""
+        async def skip_rebuild():
+            pass
+        monkeypatch.setattr(suggest_index, "request_rebuild", skip_rebuild)
+        assert await TermService.get_detail_by_keyword(db_session, "test_keyword") is not None
+        term = await TermService.get_by_id(db_session, UUID(test_term["id"]))
+        category_id = term.category_id
+        app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=test_user["id"])
+
+        response = await async_client.delete(f"/api/v1/categories/{category_id}")
+
+        assert response.status_code == 204
+        db_session.expire_all()
+        assert await TermService.get_detail_by_keyword(db_session, "test_keyword") is None
@@ -0,0 +1,113 @@
+"""Tests for the GET /terms/changes delta feed"""
+
+from uuid import UUID
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.terminology import TermCreate, TermUpdate, DefinitionCreate
+from app.services.category_service import CategoryService
+from app.services.term_service import TermService
+
+
+@pytest.fixture(autouse=True)
+def no_settle(monkeypatch):
+    """Serve changes as soon as they are committed"""
+    monkeypatch.setattr(settings, "TERM_CHANGES_SETTLE_SECONDS", 0)
+
+
+@pytest.fixture
+async def terms(db_session, test_category) -> list[str]:
+    """Five terms with one definition each, created in order"""
+    category_id = UUID(test_category["id"])
+    keywords = [f"atama-{i}" for i in range(5)]
+    for keyword in keywords:
+        await TermService.bulk_create_terms(db_session, [
+            TermCreate(keyword=keyword, category_id=category_id, definitions=[
+                DefinitionCreate(language="uz", text=f"{keyword} ta'rifi"),
+            ]),
+        ])
+    return keywords
+
+
+async def read_all(async_client, since=None, limit=2) -> tuple[list[dict], str]:
+    """Follow next_cursor until has_more is false; returns the pages and the last cursor"""
+    pages = []
+    while True:
+        params = {"limit": limit}
+        if since:
+            params["since"] = since
+        response = await async_client.get("/api/v1/terms/changes", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page)
+        since = page["next_cursor"]
+        if not page["has_more"]:
+            return pages, since
+
+
+class TestTermChanges:
+    """Test suite for TermService.get_changes and GET /api/v1/terms/changes"""
+
+    @pytest.mark.asyncio
+    async def test_pages_in_change_order(self, async_client, terms):
+        pages, cursor = await read_all(async_client)
+
+        assert [len(p["upserts"]) for p in pages] == [2, 2, 1]
+        upserts = [u for p in pages for u in p["upserts"]]
+        assert [u["keyword"] for u in upserts] == terms
+        assert upserts[0]["category"] == "test-category"
+        assert upserts[0]["definitions"] == [
+            {"language": "uz", "text": "atama-0 ta'rifi", "example": None}
+        ]
+
+        # Nothing new: the same cursor comes back
+        pages, again = await read_all(async_client, since=cursor)
+        assert pages == [{"upserts": [], "deletes": [], "next_cursor": cursor, "has_more": False}]
+
+    @pytest.mark.asyncio
+    async def test_updates_and_deletes_after_cursor(self, async_client, db_session, terms):
+        _, cursor = await read_all(async_client)
+
+        term = await TermService.get_by_keyword(db_session, "atama-1")
+        await TermService.update_term(db_session, term, TermUpdate(keyword="atama-bir"))
+        results = await TermService.bulk_delete_terms(db_session, [
+            (await TermService.get_by_keyword(db_session, "atama-3")).id
+        ])
+        assert results[0].success
+
+        pages, _ = await read_all(async_client, since=cursor)
+        upserts = [u["keyword"] for p in pages for u in p["upserts"]]
+        deletes = [d for p in pages for d in p["deletes"]]
+        assert upserts == ["atama-bir"]
+        assert [d["keyword"] for d in deletes] == ["atama-3"]
+        assert deletes[0]["deleted_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_category_delete_leaves_tombstones(self, async_client, db_session, terms, test_category):
+        _, cursor = await read_all(async_client)
+
+        category = await CategoryService.get_by_id(db_session, UUID(test_category["id"]))
+        assert sorted(await CategoryService.delete_category(db_session, category)) == terms
+        await db_session.commit()
+
+        pages, cursor = await read_all(async_client, since=cursor)
+        assert [u for p in pages for u in p["upserts"]] == []
+        assert sorted(d["keyword"] for p in pages for d in p["deletes"]) == terms
+
+        # Read once, like any other change
+        pages, _ = await read_all(async_client, since=cursor)
+        assert pages[0]["deletes"] == []
+
+    @pytest.mark.asyncio
+    async def test_recent_changes_held_back(self, db_session, terms, monkeypatch):
+        monkeypatch.setattr(settings, "TERM_CHANGES_SETTLE_SECONDS", 3600)
+
+        page = await TermService.get_changes(db_session)
+
+        assert page.upserts == [] and page.next_cursor is None and not page.has_more
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, async_client):
+        response = await async_client.get("/api/v1/terms/changes", params={"since": "not-a-cursor"})
+        assert response.status_code == 400
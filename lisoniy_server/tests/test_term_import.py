@@ -0,0 +1,237 @@
+"""Tests for the streaming CSV/JSONL/TBX term importer"""
+
+import asyncio
+import gzip
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.dependencies import get_current_active_user
+from app.main import app
+from app.models.terminology import Definition, Term, TermAuditLog
+from app.services import term_import_service
+from app.services.term_import_service import ImportRowError, TermImportService
+
+
+TBX = """<?xml version="1.0" encoding="UTF-8"?>
+<martif type="TBX" xml:lang="en">
+  <text><body>
+    <termEntry id="1">
+      <descrip type="subjectField">test-category</descrip>
+      <langSet xml:lang="uz">
+        <tig><term>tarmoq</term></tig>
+        <descrip type="definition">Kompyuterlar tarmog'i</descrip>
+      </langSet>
+      <langSet xml:lang="en-US"><tig><term>network</term></tig></langSet>
+      <langSet xml:lang="ru"><tig><term>сеть</term></tig><tig><term>сетка</term></tig></langSet>
+    </termEntry>
+    <termEntry id="2">
+      <langSet xml:lang="en"><tig><term>orphan</term></tig></langSet>
+    </termEntry>
+  </body></text>
+</martif>
+"""
+
+TBX3 = """<?xml version="1.0"?>
+<tbx xmlns="urn:iso:std:iso:30042:ed-2" xml:lang="en">
+  <text><body>
+    <conceptEntry id="c1">
+      <langSec xml:lang="uz">
+        <termSec><term>server</term></termSec>
+        <descripGrp><descrip type="definition">Xizmat ko'rsatuvchi kompyuter</descrip></descripGrp>
+      </langSec>
+    </conceptEntry>
+  </body></text>
+</tbx>
+"""
+
+
+def parse(data: str, format: str, **options) -> list:
+    return list(TermImportService.parse(io.BytesIO(data.encode()), format, **options))
+
+
+@pytest.fixture
+def import_file(tmp_path):
+    """Write import file content and return its path"""
+    def write(name: str, content: str, compress: bool = False) -> str:
+        path = tmp_path / name
+        data = content.encode()
+        path.write_bytes(gzip.compress(data) if compress else data)
+        return str(path)
+    return write
+
+
+class TestParsers:
+    """Test suite for the incremental file parsers"""
+
+    def test_csv(self):
+        rows = parse(
+            "keyword,category,language,definition,example\n"
+            "kompyuter,it,uz,Hisoblash mashinasi,\n"
+            "kompyuter,it,en,Computer,A computer\n"
+            ",it,uz,No keyword,\n"
+            "\"ko'p\nqatorli\",it,uzb,Bad language,\n",
+            "csv",
+        )
+
+        assert rows[0] == (2, "kompyuter", "it", "uz", "Hisoblash mashinasi", None)
+        assert rows[1] == (3, "kompyuter", "it", "en", "Computer", "A computer")
+        assert isinstance(rows[2], ImportRowError) and rows[2].line == 4
+        assert isinstance(rows[3], ImportRowError) and "language" in str(rows[3])
+
+    def test_csv_defaults_and_header(self):
+        rows = parse("Keyword,Text\nfayl,File\n", "csv", default_category="it", source_language="en")
+        assert rows == [(2, "fayl", "it", "en", "File", None)]
+
+        with pytest.raises(ValueError):
+            parse("word,meaning\nfayl,File\n", "csv")
+
+    def test_jsonl(self):
+        rows = parse(
+            json.dumps({"keyword": "disk", "category": "it", "definitions": [
+                {"language": "uz", "text": "Disk"},
+                {"language": "en", "text": "Disk", "example": "hard disk"},
+            ]}) + "\n\n"
+            + json.dumps({"keyword": "fayl", "language": "uz", "text": "Fayl"}) + "\n"
+            + "{not json\n"
+            + "[1, 2]\n",
+            "jsonl",
+            default_category="it",
+        )
+
+        assert rows[:3] == [
+            (1, "disk", "it", "uz", "Disk", None),
+            (1, "disk", "it", "en", "Disk", "hard disk"),
+            (3, "fayl", "it", "uz", "Fayl", None),
+        ]
+        assert [e.line for e in rows[3:]] == [4, 5]
+
+    def test_tbx(self):
+        rows = parse(TBX, "tbx")
+
+        assert rows[:3] == [
+            (1, "tarmoq", "test-category", "uz", "Kompyuterlar tarmog'i", None),
+            (1, "tarmoq", "test-category", "en", "network", None),
+            (1, "tarmoq", "test-category", "ru", "сеть, сетка", None),
+        ]
+        assert isinstance(rows[3], ImportRowError) and rows[3].line == 2
+
+    def test_tbx3_namespaced(self):
+        assert parse(TBX3, "tbx", default_category="it") == [
+            (1, "server", "it", "uz", "Xizmat ko'rsatuvchi kompyuter", None)
+        ]
+
+    def test_gzip_and_format_detection(self, import_file):
+        path = import_file("terms.csv.gz", "keyword,definition\nfayl,Fayl\n", compress=True)
+
+        format = TermImportService.jobs.detect_format("terms.csv.gz")
+        with TermImportService.open_source(path) as stream:
+            rows = list(TermImportService.parse(stream, format, default_category="it"))
+
+        assert format == "csv"
+        assert rows == [(2, "fayl", "it", "uz", "Fayl", None)]
+        assert TermImportService.jobs.detect_format("terms.txt", "TBX") == "tbx"
+        with pytest.raises(ValueError):
+            TermImportService.jobs.detect_format("terms.txt")
+
+
+class TestRunImport:
+    """Test suite for TermImportService.run_import"""
+
+    @pytest.mark.asyncio
+    async def test_stages_and_merges(self, db_session, test_term, test_category, test_user, import_file, monkeypatch):
+        monkeypatch.setattr(term_import_service.settings, "TERM_IMPORT_COPY_BATCH", 3)
+        monkeypatch.setattr(term_import_service.settings, "TERM_IMPORT_MERGE_CHUNK", 2)
+        path = import_file("terms.csv", (
+            "keyword,category,language,definition\n"
+            "algoritm,test-category,uz,Algoritm\n"
+            "algoritm,test-category,en,Algorithm\n"
+            "algoritm,test-category,en,Duplicate language\n"
+            "baza,test-category,uz,Ma'lumotlar bazasi\n"
+            "test_keyword,test-category,uz,Already exists\n"
+            "yetim,missing,uz,Unknown category\n"
+            "xato,test-category,,\n"
+        ))
+        job = await TermImportService.jobs.create_job(format="csv", filename="terms.csv", user_id=test_user["id"])
+
+        async with db_session.bind.connect() as conn:
+            job = await TermImportService.run_import(conn, job, path)
+
+        assert job.status == "completed"
+        assert (job.rows_parsed, job.rows_staged, job.rows_rejected) == (7, 6, 2)
+        assert (job.keywords_merged, job.terms_created, job.terms_skipped) == (4, 2, 2)
+        assert job.definitions_created == 3
+        assert job.rows_per_second > 0
+        # Parse errors are found while staging, unknown categories before merging
+        assert [e.line for e in job.errors] == [8, 7]
+        assert "'missing' not found" in job.errors[1].message
+
+        term = await db_session.scalar(select(Term).where(Term.keyword == "algoritm"))
+        assert term.creator_id == test_user["id"]
+        definitions = await db_session.execute(
+            select(Definition.language, Definition.text).where(Definition.term_id == term.id)
+            .order_by(Definition.language)
+        )
+        assert definitions.all() == [("en", "Algorithm"), ("uz", "Algoritm")]
+        audit = await db_session.scalar(select(TermAuditLog).where(TermAuditLog.term_id == term.id))
+        assert json.loads(audit.changes)["definitions_count"] == 2
+        assert await TermImportService.jobs.get_job(job.id) == job
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_imports_nothing(self, db_session, test_category, import_file):
+        path = import_file("terms.tbx", TBX.replace("</martif>", ""))
+        job = await TermImportService.jobs.create_job(format="tbx", filename="terms.tbx", user_id=None)
+
+        with pytest.raises(Exception):
+            async with db_session.bind.connect() as conn:
+                await TermImportService.run_import(conn, job, path)
+
+        count = await db_session.scalar(select(func.count()).select_from(Term))
+        assert count == 0
+
+
+class TestImportAPI:
+    """Test suite for POST /api/v1/terms/import"""
+
+    @pytest.mark.asyncio
+    async def test_import_job(self, async_client, db_session, test_user, test_category, monkeypatch):
+        monkeypatch.setattr(term_import_service, "engine", db_session.bind)
+        app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=test_user["id"])
+        content = "\n".join(
+            json.dumps({"keyword": f"atama{i}", "definitions": [{"language": "uz", "text": f"Atama {i}"}]})
+            for i in range(50)
+        )
+
+        response = await async_client.post(
+            "/api/v1/terms/import",
+            params={"category": "test-category"},
+            files={"file": ("terms.jsonl", content.encode(), "application/x-ndjson")},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        for _ in range(100):
+            response = await async_client.get(f"/api/v1/terms/import/{job_id}")
+            if response.json()["status"] not in ("queued", "running"):
+                break
+            await asyncio.sleep(0.05)
+
+        job = response.json()
+        assert job["status"] == "completed"
+        assert job["terms_created"] == 50
+
+        app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=test_user["id"] + 1)
+        response = await async_client.get(f"/api/v1/terms/import/{job_id}")
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_unknown_format(self, async_client, test_user):
+        app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=test_user["id"])
+        response = await async_client.post(
+            "/api/v1/terms/import",
+            files={"file": ("terms.txt", b"kompyuter", "text/plain")},
+        )
+        assert response.status_code == 400